@@ -0,0 +1,156 @@
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+import numpy as np
+import soundfile
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from audio_slicer.utils.encoder import ffmpeg_encode_bytes, shared_encoder_pool
+from audio_slicer.utils.processing import compute_spectral_features, resolve_ffmpeg_path
+from audio_slicer.utils.slicer2 import (FAST_ANALYSIS_BLOCK_MS, Slicer, build_spectral_vad_mask, build_vad_mask,
+                                       get_rms, get_rms_decimated, rms_block_length, rms_to_db)
+
+
+def synthetic_speech(seconds: float, sr: int, seed: int = 0) -> np.ndarray:
+    """Harmonic bursts over 50 Hz hum and broadband noise, a rough stand-in for speech in a noisy room."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sr)) / sr
+    hum = 0.05 * np.sin(2 * np.pi * 50 * t)
+    noise = 0.01 * rng.standard_normal(t.shape[0])
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sr
+    voice = sum(np.sin(k * phase) / k for k in range(1, 16))
+    # Two seconds on, one second off.
+    gate = (t % 3.0) < 2.0
+    return (hum + noise + 0.1 * voice * gate).astype(np.float32)
+
+
+def bench_rms_vad(samples: np.ndarray, sr: int, slicer: Slicer):
+    rms_list = slicer.get_rms_list(samples)
+    build_vad_mask(rms_list, threshold_db=slicer.threshold_db, hangover_frames=12)
+
+
+def bench_exact_rms(samples: np.ndarray, sr: int, slicer: Slicer):
+    get_rms(samples, frame_length=slicer.win_size, hop_length=slicer.hop_size)
+
+
+def bench_decimated_rms(samples: np.ndarray, sr: int, slicer: Slicer):
+    get_rms_decimated(samples, frame_length=slicer.win_size, hop_length=slicer.hop_size,
+                      block_length=rms_block_length(sr, slicer.hop_size, slicer.win_size))
+
+
+# Error bounds stated by ``get_rms_decimated``, checked on the synthetic signal.
+ALIGNED_MAX_ERROR_DB = 0.01
+SNAPPED_MAX_ERROR_DB = 1.5
+
+
+def is_aligned(block_length: int, slicer: Slicer) -> bool:
+    return all(length % block_length == 0 for length in (slicer.hop_size, slicer.win_size, slicer.win_size // 2))
+
+
+def decimation_error(samples: np.ndarray, slicer: Slicer, block_length: int, floor_db: float = -90.0) -> float:
+    """Largest dB difference between the decimated and the exact envelope over frames above ``floor_db``."""
+    exact = rms_to_db(get_rms(samples, frame_length=slicer.win_size, hop_length=slicer.hop_size)[0])
+    decimated = rms_to_db(get_rms_decimated(samples, frame_length=slicer.win_size, hop_length=slicer.hop_size,
+                                            block_length=block_length)[0])
+    audible = np.maximum(exact, decimated) > floor_db
+    return float(np.abs(exact - decimated)[audible].max(initial=0.0))
+
+
+def bench_spectral_vad(samples: np.ndarray, sr: int, slicer: Slicer):
+    level_db, flatness = compute_spectral_features(slicer, samples, sr)
+    build_spectral_vad_mask(level_db, flatness, threshold_db=slicer.threshold_db, hangover_frames=12)
+
+
+def slice_chunks(samples: np.ndarray, slicer: Slicer) -> list[np.ndarray]:
+    sil_tags, total_frames, _ = slicer.get_slice_tags(samples)
+    return slicer.slice(samples, sil_tags, total_frames)
+
+
+def bench_serial_encode(samples: np.ndarray, sr: int, slicer: Slicer):
+    ffmpeg_path = resolve_ffmpeg_path()
+    for chunk in slice_chunks(samples, slicer):
+        ffmpeg_encode_bytes(chunk, sr, "opus", ffmpeg_path)
+
+
+def bench_pooled_encode(samples: np.ndarray, sr: int, slicer: Slicer):
+    ffmpeg_path = resolve_ffmpeg_path()
+    pool = shared_encoder_pool()
+    futures = [pool.submit_bytes(chunk, sr, "opus", ffmpeg_path) for chunk in slice_chunks(samples, slicer)]
+    for future in futures:
+        future.result()
+
+
+BENCHMARKS = {
+    "exact_rms": bench_exact_rms,
+    "decimated_rms": bench_decimated_rms,
+    "rms_vad": bench_rms_vad,
+    "spectral_vad": bench_spectral_vad,
+    "serial_encode": bench_serial_encode,
+    "pooled_encode": bench_pooled_encode,
+}
+# Benchmarks that run one ffmpeg process per slice (opus), like shard and file output.
+ENCODE_BENCHMARKS = {"serial_encode", "pooled_encode"}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(
+        description="Time the analysis stages on one core and report them as multiples of realtime.")
+    parser.add_argument("file", nargs="?", help="Audio file to analyse. Defaults to synthetic noisy speech.")
+    parser.add_argument("--seconds", type=float, default=600, help="Length of the synthetic signal.")
+    parser.add_argument("--sr", type=int, default=44100, help="Sample rate of the synthetic signal.")
+    parser.add_argument("--hop-size", type=int, default=10, help="Hop size in ms.")
+    parser.add_argument("--min-interval", type=int, default=300,
+                        help="Minimum interval in ms; below four hops it sets the RMS window.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the fastest is reported.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run.")
+    args = parser.parse_args(argv)
+
+    if args.file:
+        audio, sr = soundfile.read(args.file, dtype="float32")
+        samples = audio.mean(axis=1) if audio.ndim > 1 else audio
+    else:
+        sr = args.sr
+        samples = synthetic_speech(args.seconds, sr)
+    duration = samples.shape[0] / sr
+    slicer = Slicer(sr=sr, threshold=-40, min_length=5000, min_interval=args.min_interval, hop_size=args.hop_size,
+                    max_sil_kept=1000)
+    print(f"{duration:.1f} s at {sr} Hz, hop {slicer.hop_size} samples, window {slicer.win_size} samples")
+    slice_count = len(slice_chunks(samples, slicer))
+    for name in args.only or BENCHMARKS:
+        if name in ENCODE_BENCHMARKS and resolve_ffmpeg_path() is None:
+            print(f"{name:>14}: skipped, ffmpeg not found")
+            continue
+        best = float("inf")
+        for _ in range(max(1, args.repeat)):
+            start = time.perf_counter()
+            BENCHMARKS[name](samples, sr, slicer)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:>14}: {best:8.3f} s  {duration / best:8.0f}x realtime")
+        if name in ENCODE_BENCHMARKS:
+            print(f"{'':>14}  {best / max(1, slice_count) * 1000:8.1f} ms per slice over {slice_count} slices")
+    failed = False
+    if args.only is None or "decimated_rms" in args.only:
+        chosen = rms_block_length(sr, slicer.hop_size, slicer.win_size)
+        plain = max(1, round(sr * FAST_ANALYSIS_BLOCK_MS / 1000))
+        errors = {block: decimation_error(samples, slicer, block) for block in (chosen, plain)}
+        print(f"decimated RMS, max error above -90 dB: {errors[chosen]:.3f} dB "
+              f"with {chosen}-sample blocks, {errors[plain]:.3f} dB with plain {plain}-sample blocks")
+        # Files may have hard onsets, which the bounds exclude; only the synthetic signal is checked.
+        if not args.file:
+            for block, error in errors.items():
+                bound = ALIGNED_MAX_ERROR_DB if is_aligned(block, slicer) else SNAPPED_MAX_ERROR_DB
+                if error > bound:
+                    print(f"FAILED: {error:.3f} dB with {block}-sample blocks exceeds the {bound} dB bound")
+                    failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
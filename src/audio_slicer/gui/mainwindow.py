@@ -1,44 +1,54 @@
+import functools
 import json
+import multiprocessing
 import os
-import subprocess
-import tempfile
+import queue
+import signal
+import threading
 
 import soundfile
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, ProcessPoolExecutor, wait
 
 from typing import List
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 from PySide6.QtGui import *
-from audio_slicer.utils.slicer2 import Slicer, estimate_dynamic_threshold_db, build_vad_mask, get_rms
-from audio_slicer.utils.processing import process_audio_file, resolve_ffmpeg_path
+from audio_slicer.utils.processing import (decode_audio, process_audio_file, read_audio_with_progress,
+                                          resolve_ffmpeg_path)
 
 from audio_slicer.gui.Ui_MainWindow import Ui_MainWindow
-from audio_slicer.utils.preview import SlicingPreview
+from audio_slicer.gui.progress import ErrorLogModel, RunProgress
+from audio_slicer.gui.tasklist import TaskListModel, TaskScanner
+from audio_slicer.gui.waveform import PreviewWidget
+from audio_slicer.gui.workers import BackgroundTask
+from audio_slicer.utils.cache import AnalysisCache
+from audio_slicer.utils.encoder import FFMPEG_CODECS, encoder_workers
+from audio_slicer.utils.manifest import ManifestWriter, default_manifest_path
+from audio_slicer.utils.preview import AnalysisOverlay, PeakEnvelope, PreviewAnalysis
+from audio_slicer.utils.recommend import recommend_for_audio, recommend_for_corpus, recommend_for_file_excerpts
+from audio_slicer.utils.report import generate_report
+from audio_slicer.utils.tuning import cached_envelope, decoded_envelope, tune_parameters
 from audio_slicer.modules import i18n
 
 APP_VERSION = "1.5.0"
 
 
-class _FallbackBridge(QObject):
-    request = Signal(str, str)
+# Cancel flag of the run a process worker belongs to, set by ``_register_process_worker``.
+_worker_cancel = None
 
-    def __init__(self, window: "MainWindow"):
-        super().__init__()
-        self.window = window
-        self.mutex = QMutex()
-        self.cond = QWaitCondition()
-        self.choice: str | None = None
-        self.request.connect(self._on_request)
 
-    @Slot(str, str)
-    def _on_request(self, filename: str, error: str):
-        choice = self.window._show_fallback_dialog("process_read_failed", filename, error)
-        self.mutex.lock()
-        self.choice = choice
-        self.cond.wakeAll()
-        self.mutex.unlock()
+def _register_process_worker(pid_queue, cancel_event):
+    # Pool initializer: tells the run which processes to terminate on a hard
+    # cancel and keeps the run's cancel flag, which is inherited, not pickled.
+    global _worker_cancel
+    _worker_cancel = cancel_event
+    pid_queue.put(os.getpid())
+
+
+def _worker_cancelled() -> bool:
+    # Module level so that it can be pickled into process workers.
+    return _worker_cancel is not None and _worker_cancel.is_set()
 
 
 class MainWindow(QMainWindow):
@@ -49,6 +59,8 @@ class MainWindow(QMainWindow):
         self.ui.setupUi(self)
 
         self.ui.btnAddFiles.clicked.connect(self._on_add_audio_files)
+        self._init_task_list()
+        self.ui.btnAddFolder.clicked.connect(self._on_add_audio_folder)
         self.ui.btnBrowse.clicked.connect(self._on_browse_output_dir)
         self.ui.btnRemove.clicked.connect(self._on_remove_audio_file)
         self.ui.btnClearList.clicked.connect(self._on_clear_audio_list)
@@ -79,8 +91,6 @@ class MainWindow(QMainWindow):
         self.ui.leHopSize.setValidator(validator)
         self.ui.leMaxSilence.setValidator(validator)
 
-        self.ui.lwTaskList.setAlternatingRowColors(True)
-
         # State variables
         self.workers: list[QThread] = []
         self.workCount = 0
@@ -92,20 +102,28 @@ class MainWindow(QMainWindow):
         self.current_language = i18n.normalize_language(QLocale.system().name())
         self._preview_embed = False
         self._preview_window: QDialog | None = None
-        self._preview_label: QLabel | None = None
+        self._preview_widget: PreviewWidget | None = None
         self._preview_zoom_label: QLabel | None = None
         self._preview_zoom_value: QLabel | None = None
         self._preview_zoom_slider: QSlider | None = None
-        self._preview_original_pixmap: QPixmap | None = None
-        self._preview_scroll_viewport: QWidget | None = None
-        self._preview_pixmap_path: str | None = None
+        self._preview_envelope: PeakEnvelope | None = None
+        self._preview_analysis: PreviewAnalysis | None = None
+        self._live_pool = QThreadPool(self)
+        self._live_pool.setMaxThreadCount(1)
+        self._live_task: BackgroundTask | None = None
+        self._live_task_id = 0
+        self._live_timer = QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(60)
+        self._live_timer.timeout.connect(self._start_live_reslice)
+        self._analysis_task: BackgroundTask | None = None
+        self._analysis_task_id = 0
+        self._analysis_progress: QProgressDialog | None = None
         self._style_sheet: str | None = None
         self._init_language_selector()
         self._init_extra_ui()
         self._load_presets()
         self._apply_language()
-        self._fallback_bridge = _FallbackBridge(self)
-        self._fallback_request_lock = QMutex()
 
         # Must set to accept drag and drop events
         self.setAcceptDrops(True)
@@ -142,19 +160,50 @@ class MainWindow(QMainWindow):
             ".",
             f"Audio ({self.formatAllFilter});;{self.formatIndividualFilter}",
         )
-        for path in paths:
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(200, 24))
-            item.setText(QFileInfo(path).fileName())
-            # Save full path at custom role
-            item.setData(Qt.ItemDataRole.UserRole + 1, path)
-            self.ui.lwTaskList.addItem(item)
+        self.task_model.add_paths(paths)
+
+    def _on_add_audio_folder(self):
+        if self.processing:
+            self._warningProcessNotFinished()
+            return
+
+        path = QFileDialog.getExistingDirectory(
+            self,
+            i18n.text("select_audio_folder", self.current_language),
+            ".",
+        )
+        if path:
+            self._scan_task_paths([path])
+
+    def _scan_task_paths(self, paths: list[str]):
+        scanner = TaskScanner(paths, set(self.availableFormats), self)
+        scanner.found.connect(self.task_model.add_paths)
+        scanner.finished.connect(self._on_task_scan_finished)
+        self._task_scanners.append(scanner)
+        scanner.start()
+
+    def _on_task_scan_finished(self):
+        self._task_scanners = [scanner for scanner in self._task_scanners if not scanner.isFinished()]
+
+    def _cancel_task_scans(self):
+        for scanner in self._task_scanners:
+            scanner.cancel()
+            scanner.found.disconnect()
+            scanner.wait()
+        self._task_scanners.clear()
+
+    def _current_task_path(self) -> str | None:
+        index = self.ui.lvTaskList.currentIndex()
+        return self.task_model.path(index.row()) if index.isValid() else None
 
     def _on_remove_audio_file(self):
-        item = self.ui.lwTaskList.currentItem()
-        if item is None:
+        if self.processing:
+            self._warningProcessNotFinished()
+            return
+        index = self.ui.lvTaskList.currentIndex()
+        if not index.isValid():
             return
-        self.ui.lwTaskList.takeItem(self.ui.lwTaskList.row(item))
+        self.task_model.remove_row(index.row())
         return
 
     def _on_clear_audio_list(self):
@@ -162,7 +211,8 @@ class MainWindow(QMainWindow):
             self._warningProcessNotFinished()
             return
 
-        self.ui.lwTaskList.clear()
+        self._cancel_task_scans()
+        self.task_model.clear()
 
     def _on_about(self):
         language_label = i18n.LANGUAGES.get(self.current_language, self.current_language)
@@ -177,19 +227,26 @@ class MainWindow(QMainWindow):
 
     def _on_start(self):
         if self.processing:
-            self._warningProcessNotFinished()
+            self._cancel_processing()
             return
 
-        item_count = self.ui.lwTaskList.count()
+        item_count = self.task_model.rowCount()
         if item_count == 0:
             return
 
         output_format = self._get_output_format()
-        if output_format == "mp3":
+        if output_format in FFMPEG_CODECS:
+            if output_format != "mp3" and resolve_ffmpeg_path() is None:
+                QMessageBox.warning(
+                    self,
+                    i18n.text("warning_title", self.current_language),
+                    i18n.text("ffmpeg_not_found", self.current_language),
+                )
+                return
             ret = QMessageBox.warning(
                 self,
                 i18n.text("warning_title", self.current_language),
-                i18n.text("mp3_warning", self.current_language),
+                i18n.text("lossy_warning", self.current_language).format(format=output_format.upper()),
                 QMessageBox.Ok | QMessageBox.Cancel,
                 QMessageBox.Cancel,
             )
@@ -197,21 +254,10 @@ class MainWindow(QMainWindow):
                 return
 
         options = self._collect_processing_options()
-        if options["parallel_mode"] == "process" and options["fallback_mode"] == "ask":
-            ret = QMessageBox.warning(
-                self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("parallel_process_fallback_hint", self.current_language),
-                QMessageBox.Ok | QMessageBox.Cancel,
-                QMessageBox.Ok,
-            )
-            if ret == QMessageBox.Cancel:
-                return
-            options["fallback_mode"] = "ffmpeg_then_librosa"
 
         class WorkThread(QThread):
-            oneFinished = Signal()
-            errorOccurred = Signal(str, str)
+            fallbackNeeded = Signal(list)
+            deferredChanged = Signal(int)
 
             def __init__(self, filenames: List[str], window: MainWindow, output_ext: str, options: dict):
                 super().__init__()
@@ -220,127 +266,240 @@ class MainWindow(QMainWindow):
                 self.win = window
                 self.output_ext = output_ext
                 self.options = options
+                # Polled by the window on a timer, see _poll_progress.
+                self.progress = RunProgress()
+                self.cancel_requested = False
+                self._cancel_event = threading.Event()
+                self._hard_cancel = threading.Event()
+                # Process workers only share this flag with the run; their
+                # progress comes back through the futures, see _run_processes.
+                self._remote_cancel = None
+                # PIDs of the process workers, sent by ``_register_process_worker``.
+                self._worker_pid_queue = None
+                self._worker_pids: set[int] = set()
+                self._prompt_requested = threading.Event()
+                self._fallback_choices = queue.SimpleQueue()
+
+            def request_fallback_prompt(self):
+                """Ask for the decoder of the deferred files now instead of at the end."""
+                self._prompt_requested.set()
+
+            def resolve_fallback(self, choice: str):
+                self._fallback_choices.put(choice)
+
+            def cancel(self, hard: bool = False):
+                """Stop after the current stage of each running file; ``hard`` also kills process workers."""
+                self.cancel_requested = True
+                self._cancel_event.set()
+                if hard:
+                    self._hard_cancel.set()
+                remote_cancel = self._remote_cancel
+                if remote_cancel is not None:
+                    try:
+                        remote_cancel.set()
+                    except Exception:
+                        pass
 
             def run(self):
+                self.manifest = None
+                if self.options["export_manifest"] and self.filenames:
+                    directory = self.options["output_dir"] or os.path.dirname(os.path.abspath(self.filenames[0]))
+                    path = default_manifest_path(directory)
+                    try:
+                        self.manifest = ManifestWriter(path)
+                    except Exception as exc:
+                        self.progress.add_error(path, str(exc))
+                        self.options = {**self.options, "export_manifest": False}
+                try:
+                    self._run_files()
+                finally:
+                    if self.manifest is not None:
+                        self.manifest.close()
+
+            def _add_to_manifest(self, records: list[dict] | None):
+                # Only called from this thread, so the manifest needs no lock.
+                if self.manifest is not None and records:
+                    self.manifest.write(records)
+
+            def _run_files(self):
                 mode = self.options["parallel_mode"]
-                if mode == "single":
-                    for filename in self.filenames:
-                        try:
-                            self._process_file(filename)
-                        finally:
-                            self.oneFinished.emit()
+                if mode == "process":
+                    self._run_processes()
                     return
-                if mode == "thread":
-                    with ThreadPoolExecutor(max_workers=self.options["parallel_jobs"]) as executor:
-                        futures = {
-                            executor.submit(self._process_file, filename): filename
-                            for filename in self.filenames
-                        }
-                        for future in as_completed(futures):
-                            filename = futures[future]
+                # "single" goes through the same loop with one worker, so that
+                # cancellation and deferred fallbacks behave the same in every mode.
+                workers = 1 if mode == "single" else self.options["parallel_jobs"]
+                self._run_executor(ThreadPoolExecutor(max_workers=workers))
+
+            def _run_processes(self):
+                """Run the files on a process pool.
+
+                Workers report no stages: a file shows as running once its
+                future does and as finished with its result, so a run costs no
+                round trip per event. The cancel flag is a plain
+                ``multiprocessing.Event`` the workers inherit.
+                """
+                self._remote_cancel = multiprocessing.Event()
+                if self._cancel_event.is_set():
+                    self._remote_cancel.set()
+                self._worker_pid_queue = multiprocessing.SimpleQueue()
+                try:
+                    self._run_executor(ProcessPoolExecutor(
+                        max_workers=self.options["parallel_jobs"],
+                        initializer=_register_process_worker,
+                        initargs=(self._worker_pid_queue, self._remote_cancel),
+                    ))
+                finally:
+                    self._worker_pid_queue = None
+                    self._remote_cancel = None
+
+            def _submit(self, executor, filename: str, fallback_mode: str | None = None):
+                if isinstance(executor, ProcessPoolExecutor):
+                    callbacks = {"is_cancelled": _worker_cancelled}
+                else:
+                    callbacks = {
+                        "is_cancelled": self._cancel_event.is_set,
+                        "report_status": functools.partial(self.progress.set_status, filename),
+                    }
+                return executor.submit(
+                    process_audio_file,
+                    filename,
+                    **self._build_process_kwargs(fallback_mode, **callbacks),
+                )
+
+            def _run_executor(self, executor):
+                """Run all files on ``executor`` and collect the results in this thread.
+
+                Polls instead of blocking in ``as_completed`` so that queued
+                files can be dropped as soon as a cancel is requested, and a
+                hard cancel can terminate process workers mid-file.
+
+                With the "ask" fallback the first attempt uses no fallback
+                decoder. Files that fail are deferred instead of holding a
+                worker on a dialog; once the queue runs dry, or when the user
+                asks for it, one ``fallbackNeeded`` prompt covers all of them
+                and the chosen decoder re-runs them on the same executor.
+                """
+                ask = self.options["fallback_mode"] == "ask"
+                futures = {
+                    self._submit(executor, filename, "skip" if ask else None): (filename, ask)
+                    for filename in self.filenames
+                }
+                pending = set(futures)
+                # Process workers report no stages; their futures are marked running here.
+                coarse = isinstance(executor, ProcessPoolExecutor)
+                running = set()
+                deferred: dict[str, str] = {}
+                prompted: list[str] | None = None
+                try:
+                    while pending or deferred:
+                        done = set()
+                        if pending:
+                            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                        if coarse:
+                            for future in pending - running:
+                                if future.running():
+                                    running.add(future)
+                                    self.progress.set_status(futures[future][0], "running")
+                            running -= done
+                        for future in done:
+                            filename, deferrable = futures.pop(future)
+                            if future.cancelled():
+                                continue
                             try:
-                                future.result()
+                                ok, error, out_dir, records = future.result()
                             except Exception as exc:
-                                self.errorOccurred.emit(filename, str(exc))
-                            finally:
-                                self.oneFinished.emit()
-                    return
-                with ProcessPoolExecutor(max_workers=self.options["parallel_jobs"]) as executor:
-                    futures = {
-                        executor.submit(
-                            process_audio_file,
-                            filename,
-                            **self._build_process_kwargs(),
-                        ): filename
-                        for filename in self.filenames
-                    }
-                    for future in as_completed(futures):
-                        filename = futures[future]
+                                ok, error, out_dir, records = False, str(exc), None, None
+                            if deferrable and not ok and not self._cancel_event.is_set():
+                                deferred[filename] = error or "Unknown error."
+                                self.progress.set_status(filename, "deferred")
+                                self.deferredChanged.emit(len(deferred))
+                                continue
+                            self._add_to_manifest(self._finish_file(filename, ok, error, records))
+                            self.progress.file_finished(out_dir if ok else None)
+
+                        if self._cancel_event.is_set():
+                            self._cancel_pending(executor, futures, pending)
+                            for filename in deferred:
+                                self.progress.set_status(filename, "cancelled")
+                                self.progress.file_finished()
+                            deferred.clear()
+                            self.deferredChanged.emit(0)
+                            continue
+
+                        if deferred and prompted is None and (not pending or self._prompt_requested.is_set()):
+                            self._prompt_requested.clear()
+                            prompted = list(deferred)
+                            self.fallbackNeeded.emit([(filename, deferred[filename]) for filename in prompted])
+                        if prompted is None:
+                            continue
                         try:
-                            ok, error, out_dir = future.result()
-                            if ok:
-                                if out_dir:
-                                    self.win.last_output_dir = out_dir
+                            choice = self._fallback_choices.get(timeout=0.1 if not pending else 0)
+                        except queue.Empty:
+                            continue
+                        for filename in prompted:
+                            error = deferred.pop(filename)
+                            if choice in {"ffmpeg", "librosa"}:
+                                future = self._submit(executor, filename, choice)
+                                futures[future] = (filename, False)
+                                pending.add(future)
+                                self.progress.set_status(filename, "queued")
                             else:
-                                self.errorOccurred.emit(filename, error or "Unknown error.")
-                        except Exception as exc:
-                            self.errorOccurred.emit(filename, str(exc))
-                        finally:
-                            self.oneFinished.emit()
-
-            def _process_file(self, filename: str) -> bool:
-                if self.options["fallback_mode"] == "ask":
-                    try:
-                        ok, error, out_dir = process_audio_file(
-                            filename,
-                            **self._build_process_kwargs(fallback_mode="skip"),
-                        )
-                    except Exception as exc:
-                        self.errorOccurred.emit(filename, str(exc))
-                        return False
-                    if ok:
-                        if out_dir:
-                            self.win.last_output_dir = out_dir
-                        return True
-                    choice = self.win._request_fallback_choice(filename, error or "")
-                    if choice == "ffmpeg":
+                                error = i18n.text("skipped_by_user", self.win.current_language)
+                                self._finish_file(filename, False, error, None)
+                                self.progress.file_finished()
+                        prompted = None
+                        self.deferredChanged.emit(len(deferred))
+                finally:
+                    executor.shutdown(wait=not self._hard_cancel.is_set(), cancel_futures=True)
+
+            def _cancel_pending(self, executor, futures: dict, pending: set):
+                for future in list(pending):
+                    if future.cancel():
+                        pending.discard(future)
+                        self.progress.set_status(futures[future][0], "cancelled")
+                if self._hard_cancel.is_set() and isinstance(executor, ProcessPoolExecutor):
+                    # Queued calls a worker already took cannot be cancelled; stop taking new ones.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    while not self._worker_pid_queue.empty():
+                        self._worker_pids.add(self._worker_pid_queue.get())
+                    for pid in self._worker_pids:
                         try:
-                            ok, error, out_dir = process_audio_file(
-                                filename,
-                                **self._build_process_kwargs(fallback_mode="ffmpeg"),
-                            )
-                        except Exception as exc:
-                            self.errorOccurred.emit(filename, str(exc))
-                            return False
-                    elif choice == "librosa":
-                        try:
-                            ok, error, out_dir = process_audio_file(
-                                filename,
-                                **self._build_process_kwargs(fallback_mode="librosa"),
-                            )
-                        except Exception as exc:
-                            self.errorOccurred.emit(filename, str(exc))
-                            return False
-                    else:
-                        self.errorOccurred.emit(
-                            filename,
-                            i18n.text("skipped_by_user", self.win.current_language),
-                        )
-                        return False
-                    if ok:
-                        if out_dir:
-                            self.win.last_output_dir = out_dir
-                        return True
-                    self.errorOccurred.emit(filename, error or "Unknown error.")
-                    return False
-
-                try:
-                    ok, error, out_dir = process_audio_file(
-                        filename,
-                        **self._build_process_kwargs(),
-                    )
-                except Exception as exc:
-                    self.errorOccurred.emit(filename, str(exc))
-                    return False
+                            os.kill(pid, signal.SIGTERM)
+                        except OSError:
+                            pass
+                    for future in pending:
+                        self.progress.set_status(futures[future][0], "cancelled")
+                    pending.clear()
+
+            def _finish_file(self, filename: str, ok: bool, error: str | None, records: list[dict] | None):
                 if ok:
-                    if out_dir:
-                        self.win.last_output_dir = out_dir
-                    return True
-                self.errorOccurred.emit(filename, error or "Unknown error.")
-                return False
-
-            def _build_process_kwargs(self, fallback_mode: str | None = None) -> dict:
+                    self.progress.set_status(filename, "done")
+                    return records
+                if self._cancel_event.is_set():
+                    self.progress.set_status(filename, "cancelled")
+                    return None
+                self.progress.set_status(filename, "failed")
+                self.progress.add_error(filename, error or "Unknown error.")
+                return None
+
+            def _build_process_kwargs(self, fallback_mode: str | None = None, **callbacks) -> dict:
                 opts = self.options
                 return {
+                    **callbacks,
                     "output_ext": self.output_ext,
                     "threshold_db": opts["threshold_db"],
                     "min_length": opts["min_length"],
                     "min_interval": opts["min_interval"],
                     "hop_size": opts["hop_size"],
                     "max_silence": opts["max_silence"],
+                    "slicer_engine": opts["slicer_engine"],
+                    "fast_analysis": opts["fast_analysis"],
                     "dynamic_enabled": opts["dynamic_enabled"],
                     "dynamic_offset_db": opts["dynamic_offset_db"],
+                    "dynamic_window_sec": opts["dynamic_window_sec"],
                     "vad_enabled": opts["vad_enabled"],
+                    "vad_mode": opts["vad_mode"],
                     "vad_sensitivity_db": opts["vad_sensitivity_db"],
                     "vad_hangover_ms": opts["vad_hangover_ms"],
                     "name_prefix": opts["name_prefix"],
@@ -348,75 +507,110 @@ class MainWindow(QMainWindow):
                     "name_timestamp": opts["name_timestamp"],
                     "export_csv": opts["export_csv"],
                     "export_json": opts["export_json"],
+                    "export_labels": opts["export_labels"],
+                    "export_cue": opts["export_cue"],
+                    "export_manifest": opts["export_manifest"],
                     "output_dir": opts["output_dir"],
                     "fallback_mode": fallback_mode or opts["fallback_mode"],
                     "language": self.win.current_language,
+                    "cache_dir": self.win._analysis_cache_dir(),
+                    "output_mode": opts["output_mode"],
+                    "shard_size_mb": opts["shard_size_mb"],
+                    "target_sr": opts["target_sr"],
+                    "target_channels": opts["target_channels"],
+                    "output_subtype": opts["output_subtype"],
+                    "incremental": opts["incremental"],
+                    "encoder_workers": encoder_workers(opts["parallel_mode"], opts["parallel_jobs"]),
                 }
 
         # Collect paths
-        paths: list[str] = []
-        for i in range(0, item_count):
-            item = self.ui.lwTaskList.item(i)
-            path = item.data(Qt.ItemDataRole.UserRole + 1)  # Get full path
-            paths.append(path)
+        paths = self.task_model.paths()
 
         self.ui.progressBar.setMaximum(item_count)
         self.ui.progressBar.setValue(0)
 
         self.workCount = item_count
         self.workFinished = 0
+        self.task_model.reset_status(paths)
+        self.error_log.clear()
+        self._update_error_log()
         self._setProcessing(True)
 
         # Start work thread
         worker = WorkThread(paths, self, output_format, options)
-        worker.oneFinished.connect(self._oneFinished)
-        worker.errorOccurred.connect(self._on_worker_error)
+        worker.deferredChanged.connect(self._on_deferred_changed)
+        worker.fallbackNeeded.connect(functools.partial(self._on_fallback_needed, worker))
         worker.finished.connect(self._threadFinished)
         worker.start()
 
         self.workers.append(worker)  # Collect in case of auto deletion
+        self._progress_timer.start()
 
-    def _oneFinished(self):
-        self.workFinished += 1
+    def _poll_progress(self):
+        # Workers only touch their RunProgress; the GUI catches up here at a
+        # fixed rate however many files finish in between.
+        for worker in self.workers:
+            finished, output_dir, statuses, errors = worker.progress.take()
+            self.workFinished = finished
+            if output_dir:
+                self.last_output_dir = output_dir
+            self.task_model.update_statuses(statuses)
+            if errors:
+                self.error_log.add_errors(errors)
+                self._update_error_log()
         self.ui.progressBar.setValue(self.workFinished)
 
-    def _on_worker_error(self, filename: str, error: str):
-        QMessageBox.warning(
-            self,
-            i18n.text("warning_title", self.current_language),
-            i18n.text("read_failed", self.current_language).format(
-                file=filename,
-                error=error,
-            ),
+    def _update_error_log(self):
+        count = self.error_log.rowCount()
+        self.ui.labelErrorLog.setText(i18n.text("error_log", self.current_language).format(count=count))
+        self.ui.labelErrorLog.setVisible(count > 0)
+        self.ui.lvErrorLog.setVisible(count > 0)
+
+    def _on_deferred_changed(self, count: int):
+        self._deferred_count = count
+        self.ui.btnResolveFallback.setVisible(count > 0)
+        self.ui.btnResolveFallback.setText(
+            i18n.text("resolve_deferred_files", self.current_language).format(count=count))
+
+    def _on_resolve_fallback(self):
+        for worker in self.workers:
+            worker.request_fallback_prompt()
+
+    def _on_fallback_needed(self, worker, failures: list):
+        names = [os.path.basename(filename) for filename, _ in failures[:10]]
+        if len(failures) > len(names):
+            names.append("…")
+        choice = self._show_fallback_dialog(
+            "deferred_read_failed",
+            "\n".join(names),
+            failures[0][1],
+            count=len(failures),
         )
+        worker.resolve_fallback(choice)
 
-    def _request_fallback_choice(self, filename: str, error: str) -> str:
-        self._fallback_request_lock.lock()
-        try:
-            bridge = self._fallback_bridge
-            bridge.mutex.lock()
-            bridge.choice = None
-            bridge.request.emit(filename, error)
-            while bridge.choice is None:
-                bridge.cond.wait(bridge.mutex)
-            choice = bridge.choice or "cancel"
-            bridge.mutex.unlock()
-            return choice
-        finally:
-            self._fallback_request_lock.unlock()
+    def _cancel_processing(self, hard: bool = False):
+        # The first click stops cooperatively; clicking again while stopping
+        # terminates process workers as well.
+        for worker in self.workers:
+            worker.cancel(hard=hard or worker.cancel_requested)
+        self.ui.btnStart.setText(i18n.text("stopping", self.current_language))
 
     def _threadFinished(self):
         # Join all workers
+        cancelled = any(worker.cancel_requested for worker in self.workers)
         for worker in self.workers:
             worker.wait()
+        self._progress_timer.stop()
+        self._poll_progress()
         self.workers.clear()
+        self._on_deferred_changed(0)
         self._setProcessing(False)
 
-        QMessageBox.information(
-            self,
-            QApplication.applicationName(),
-            i18n.text("slicing_complete", self.current_language),
-        )
+        message = i18n.text("slicing_cancelled" if cancelled else "slicing_complete", self.current_language)
+        if self.error_log.rowCount():
+            message += "\n" + i18n.text("slicing_errors", self.current_language).format(
+                count=self.error_log.rowCount())
+        QMessageBox.information(self, QApplication.applicationName(), message)
         if self.ui.cbxOpenOutuptDirectory.isChecked() and self.last_output_dir:
             QDesktopServices.openUrl(QUrl.fromLocalFile(self.last_output_dir))
 
@@ -430,11 +624,11 @@ class MainWindow(QMainWindow):
     def _setProcessing(self, processing: bool):
         is_enabled = not processing
         self.ui.btnStart.setText(
-            i18n.text("slicing", self.current_language) if processing else i18n.text("start", self.current_language))
-        self.ui.btnStart.setEnabled(is_enabled)
+            i18n.text("cancel", self.current_language) if processing else i18n.text("start", self.current_language))
         self.ui.btnPreviewSelection.setEnabled(is_enabled)
         self.ui.btnAddFiles.setEnabled(is_enabled)
-        self.ui.lwTaskList.setEnabled(is_enabled)
+        self.ui.btnAddFolder.setEnabled(is_enabled)
+        self.ui.lvTaskList.setEnabled(is_enabled)
         self.ui.btnClearList.setEnabled(is_enabled)
         self.ui.leThreshold.setEnabled(is_enabled)
         self.ui.leMinLen.setEnabled(is_enabled)
@@ -452,27 +646,95 @@ class MainWindow(QMainWindow):
         self.ui.cbxNameTimestamp.setEnabled(is_enabled)
         self.ui.cbxExportCsv.setEnabled(is_enabled)
         self.ui.cbxExportJson.setEnabled(is_enabled)
+        self.ui.cbxExportLabels.setEnabled(is_enabled)
+        self.ui.cbxExportCue.setEnabled(is_enabled)
+        self.ui.cbxExportManifest.setEnabled(is_enabled)
+        self.ui.cbOutputMode.setEnabled(is_enabled)
+        self.ui.sbShardSize.setEnabled(is_enabled)
+        self.ui.cbTargetSampleRate.setEnabled(is_enabled)
+        self.ui.cbTargetChannels.setEnabled(is_enabled)
+        self.ui.cbOutputSubtype.setEnabled(is_enabled)
+        self.ui.cbxIncremental.setEnabled(is_enabled)
+        self.ui.cbSlicerEngine.setEnabled(is_enabled)
         self.ui.cbxDynamicThreshold.setEnabled(is_enabled)
         self.ui.leDynamicOffset.setEnabled(is_enabled)
+        self.ui.leDynamicWindow.setEnabled(is_enabled)
         self.ui.cbxVAD.setEnabled(is_enabled)
+        self.ui.cbVADMode.setEnabled(is_enabled)
         self.ui.leVADSensitivity.setEnabled(is_enabled)
         self.ui.leVADHangover.setEnabled(is_enabled)
         self.ui.cbParallelMode.setEnabled(is_enabled)
         self.ui.sbParallelJobs.setEnabled(is_enabled)
+        self.ui.cbxFastAnalysis.setEnabled(is_enabled)
         self.ui.cbFallbackMode.setEnabled(is_enabled)
         self.ui.btnRecommend.setEnabled(is_enabled)
+        self.ui.cbRecommendScope.setEnabled(is_enabled)
+        self.ui.btnReport.setEnabled(is_enabled)
         self.processing = processing
+        self._update_recommend_inputs()
+
+    def _init_task_list(self):
+        # A model-backed view instead of the QListWidget from the .ui file, so
+        # that large directories can be added without creating an item each.
+        self.task_model = TaskListModel(self)
+        self._task_scanners: list[TaskScanner] = []
+        view = QListView(self.ui.groupBox)
+        view.setObjectName("lvTaskList")
+        view.setFrameShadow(QFrame.Plain)
+        view.setSelectionMode(QAbstractItemView.SingleSelection)
+        view.setUniformItemSizes(True)
+        view.setAlternatingRowColors(True)
+        view.setModel(self.task_model)
+        self.ui.verticalLayout_2.replaceWidget(self.ui.lwTaskList, view)
+        self.ui.lwTaskList.deleteLater()
+        del self.ui.lwTaskList
+        self.ui.lvTaskList = view
+
+        self.error_log = ErrorLogModel(self)
+        self.ui.labelErrorLog = QLabel(self.ui.groupBox)
+        self.ui.lvErrorLog = QListView(self.ui.groupBox)
+        self.ui.lvErrorLog.setObjectName("lvErrorLog")
+        self.ui.lvErrorLog.setFrameShadow(QFrame.Plain)
+        self.ui.lvErrorLog.setUniformItemSizes(True)
+        self.ui.lvErrorLog.setMaximumHeight(120)
+        self.ui.lvErrorLog.setModel(self.error_log)
+        index = self.ui.verticalLayout_2.indexOf(view) + 1
+        self.ui.verticalLayout_2.insertWidget(index, self.ui.labelErrorLog)
+        self.ui.verticalLayout_2.insertWidget(index + 1, self.ui.lvErrorLog)
+        self.ui.labelErrorLog.setVisible(False)
+        self.ui.lvErrorLog.setVisible(False)
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._poll_progress)
+
+        self.ui.btnAddFolder = QPushButton(self.ui.centralwidget)
+        self.ui.btnAddFolder.setSizePolicy(self.ui.btnAddFiles.sizePolicy())
+        self.ui.horizontalLayout_2.insertWidget(1, self.ui.btnAddFolder)
 
     def _init_extra_ui(self):
         if self._preview_embed:
             self._init_preview_panel()
+        self._init_output_formats()
         self._init_settings_tabs()
         self._init_main_splitter()
         self._init_recommend_controls()
+        self._init_report_controls()
+        self._init_deferred_fallback_controls()
         self._init_advanced_controls()
+        self._init_live_preview()
         self._apply_layout_style()
         self._apply_combo_popup_style()
 
+    def _init_output_formats(self):
+        # Encoded through ffmpeg (see utils.encoder).
+        for name, text in (("radioButtonOpus", "opus"), ("radioButtonM4a", "m4a")):
+            button = QRadioButton(self.ui.groupBox_2)
+            button.setObjectName(name)
+            button.setText(text)
+            self.ui.outputFormatGroup.addButton(button)
+            self.ui.horizontalLayoutOutputFormat.addWidget(button, 0, Qt.AlignHCenter)
+            setattr(self.ui, name, button)
+
     def _init_preview_panel(self):
         self.groupBoxPreview = QGroupBox(self)
         self.groupBoxPreview.setObjectName("groupBoxPreview")
@@ -486,12 +748,14 @@ class MainWindow(QMainWindow):
         self.labelPreview.setMinimumSize(240, 240)
         self.labelPreview.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         preview_layout.addWidget(self.labelPreview)
+        self.previewEmbedded = PreviewWidget(self.groupBoxPreview)
+        self.previewEmbedded.setVisible(False)
+        preview_layout.addWidget(self.previewEmbedded)
         self.ui.verticalLayout_3.removeWidget(self.ui.btnPreviewSelection)
         action_row = QHBoxLayout()
         action_row.addStretch()
         action_row.addWidget(self.ui.btnPreviewSelection)
         preview_layout.addLayout(action_row)
-        self._preview_pixmap_path: str | None = None
 
     def _init_settings_tabs(self):
         self.ui.settingsTabs = QTabWidget(self.ui.groupBox_2)
@@ -517,9 +781,43 @@ class MainWindow(QMainWindow):
 
     def _init_recommend_controls(self):
         self.ui.labelRecommend = QLabel(self.ui.groupBox_2)
+        self.ui.cbRecommendScope = QComboBox(self.ui.groupBox_2)
+        self.ui.sbRecommendExcerpts = QSpinBox(self.ui.groupBox_2)
+        self.ui.sbRecommendExcerpts.setRange(2, 64)
+        self.ui.sbRecommendExcerpts.setValue(12)
+        self.ui.sbRecommendExcerpts.setEnabled(False)
+        self.ui.sbTargetMin = QDoubleSpinBox(self.ui.groupBox_2)
+        self.ui.sbTargetMax = QDoubleSpinBox(self.ui.groupBox_2)
+        for spin_box, value in ((self.ui.sbTargetMin, 2.0), (self.ui.sbTargetMax, 15.0)):
+            spin_box.setRange(0.5, 600.0)
+            spin_box.setDecimals(1)
+            spin_box.setSuffix(" s")
+            spin_box.setValue(value)
+            spin_box.setEnabled(False)
         self.ui.btnRecommend = QPushButton(self.ui.groupBox_2)
-        self.ui.formLayout.insertRow(0, self.ui.labelRecommend, self.ui.btnRecommend)
+        recommend_row = QHBoxLayout()
+        recommend_row.addWidget(self.ui.cbRecommendScope, 1)
+        recommend_row.addWidget(self.ui.sbRecommendExcerpts)
+        recommend_row.addWidget(self.ui.sbTargetMin)
+        recommend_row.addWidget(self.ui.sbTargetMax)
+        recommend_row.addWidget(self.ui.btnRecommend)
+        self.ui.formLayout.insertRow(0, self.ui.labelRecommend, recommend_row)
         self.ui.btnRecommend.clicked.connect(self._on_recommend_params)
+        self.ui.cbRecommendScope.currentIndexChanged.connect(lambda _: self._update_recommend_inputs())
+
+    def _init_report_controls(self):
+        self.ui.btnReport = QPushButton(self.ui.centralwidget)
+        self.ui.horizontalLayout_3.insertWidget(self.ui.horizontalLayout_3.indexOf(self.ui.btnStart), self.ui.btnReport)
+        self.ui.btnReport.clicked.connect(self._on_generate_report)
+
+    def _init_deferred_fallback_controls(self):
+        # Shown while files of an "ask" run wait for a fallback decoder.
+        self._deferred_count = 0
+        self.ui.btnResolveFallback = QPushButton(self.ui.centralwidget)
+        self.ui.btnResolveFallback.setVisible(False)
+        self.ui.horizontalLayout_3.insertWidget(
+            self.ui.horizontalLayout_3.indexOf(self.ui.btnStart), self.ui.btnResolveFallback)
+        self.ui.btnResolveFallback.clicked.connect(self._on_resolve_fallback)
 
     def _init_main_splitter(self):
         self.ui.mainSplitter = QSplitter(Qt.Horizontal, self)
@@ -793,6 +1091,49 @@ class MainWindow(QMainWindow):
         self.ui.cbxExportJson = QCheckBox(self.ui.groupBox_2)
         self.ui.advancedNamingLayout.addRow(self.ui.labelExportJson, self.ui.cbxExportJson)
 
+        self.ui.labelExportLabels = QLabel(self.ui.groupBox_2)
+        self.ui.cbxExportLabels = QCheckBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelExportLabels, self.ui.cbxExportLabels)
+
+        self.ui.labelExportCue = QLabel(self.ui.groupBox_2)
+        self.ui.cbxExportCue = QCheckBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelExportCue, self.ui.cbxExportCue)
+
+        self.ui.labelExportManifest = QLabel(self.ui.groupBox_2)
+        self.ui.cbxExportManifest = QCheckBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelExportManifest, self.ui.cbxExportManifest)
+
+        self.ui.labelOutputMode = QLabel(self.ui.groupBox_2)
+        self.ui.cbOutputMode = QComboBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelOutputMode, self.ui.cbOutputMode)
+
+        self.ui.labelShardSize = QLabel(self.ui.groupBox_2)
+        self.ui.sbShardSize = QSpinBox(self.ui.groupBox_2)
+        self.ui.sbShardSize.setRange(16, 65536)
+        self.ui.sbShardSize.setSingleStep(256)
+        self.ui.sbShardSize.setValue(1024)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelShardSize, self.ui.sbShardSize)
+
+        self.ui.labelTargetSampleRate = QLabel(self.ui.groupBox_2)
+        self.ui.cbTargetSampleRate = QComboBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelTargetSampleRate, self.ui.cbTargetSampleRate)
+
+        self.ui.labelTargetChannels = QLabel(self.ui.groupBox_2)
+        self.ui.cbTargetChannels = QComboBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelTargetChannels, self.ui.cbTargetChannels)
+
+        self.ui.labelOutputSubtype = QLabel(self.ui.groupBox_2)
+        self.ui.cbOutputSubtype = QComboBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelOutputSubtype, self.ui.cbOutputSubtype)
+
+        self.ui.labelIncremental = QLabel(self.ui.groupBox_2)
+        self.ui.cbxIncremental = QCheckBox(self.ui.groupBox_2)
+        self.ui.advancedNamingLayout.addRow(self.ui.labelIncremental, self.ui.cbxIncremental)
+
+        self.ui.labelSlicerEngine = QLabel(self.ui.groupBox_2)
+        self.ui.cbSlicerEngine = QComboBox(self.ui.groupBox_2)
+        self.ui.advancedDetectionLayout.addRow(self.ui.labelSlicerEngine, self.ui.cbSlicerEngine)
+
         self.ui.labelDynamicThreshold = QLabel(self.ui.groupBox_2)
         self.ui.cbxDynamicThreshold = QCheckBox(self.ui.groupBox_2)
         self.ui.advancedDetectionLayout.addRow(self.ui.labelDynamicThreshold, self.ui.cbxDynamicThreshold)
@@ -802,10 +1143,19 @@ class MainWindow(QMainWindow):
         self.ui.leDynamicOffset.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
         self.ui.advancedDetectionLayout.addRow(self.ui.labelDynamicOffset, self.ui.leDynamicOffset)
 
+        self.ui.labelDynamicWindow = QLabel(self.ui.groupBox_2)
+        self.ui.leDynamicWindow = QLineEdit(self.ui.groupBox_2)
+        self.ui.leDynamicWindow.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+        self.ui.advancedDetectionLayout.addRow(self.ui.labelDynamicWindow, self.ui.leDynamicWindow)
+
         self.ui.labelVAD = QLabel(self.ui.groupBox_2)
         self.ui.cbxVAD = QCheckBox(self.ui.groupBox_2)
         self.ui.advancedDetectionLayout.addRow(self.ui.labelVAD, self.ui.cbxVAD)
 
+        self.ui.labelVADMode = QLabel(self.ui.groupBox_2)
+        self.ui.cbVADMode = QComboBox(self.ui.groupBox_2)
+        self.ui.advancedDetectionLayout.addRow(self.ui.labelVADMode, self.ui.cbVADMode)
+
         self.ui.labelVADSensitivity = QLabel(self.ui.groupBox_2)
         self.ui.leVADSensitivity = QLineEdit(self.ui.groupBox_2)
         self.ui.leVADSensitivity.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
@@ -829,10 +1179,16 @@ class MainWindow(QMainWindow):
         self.ui.cbFallbackMode = QComboBox(self.ui.groupBox_2)
         self.ui.advancedPerformanceLayout.addRow(self.ui.labelFallbackMode, self.ui.cbFallbackMode)
 
+        self.ui.labelFastAnalysis = QLabel(self.ui.groupBox_2)
+        self.ui.cbxFastAnalysis = QCheckBox(self.ui.groupBox_2)
+        self.ui.advancedPerformanceLayout.addRow(self.ui.labelFastAnalysis, self.ui.cbxFastAnalysis)
+
         self.ui.leDynamicOffset.setValidator(QDoubleValidator())
+        self.ui.leDynamicWindow.setValidator(QRegularExpressionValidator(QRegularExpression(r"\d+")))
         self.ui.leVADSensitivity.setValidator(QDoubleValidator())
         self.ui.leVADHangover.setValidator(QRegularExpressionValidator(QRegularExpression(r"\d+")))
         self.ui.leDynamicOffset.setText("6")
+        self.ui.leDynamicWindow.setText("0")
         self.ui.leVADSensitivity.setText("6")
         self.ui.leVADHangover.setText("120")
         self.ui.cbxDynamicThreshold.setChecked(False)
@@ -845,12 +1201,37 @@ class MainWindow(QMainWindow):
         self.ui.btnPresetReset.clicked.connect(self._on_reset_presets)
         self.ui.cbPresets.currentIndexChanged.connect(self._on_preset_selected)
 
-    def _preset_file(self) -> str:
+    def _init_live_preview(self):
+        for line_edit in (
+            self.ui.leThreshold,
+            self.ui.leMinLen,
+            self.ui.leMinInterval,
+            self.ui.leHopSize,
+            self.ui.leMaxSilence,
+            self.ui.leDynamicOffset,
+            self.ui.leDynamicWindow,
+            self.ui.leVADSensitivity,
+            self.ui.leVADHangover,
+        ):
+            line_edit.textChanged.connect(self._schedule_live_reslice)
+        self.ui.cbxDynamicThreshold.toggled.connect(self._schedule_live_reslice)
+        self.ui.cbxVAD.toggled.connect(self._schedule_live_reslice)
+        self.ui.cbVADMode.currentIndexChanged.connect(self._schedule_live_reslice)
+        self.ui.cbSlicerEngine.currentIndexChanged.connect(self._schedule_live_reslice)
+        self.ui.cbxFastAnalysis.toggled.connect(self._schedule_live_reslice)
+
+    def _app_data_dir(self) -> str:
         base_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
         if not base_dir:
             base_dir = os.path.join(os.path.expanduser("~"), ".audio_slicer")
         os.makedirs(base_dir, exist_ok=True)
-        return os.path.join(base_dir, "presets.json")
+        return base_dir
+
+    def _preset_file(self) -> str:
+        return os.path.join(self._app_data_dir(), "presets.json")
+
+    def _analysis_cache_dir(self) -> str:
+        return os.path.join(self._app_data_dir(), "analysis_cache")
 
     def _load_presets(self):
         self._preset_path = self._preset_file()
@@ -882,6 +1263,7 @@ class MainWindow(QMainWindow):
                 "export_json": False,
                 "dynamic_enabled": True,
                 "dynamic_offset_db": "6",
+                "dynamic_window_sec": "0",
                 "vad_enabled": True,
                 "vad_sensitivity_db": "6",
                 "vad_hangover_ms": "120",
@@ -903,6 +1285,7 @@ class MainWindow(QMainWindow):
                 "export_json": False,
                 "dynamic_enabled": True,
                 "dynamic_offset_db": "5",
+                "dynamic_window_sec": "0",
                 "vad_enabled": True,
                 "vad_sensitivity_db": "7",
                 "vad_hangover_ms": "180",
@@ -924,6 +1307,7 @@ class MainWindow(QMainWindow):
                 "export_json": False,
                 "dynamic_enabled": True,
                 "dynamic_offset_db": "7",
+                "dynamic_window_sec": "0",
                 "vad_enabled": True,
                 "vad_sensitivity_db": "5",
                 "vad_hangover_ms": "80",
@@ -945,6 +1329,7 @@ class MainWindow(QMainWindow):
                 "export_json": False,
                 "dynamic_enabled": True,
                 "dynamic_offset_db": "6",
+                "dynamic_window_sec": "60",
                 "vad_enabled": True,
                 "vad_sensitivity_db": "6",
                 "vad_hangover_ms": "200",
@@ -966,6 +1351,7 @@ class MainWindow(QMainWindow):
                 "export_json": True,
                 "dynamic_enabled": True,
                 "dynamic_offset_db": "6",
+                "dynamic_window_sec": "0",
                 "vad_enabled": True,
                 "vad_sensitivity_db": "6",
                 "vad_hangover_ms": "150",
@@ -1007,12 +1393,25 @@ class MainWindow(QMainWindow):
             "name_timestamp": self.ui.cbxNameTimestamp.isChecked(),
             "export_csv": self.ui.cbxExportCsv.isChecked(),
             "export_json": self.ui.cbxExportJson.isChecked(),
+            "export_labels": self.ui.cbxExportLabels.isChecked(),
+            "export_cue": self.ui.cbxExportCue.isChecked(),
+            "export_manifest": self.ui.cbxExportManifest.isChecked(),
+            "output_mode": self.ui.cbOutputMode.currentData(),
+            "shard_size_mb": self.ui.sbShardSize.value(),
+            "target_sr": self.ui.cbTargetSampleRate.currentData(),
+            "target_channels": self.ui.cbTargetChannels.currentData(),
+            "output_subtype": self.ui.cbOutputSubtype.currentData(),
+            "incremental": self.ui.cbxIncremental.isChecked(),
+            "slicer_engine": self.ui.cbSlicerEngine.currentData(),
             "dynamic_enabled": self.ui.cbxDynamicThreshold.isChecked(),
             "dynamic_offset_db": self.ui.leDynamicOffset.text(),
+            "dynamic_window_sec": self.ui.leDynamicWindow.text(),
             "vad_enabled": self.ui.cbxVAD.isChecked(),
+            "vad_mode": self.ui.cbVADMode.currentData(),
             "vad_sensitivity_db": self.ui.leVADSensitivity.text(),
             "vad_hangover_ms": self.ui.leVADHangover.text(),
             "parallel_mode": self.ui.cbParallelMode.currentData(),
+            "fast_analysis": self.ui.cbxFastAnalysis.isChecked(),
             "parallel_jobs": self.ui.sbParallelJobs.value(),
             "fallback_mode": self.ui.cbFallbackMode.currentData(),
         }
@@ -1045,16 +1444,51 @@ class MainWindow(QMainWindow):
             self.ui.cbxExportCsv.setChecked(bool(data["export_csv"]))
         if "export_json" in data:
             self.ui.cbxExportJson.setChecked(bool(data["export_json"]))
+        if "export_labels" in data:
+            self.ui.cbxExportLabels.setChecked(bool(data["export_labels"]))
+        if "export_cue" in data:
+            self.ui.cbxExportCue.setChecked(bool(data["export_cue"]))
+        if "incremental" in data:
+            self.ui.cbxIncremental.setChecked(bool(data["incremental"]))
+        if "export_manifest" in data:
+            self.ui.cbxExportManifest.setChecked(bool(data["export_manifest"]))
+        if "output_mode" in data:
+            idx = self.ui.cbOutputMode.findData(data["output_mode"])
+            if idx >= 0:
+                self.ui.cbOutputMode.setCurrentIndex(idx)
+        if "shard_size_mb" in data:
+            self.ui.sbShardSize.setValue(int(data["shard_size_mb"]))
+        for key, combo in (
+            ("target_sr", self.ui.cbTargetSampleRate),
+            ("target_channels", self.ui.cbTargetChannels),
+            ("output_subtype", self.ui.cbOutputSubtype),
+        ):
+            if key in data:
+                idx = combo.findData(data[key])
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
         if "dynamic_enabled" in data:
             self.ui.cbxDynamicThreshold.setChecked(bool(data["dynamic_enabled"]))
         if "dynamic_offset_db" in data:
             self.ui.leDynamicOffset.setText(str(data["dynamic_offset_db"]))
+        if "dynamic_window_sec" in data:
+            self.ui.leDynamicWindow.setText(str(data["dynamic_window_sec"]))
         if "vad_enabled" in data:
             self.ui.cbxVAD.setChecked(bool(data["vad_enabled"]))
+        if "vad_mode" in data:
+            idx = self.ui.cbVADMode.findData(data["vad_mode"])
+            if idx >= 0:
+                self.ui.cbVADMode.setCurrentIndex(idx)
+        if "slicer_engine" in data:
+            idx = self.ui.cbSlicerEngine.findData(data["slicer_engine"])
+            if idx >= 0:
+                self.ui.cbSlicerEngine.setCurrentIndex(idx)
         if "vad_sensitivity_db" in data:
             self.ui.leVADSensitivity.setText(str(data["vad_sensitivity_db"]))
         if "vad_hangover_ms" in data:
             self.ui.leVADHangover.setText(str(data["vad_hangover_ms"]))
+        if "fast_analysis" in data:
+            self.ui.cbxFastAnalysis.setChecked(bool(data["fast_analysis"]))
         if "parallel_mode" in data:
             idx = self.ui.cbParallelMode.findData(data["parallel_mode"])
             if idx >= 0:
@@ -1143,6 +1577,66 @@ class MainWindow(QMainWindow):
             if idx >= 0:
                 self.ui.cbParallelMode.setCurrentIndex(idx)
 
+    def _refresh_export_conversion_options(self):
+        keep = i18n.text("output_keep_source", self.current_language)
+        items = (
+            (self.ui.cbTargetSampleRate, [(keep, None)] + [
+                (f"{rate} Hz", rate) for rate in (8000, 16000, 22050, 24000, 32000, 44100, 48000)
+            ]),
+            (self.ui.cbTargetChannels, [(keep, None), (i18n.text("output_channels_mono", self.current_language), 1)]),
+            (self.ui.cbOutputSubtype, [(keep, None)] + [
+                (subtype, subtype) for subtype in ("PCM_16", "PCM_24", "PCM_32", "FLOAT")
+            ]),
+        )
+        for combo, entries in items:
+            current = combo.currentData()
+            combo.clear()
+            for text, data in entries:
+                combo.addItem(text, data)
+            idx = combo.findData(current)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+
+    def _refresh_output_mode_options(self):
+        current = self.ui.cbOutputMode.currentData()
+        self.ui.cbOutputMode.clear()
+        self.ui.cbOutputMode.addItem(
+            i18n.text("output_mode_files", self.current_language),
+            "files",
+        )
+        self.ui.cbOutputMode.addItem(
+            i18n.text("output_mode_shards", self.current_language),
+            "shards",
+        )
+        self.ui.cbOutputMode.addItem(
+            i18n.text("output_mode_index", self.current_language),
+            "index",
+        )
+        if current is not None:
+            idx = self.ui.cbOutputMode.findData(current)
+            if idx >= 0:
+                self.ui.cbOutputMode.setCurrentIndex(idx)
+
+    def _refresh_vad_mode_options(self):
+        current = self.ui.cbVADMode.currentData()
+        self.ui.cbVADMode.clear()
+        self.ui.cbVADMode.addItem(i18n.text("vad_mode_rms", self.current_language), "rms")
+        self.ui.cbVADMode.addItem(i18n.text("vad_mode_spectral", self.current_language), "spectral")
+        if current is not None:
+            idx = self.ui.cbVADMode.findData(current)
+            if idx >= 0:
+                self.ui.cbVADMode.setCurrentIndex(idx)
+
+    def _refresh_slicer_engine_options(self):
+        current = self.ui.cbSlicerEngine.currentData()
+        self.ui.cbSlicerEngine.clear()
+        self.ui.cbSlicerEngine.addItem(i18n.text("slicer_engine_rms", self.current_language), "rms")
+        self.ui.cbSlicerEngine.addItem(i18n.text("slicer_engine_legacy", self.current_language), "legacy")
+        if current is not None:
+            idx = self.ui.cbSlicerEngine.findData(current)
+            if idx >= 0:
+                self.ui.cbSlicerEngine.setCurrentIndex(idx)
+
     def _refresh_fallback_mode_options(self):
         current = self.ui.cbFallbackMode.currentData()
         self.ui.cbFallbackMode.clear()
@@ -1180,6 +1674,8 @@ class MainWindow(QMainWindow):
     def _apply_language(self):
         self.setWindowTitle(i18n.text("window_title", self.current_language))
         self.ui.btnAddFiles.setText(i18n.text("add_files", self.current_language))
+        self.ui.btnAddFolder.setText(i18n.text("add_folder", self.current_language))
+        self.task_model.set_language(self.current_language)
         self.ui.btnAbout.setText(i18n.text("about", self.current_language))
         self.ui.groupBox.setTitle(i18n.text("task_list", self.current_language))
         self.ui.btnRemove.setText(i18n.text("remove", self.current_language))
@@ -1196,15 +1692,14 @@ class MainWindow(QMainWindow):
         self.ui.btnBrowse.setText(i18n.text("browse", self.current_language))
         self.ui.labelOutputFormat.setText(i18n.text("output_format", self.current_language))
         self.ui.cbxOpenOutuptDirectory.setText(i18n.text("open_output_directory", self.current_language))
-        self.ui.btnStart.setText(
-            i18n.text("slicing", self.current_language) if self.processing else i18n.text("start", self.current_language)
-        )
+        if self.processing:
+            stopping = any(worker.cancel_requested for worker in self.workers)
+            self.ui.btnStart.setText(i18n.text("stopping" if stopping else "cancel", self.current_language))
+        else:
+            self.ui.btnStart.setText(i18n.text("start", self.current_language))
         if self._preview_embed and self.groupBoxPreview:
             self.groupBoxPreview.setTitle(i18n.text("preview", self.current_language))
-            if self._preview_pixmap_path:
-                self._update_preview_pixmap()
-            else:
-                self.labelPreview.setText(i18n.text("preview_placeholder", self.current_language))
+            self.labelPreview.setText(i18n.text("preview_placeholder", self.current_language))
         if self._preview_window:
             self._preview_window.setWindowTitle(i18n.text("preview", self.current_language))
         if self._preview_zoom_label:
@@ -1218,24 +1713,57 @@ class MainWindow(QMainWindow):
         self.ui.labelNameTimestamp.setText(i18n.text("name_timestamp", self.current_language))
         self.ui.labelExportCsv.setText(i18n.text("export_csv", self.current_language))
         self.ui.labelExportJson.setText(i18n.text("export_json", self.current_language))
+        self.ui.labelExportLabels.setText(i18n.text("export_labels", self.current_language))
+        self.ui.labelExportCue.setText(i18n.text("export_cue", self.current_language))
+        self.ui.labelExportManifest.setText(i18n.text("export_manifest", self.current_language))
+        self.ui.cbxExportManifest.setToolTip(i18n.text("export_manifest_tip", self.current_language))
+        self.ui.labelOutputMode.setText(i18n.text("output_mode", self.current_language))
+        self.ui.labelShardSize.setText(i18n.text("shard_size", self.current_language))
+        self.ui.sbShardSize.setToolTip(i18n.text("shard_size_tip", self.current_language))
+        self.ui.labelTargetSampleRate.setText(i18n.text("output_sample_rate", self.current_language))
+        self.ui.labelTargetChannels.setText(i18n.text("output_channels", self.current_language))
+        self.ui.labelOutputSubtype.setText(i18n.text("output_subtype", self.current_language))
+        self.ui.cbOutputSubtype.setToolTip(i18n.text("output_subtype_tip", self.current_language))
+        self.ui.labelIncremental.setText(i18n.text("incremental_export", self.current_language))
+        self.ui.cbxIncremental.setToolTip(i18n.text("incremental_export_tip", self.current_language))
+        self.ui.labelSlicerEngine.setText(i18n.text("slicer_engine", self.current_language))
+        self.ui.cbSlicerEngine.setToolTip(i18n.text("slicer_engine_tip", self.current_language))
         self.ui.labelDynamicThreshold.setText(i18n.text("dynamic_threshold", self.current_language))
         self.ui.labelDynamicOffset.setText(i18n.text("dynamic_threshold_offset", self.current_language))
+        self.ui.labelDynamicWindow.setText(i18n.text("dynamic_threshold_window", self.current_language))
+        self.ui.leDynamicWindow.setToolTip(i18n.text("dynamic_threshold_window_tip", self.current_language))
         self.ui.labelVAD.setText(i18n.text("vad", self.current_language))
+        self.ui.labelVADMode.setText(i18n.text("vad_mode", self.current_language))
+        self.ui.cbVADMode.setToolTip(i18n.text("vad_mode_tip", self.current_language))
         self.ui.labelVADSensitivity.setText(i18n.text("vad_sensitivity", self.current_language))
         self.ui.labelVADHangover.setText(i18n.text("vad_hangover", self.current_language))
         self.ui.labelParallelMode.setText(i18n.text("parallel_mode", self.current_language))
         self.ui.labelParallelJobs.setText(i18n.text("parallel_jobs", self.current_language))
         self.ui.labelFallbackMode.setText(i18n.text("fallback_mode", self.current_language))
+        self.ui.labelFastAnalysis.setText(i18n.text("fast_analysis", self.current_language))
+        self.ui.cbxFastAnalysis.setToolTip(i18n.text("fast_analysis_tip", self.current_language))
         self.ui.settingsTabs.setTabText(0, i18n.text("settings_basic", self.current_language))
         self.ui.settingsTabs.setTabText(1, i18n.text("settings_advanced", self.current_language))
         self.ui.labelRecommend.setText(i18n.text("recommend_label", self.current_language))
         self.ui.btnRecommend.setText(i18n.text("recommend_button", self.current_language))
+        self.ui.sbRecommendExcerpts.setToolTip(i18n.text("recommend_excerpts", self.current_language))
+        self.ui.sbTargetMin.setToolTip(i18n.text("recommend_target_min", self.current_language))
+        self.ui.sbTargetMax.setToolTip(i18n.text("recommend_target_max", self.current_language))
+        self._refresh_recommend_scope_options()
+        self.ui.btnReport.setText(i18n.text("report_button", self.current_language))
+        self.ui.btnResolveFallback.setText(
+            i18n.text("resolve_deferred_files", self.current_language).format(count=self._deferred_count))
+        self._update_error_log()
         self.ui.groupAdvancedPresets.setTitle(i18n.text("advanced_group_presets", self.current_language))
         self.ui.groupAdvancedNaming.setTitle(i18n.text("advanced_group_naming", self.current_language))
         self.ui.groupAdvancedDetection.setTitle(i18n.text("advanced_group_detection", self.current_language))
         self.ui.groupAdvancedPerformance.setTitle(i18n.text("advanced_group_performance", self.current_language))
         self._refresh_parallel_mode_options()
         self._refresh_fallback_mode_options()
+        self._refresh_vad_mode_options()
+        self._refresh_slicer_engine_options()
+        self._refresh_output_mode_options()
+        self._refresh_export_conversion_options()
         self._refresh_preset_combo(self.ui.cbPresets.currentText())
 
     def _get_output_format(self) -> str:
@@ -1251,12 +1779,16 @@ class MainWindow(QMainWindow):
             "min_interval": int(self.ui.leMinInterval.text()),
             "hop_size": int(self.ui.leHopSize.text()),
             "max_silence": int(self.ui.leMaxSilence.text()),
+            "slicer_engine": self.ui.cbSlicerEngine.currentData() or "rms",
             "dynamic_enabled": self.ui.cbxDynamicThreshold.isChecked(),
             "dynamic_offset_db": float(self.ui.leDynamicOffset.text()),
+            "dynamic_window_sec": float(self.ui.leDynamicWindow.text() or 0),
             "vad_enabled": self.ui.cbxVAD.isChecked(),
+            "vad_mode": self.ui.cbVADMode.currentData() or "rms",
             "vad_sensitivity_db": float(self.ui.leVADSensitivity.text()),
             "vad_hangover_ms": int(self.ui.leVADHangover.text()),
             "parallel_mode": self.ui.cbParallelMode.currentData() or "single",
+            "fast_analysis": self.ui.cbxFastAnalysis.isChecked(),
             "parallel_jobs": int(self.ui.sbParallelJobs.value()),
             "fallback_mode": self.ui.cbFallbackMode.currentData() or "ask",
             "name_prefix": self.ui.leNamePrefix.text(),
@@ -1264,67 +1796,124 @@ class MainWindow(QMainWindow):
             "name_timestamp": self.ui.cbxNameTimestamp.isChecked(),
             "export_csv": self.ui.cbxExportCsv.isChecked(),
             "export_json": self.ui.cbxExportJson.isChecked(),
+            "export_labels": self.ui.cbxExportLabels.isChecked(),
+            "export_cue": self.ui.cbxExportCue.isChecked(),
+            "export_manifest": self.ui.cbxExportManifest.isChecked(),
             "output_dir": self.ui.leOutputDir.text() or None,
+            "output_mode": self.ui.cbOutputMode.currentData() or "files",
+            "shard_size_mb": int(self.ui.sbShardSize.value()),
+            "target_sr": self.ui.cbTargetSampleRate.currentData(),
+            "target_channels": self.ui.cbTargetChannels.currentData(),
+            "output_subtype": self.ui.cbOutputSubtype.currentData(),
+            "incremental": self.ui.cbxIncremental.isChecked(),
         }
 
     def _get_theme(self) -> str:
         color = self.palette().color(QPalette.Window)
         return "dark" if color.value() < 128 else "light"
 
-    def _build_slice_analysis(self, slicer: Slicer, audio: np.ndarray):
-        dynamic_enabled = self.ui.cbxDynamicThreshold.isChecked()
-        vad_enabled = self.ui.cbxVAD.isChecked()
-        rms_list = None
-        if dynamic_enabled or vad_enabled:
-            rms_list = slicer.get_rms_list(audio)
-        dynamic_threshold_db = None
-        if dynamic_enabled and rms_list is not None:
-            dynamic_threshold_db = estimate_dynamic_threshold_db(
-                rms_list,
-                offset_db=float(self.ui.leDynamicOffset.text()),
-            )
-        vad_mask = None
-        if vad_enabled and rms_list is not None:
-            base_threshold = dynamic_threshold_db if dynamic_threshold_db is not None else slicer.threshold_db
-            hangover_ms = int(self.ui.leVADHangover.text())
-            hop_ms = int(self.ui.leHopSize.text())
-            hangover_frames = 0
-            if hop_ms > 0 and hangover_ms > 0:
-                hangover_frames = max(1, int(round(hangover_ms / hop_ms)))
-            vad_mask = build_vad_mask(
-                rms_list,
-                threshold_db=base_threshold,
-                sensitivity_db=float(self.ui.leVADSensitivity.text()),
-                hangover_frames=hangover_frames,
-            )
-        return rms_list, dynamic_threshold_db, vad_mask
+    def _refresh_recommend_scope_options(self):
+        current = self.ui.cbRecommendScope.currentData() or "file"
+        self.ui.cbRecommendScope.blockSignals(True)
+        self.ui.cbRecommendScope.clear()
+        self.ui.cbRecommendScope.addItem(i18n.text("recommend_scope_file", self.current_language), "file")
+        self.ui.cbRecommendScope.addItem(i18n.text("recommend_scope_fast", self.current_language), "fast")
+        self.ui.cbRecommendScope.addItem(i18n.text("recommend_scope_tune", self.current_language), "tune")
+        self.ui.cbRecommendScope.addItem(i18n.text("recommend_scope_list", self.current_language), "list")
+        idx = self.ui.cbRecommendScope.findData(current)
+        self.ui.cbRecommendScope.setCurrentIndex(idx if idx >= 0 else 0)
+        self.ui.cbRecommendScope.blockSignals(False)
+        self._update_recommend_inputs()
+
+    def _update_recommend_inputs(self):
+        scope = self.ui.cbRecommendScope.currentData()
+        self.ui.sbRecommendExcerpts.setEnabled(not self.processing and scope == "fast")
+        self.ui.sbTargetMin.setEnabled(not self.processing and scope == "tune")
+        self.ui.sbTargetMax.setEnabled(not self.processing and scope == "tune")
 
     def _on_recommend_params(self):
         if self.processing:
             self._warningProcessNotFinished()
             return
-        item = self.ui.lwTaskList.currentItem()
-        if item is None and self.ui.lwTaskList.count() > 0:
-            item = self.ui.lwTaskList.item(0)
-        if item is None:
+        if self.ui.cbRecommendScope.currentData() == "list" and self.task_model.rowCount() > 0:
+            paths = self.task_model.paths()
+            self._start_analysis_task(
+                "analysis_progress_recommend",
+                self._on_recommend_task_finished,
+                _run_corpus_recommend_job,
+                paths,
+                self.ui.cbParallelMode.currentData() or "thread",
+                int(self.ui.sbParallelJobs.value()),
+            )
+            return
+        filename = self._current_task_path() or self.task_model.path(0)
+        if filename is None:
             QMessageBox.information(
                 self,
                 QApplication.applicationName(),
                 i18n.text("recommend_no_selection", self.current_language),
             )
             return
-        filename = item.data(Qt.ItemDataRole.UserRole + 1)
-        if not filename:
+        if self.ui.cbRecommendScope.currentData() == "fast":
+            self._start_analysis_task(
+                "analysis_progress_recommend",
+                self._on_recommend_task_finished,
+                _run_fast_recommend_job,
+                filename,
+                int(self.ui.sbRecommendExcerpts.value()),
+                self.task_model.rowCount(),
+            )
             return
-        audio, sr = self._read_audio_for_analysis(filename)
-        if audio is None or sr is None:
+        self._start_recommend_task(filename)
+
+    def _start_recommend_task(self, filename: str, fallback_mode: str | None = None):
+        if self.ui.cbRecommendScope.currentData() == "tune":
+            try:
+                options = self._collect_processing_options()
+            except ValueError:
+                return
+            target_min = self.ui.sbTargetMin.value()
+            target_max = max(self.ui.sbTargetMax.value(), target_min)
+            self._start_analysis_task(
+                "analysis_progress_recommend",
+                self._on_recommend_task_finished,
+                _run_tune_job,
+                filename,
+                fallback_mode,
+                self.current_language,
+                options,
+                self._analysis_cache_dir(),
+                target_min,
+                target_max,
+            )
+            return
+        self._start_analysis_task(
+            "analysis_progress_recommend",
+            self._on_recommend_task_finished,
+            _run_recommend_job,
+            filename,
+            fallback_mode,
+            self.current_language,
+            self.task_model.rowCount(),
+        )
+
+    def _on_recommend_task_finished(self, task_id: int, result):
+        if not self._finish_analysis_task(task_id) or result is None:
+            return
+        if "decode_error" in result:
+            choice = self._show_fallback_dialog("process_read_failed", result["filename"], result["decode_error"])
+            if choice in {"ffmpeg", "librosa"}:
+                self._start_recommend_task(result["filename"], choice)
+            return
+        rec = result["recommendation"]
+        if rec is None:
+            errors = result.get("errors") or []
             QMessageBox.warning(
                 self,
                 i18n.text("warning_title", self.current_language),
-                i18n.text("recommend_failed", self.current_language),
+                "\n".join(f"{filename}: {error}" for filename, error in errors[:10]) or "Unknown error.",
             )
             return
-        rec = self._compute_recommendations(audio, sr)
         msg = self._format_recommend_message(rec)
         ret = QMessageBox.question(
             self,
@@ -1337,123 +1926,6 @@ class MainWindow(QMainWindow):
             return
         self._apply_recommendations(rec)
 
-    def _read_audio_for_analysis(self, filename: str):
-        try:
-            audio, sr = soundfile.read(filename, dtype=np.float32)
-            return audio, sr
-        except Exception as exc:
-            choice = self._show_fallback_dialog("process_read_failed", filename, str(exc))
-            if choice == "ffmpeg":
-                return self._read_audio_with_ffmpeg(filename)
-            if choice == "librosa":
-                return self._read_audio_with_librosa(filename)
-        return None, None
-
-    def _read_audio_with_ffmpeg(self, filename: str):
-        ffmpeg_path = resolve_ffmpeg_path()
-        if not ffmpeg_path:
-            return None, None
-        with tempfile.NamedTemporaryFile(
-            prefix="audio_slicer_recommend_",
-            suffix=".wav",
-            delete=False,
-        ) as tmp:
-            temp_path = tmp.name
-        try:
-            result = subprocess.run(
-                [
-                    ffmpeg_path,
-                    "-y",
-                    "-i",
-                    filename,
-                    "-vn",
-                    "-acodec",
-                    "pcm_s16le",
-                    temp_path,
-                ],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                return None, None
-            audio, sr = soundfile.read(temp_path, dtype=np.float32)
-            return audio, sr
-        finally:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
-
-    def _read_audio_with_librosa(self, filename: str):
-        try:
-            import librosa
-        except Exception:
-            return None, None
-        try:
-            audio, sr = librosa.load(filename, sr=None, mono=False)
-            return audio, sr
-        except Exception:
-            return None, None
-
-    def _compute_recommendations(self, audio: np.ndarray, sr: int) -> dict:
-        if audio.ndim > 1:
-            samples = audio.mean(axis=0)
-        else:
-            samples = audio
-        duration_sec = len(samples) / max(sr, 1)
-        hop_ms = 20 if duration_sec > 1200 else 10
-        hop_length = max(1, int(sr * hop_ms / 1000))
-        win_length = max(hop_length, min(int(sr * 0.03), 4 * hop_length))
-        rms_list = get_rms(y=samples, frame_length=win_length, hop_length=hop_length).squeeze(0)
-        rms_db = 20 * np.log10(np.clip(rms_list, a_min=1e-12, a_max=None))
-        noise_floor = float(np.percentile(rms_db, 20))
-        threshold_db = float(np.clip(noise_floor + 6.0, -80.0, -10.0))
-
-        silent = rms_db < threshold_db
-        silent_lengths = self._collect_run_lengths(silent)
-        voice_lengths = self._collect_run_lengths(~silent)
-        sil_ms = [int(length * hop_ms) for length in silent_lengths] if silent_lengths else []
-        voice_ms = [int(length * hop_ms) for length in voice_lengths] if voice_lengths else []
-
-        min_interval = int(np.clip(np.percentile(sil_ms, 50), 200, 1200)) if sil_ms else 300
-        max_silence = int(np.clip(np.percentile(sil_ms, 90), 500, 5000)) if sil_ms else 1000
-        min_length = int(np.clip(np.percentile(voice_ms, 20), 500, 8000)) if voice_ms else 5000
-        min_interval = max(min_interval, hop_ms)
-        max_silence = max(max_silence, hop_ms)
-        min_length = max(min_length, min_interval)
-
-        parallel_mode = "thread" if self.ui.lwTaskList.count() > 1 else "single"
-        parallel_jobs = min(4, max(1, (os.cpu_count() or 1)))
-
-        return {
-            "threshold_db": round(threshold_db, 1),
-            "min_length": min_length,
-            "min_interval": min_interval,
-            "hop_size": hop_ms,
-            "max_silence": max_silence,
-            "dynamic_enabled": True,
-            "dynamic_offset_db": 6.0,
-            "vad_enabled": True,
-            "vad_sensitivity_db": 6.0,
-            "vad_hangover_ms": 120,
-            "parallel_mode": parallel_mode,
-            "parallel_jobs": parallel_jobs,
-            "fallback_mode": "ffmpeg_then_librosa",
-        }
-
-    def _collect_run_lengths(self, mask: np.ndarray) -> list[int]:
-        lengths = []
-        count = 0
-        for value in mask:
-            if value:
-                count += 1
-            elif count:
-                lengths.append(count)
-                count = 0
-        if count:
-            lengths.append(count)
-        return lengths
-
     def _format_recommend_message(self, rec: dict) -> str:
         lang = self.current_language
         enabled = i18n.text("recommend_enabled", lang)
@@ -1472,7 +1944,29 @@ class MainWindow(QMainWindow):
             "librosa": i18n.text("fallback_mode_librosa", lang),
             "skip": i18n.text("fallback_mode_skip", lang),
         }.get(rec["fallback_mode"], rec["fallback_mode"])
-        return i18n.text("recommend_message", lang).format(
+        message = i18n.text("recommend_message", lang)
+        intervals = rec.get("intervals")
+        if intervals:
+            bounds = {}
+            for key, name in (
+                ("threshold_db", "threshold"),
+                ("min_length", "min_length"),
+                ("min_interval", "min_interval"),
+                ("max_silence", "max_silence"),
+            ):
+                low, high = intervals[key]
+                bounds[f"{name}_low"] = round(low, 1) if key == "threshold_db" else int(low)
+                bounds[f"{name}_high"] = round(high, 1) if key == "threshold_db" else int(high)
+            confidence = i18n.text("recommend_intervals", lang).format(excerpts=rec["excerpts"], **bounds)
+            message = message.replace("\n\n", f"\n\n{confidence}\n\n", 1)
+        if "score" in rec:
+            tuned = i18n.text("recommend_tuned", lang).format(
+                percent=round(rec["score"] * 100, 1),
+                target_min=rec["target_min_sec"],
+                target_max=rec["target_max_sec"],
+            )
+            message = message.replace("\n\n", f"\n\n{tuned}\n\n", 1)
+        return message.format(
             threshold=rec["threshold_db"],
             min_length=rec["min_length"],
             min_interval=rec["min_interval"],
@@ -1507,44 +2001,19 @@ class MainWindow(QMainWindow):
         if idx >= 0:
             self.ui.cbFallbackMode.setCurrentIndex(idx)
 
-    def _set_preview_image(self, image_path: str):
+    def _set_preview(self, envelope: PeakEnvelope, ranges_ms: list, overlay: AnalysisOverlay | None = None):
+        self._preview_envelope = envelope
         if self._preview_embed:
-            self._preview_pixmap_path = image_path
-            self._update_preview_pixmap()
+            self.labelPreview.setVisible(False)
+            self.previewEmbedded.setVisible(True)
+            self.previewEmbedded.set_style(self._get_theme(), self.current_language)
+            self.previewEmbedded.set_envelope(envelope)
+            self.previewEmbedded.set_overlay(overlay)
+            self.previewEmbedded.set_ranges(ranges_ms)
             return
-        self._show_preview_window(image_path)
+        self._show_preview_window(envelope, ranges_ms, overlay)
 
-    def _update_preview_pixmap(self):
-        if not self._preview_pixmap_path or not self._preview_embed:
-            return
-        pixmap = QPixmap(self._preview_pixmap_path)
-        if pixmap.isNull():
-            return
-        target_size = self.labelPreview.size()
-        scaled = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.labelPreview.setPixmap(scaled)
-        self.labelPreview.setText("")
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self._update_preview_pixmap()
-
-    def eventFilter(self, obj, event):
-        if obj is self._preview_scroll_viewport and event.type() == QEvent.Wheel:
-            if self._preview_zoom_slider:
-                delta = event.angleDelta().y()
-                if delta != 0:
-                    step = 10 if abs(delta) >= 120 else 5
-                    value = self._preview_zoom_slider.value() + (step if delta > 0 else -step)
-                    value = max(self._preview_zoom_slider.minimum(), min(self._preview_zoom_slider.maximum(), value))
-                    self._preview_zoom_slider.setValue(value)
-                return True
-        return super().eventFilter(obj, event)
-
-    def _show_preview_window(self, image_path: str):
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            return
+    def _show_preview_window(self, envelope: PeakEnvelope, ranges_ms: list, overlay: AnalysisOverlay | None = None):
         if self._preview_window is None:
             self._preview_window = QDialog(self)
             if self._style_sheet:
@@ -1556,110 +2025,225 @@ class MainWindow(QMainWindow):
             zoom_row = QHBoxLayout()
             self._preview_zoom_label = QLabel(i18n.text("preview_zoom", self.current_language), self._preview_window)
             self._preview_zoom_slider = QSlider(Qt.Horizontal, self._preview_window)
-            self._preview_zoom_slider.setRange(25, 400)
-            self._preview_zoom_slider.setValue(100)
+            self._preview_zoom_slider.setRange(0, 1000)
+            self._preview_zoom_slider.setValue(0)
             self._preview_zoom_value = QLabel("100%", self._preview_window)
             zoom_row.addWidget(self._preview_zoom_label)
             zoom_row.addWidget(self._preview_zoom_slider, 1)
             zoom_row.addWidget(self._preview_zoom_value)
             layout.addLayout(zoom_row)
-            scroll = QScrollArea(self._preview_window)
-            scroll.setWidgetResizable(True)
-            self._preview_label = QLabel(scroll)
-            self._preview_label.setAlignment(Qt.AlignCenter)
-            self._preview_label.setScaledContents(False)
-            scroll.setWidget(self._preview_label)
-            layout.addWidget(scroll)
+            self._preview_widget = PreviewWidget(self._preview_window)
+            layout.addWidget(self._preview_widget, 1)
             self._preview_zoom_slider.valueChanged.connect(self._on_preview_zoom_changed)
-            self._preview_scroll_viewport = scroll.viewport()
-            if self._preview_scroll_viewport:
-                self._preview_scroll_viewport.installEventFilter(self)
+            self._preview_widget.waveform.zoomChanged.connect(self._on_preview_view_zoomed)
+            self._preview_window.resize(1200, 760)
         else:
             self._preview_window.setWindowTitle(i18n.text("preview", self.current_language))
-        self._preview_original_pixmap = pixmap
-        if self._preview_zoom_slider:
-            self._preview_zoom_slider.setValue(100)
-        self._update_preview_zoom()
-        target_width = min(1400, pixmap.width() + 40)
-        target_height = min(900, pixmap.height() + 60)
-        self._preview_window.resize(target_width, target_height)
+        self._preview_widget.set_style(self._get_theme(), self.current_language)
+        self._preview_widget.set_envelope(envelope)
+        self._preview_widget.set_overlay(overlay)
+        self._preview_widget.set_ranges(ranges_ms)
         self._preview_window.show()
         self._preview_window.raise_()
         self._preview_window.activateWindow()
 
     def _on_preview_zoom_changed(self, value: int):
+        if not self._preview_widget or not self._preview_zoom_slider:
+            return
+        view = self._preview_widget.waveform
+        # Logarithmic slider: the full range always spans fit-to-window .. max detail.
+        view.set_zoom(view.max_zoom() ** (value / self._preview_zoom_slider.maximum()))
+
+    def _on_preview_view_zoomed(self, zoom: float):
         if self._preview_zoom_value:
-            self._preview_zoom_value.setText(f"{value}%")
-        self._update_preview_zoom()
+            self._preview_zoom_value.setText(f"{zoom * 100:.0f}%")
+        if not self._preview_widget or not self._preview_zoom_slider:
+            return
+        max_zoom = self._preview_widget.waveform.max_zoom()
+        value = 0
+        if max_zoom > 1.0:
+            value = round(np.log(zoom) / np.log(max_zoom) * self._preview_zoom_slider.maximum())
+        self._preview_zoom_slider.blockSignals(True)
+        self._preview_zoom_slider.setValue(value)
+        self._preview_zoom_slider.blockSignals(False)
+
+    def _is_preview_visible(self) -> bool:
+        if self._preview_embed:
+            return self.previewEmbedded.isVisible()
+        return self._preview_window is not None and self._preview_window.isVisible()
 
-    def _update_preview_zoom(self):
-        if not self._preview_label or not self._preview_original_pixmap or not self._preview_zoom_slider:
+    def _schedule_live_reslice(self, *args):
+        if self._preview_analysis is None or not self._is_preview_visible():
             return
-        scale = self._preview_zoom_slider.value() / 100.0
-        target_size = self._preview_original_pixmap.size() * scale
-        scaled = self._preview_original_pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self._preview_label.setPixmap(scaled)
+        # Restarting the timer debounces bursts of edits into one computation.
+        self._live_timer.start()
+
+    def _start_live_reslice(self):
+        if self._preview_analysis is None:
+            return
+        try:
+            options = self._collect_processing_options()
+        except ValueError:
+            return
+        if self._live_task:
+            self._live_task.cancel()
+        self._live_task_id += 1
+        task = BackgroundTask(self._live_task_id, _run_preview_reslice, self._preview_analysis, options)
+        task.signals.finished.connect(self._on_live_reslice_finished)
+        self._live_task = task
+        self._live_pool.start(task)
+
+    def _on_live_reslice_finished(self, task_id: int, result):
+        if task_id != self._live_task_id or result is None:
+            return
+        self._live_task = None
+        ranges, overlay = result
+        widget = self.previewEmbedded if self._preview_embed else self._preview_widget
+        if widget:
+            widget.set_overlay(overlay)
+            widget.set_ranges(ranges)
 
     def _on_preview_selection(self):
         if self.processing:
             self._warningProcessNotFinished()
             return
-        item = self.ui.lwTaskList.currentItem()
-        if item is None:
+        filename = self._current_task_path()
+        if filename is None:
             QMessageBox.information(
                 self,
                 QApplication.applicationName(),
                 i18n.text("preview_no_selection", self.current_language),
             )
             return
-        filename = item.data(Qt.ItemDataRole.UserRole + 1)
-        if not filename:
+        try:
+            options = self._collect_processing_options()
+        except ValueError:
+            return
+        self._start_preview_task(filename, options)
+
+    def _start_preview_task(self, filename: str, options: dict, fallback_mode: str | None = None):
+        self._start_analysis_task(
+            "analysis_progress_preview",
+            self._on_preview_task_finished,
+            _run_preview_job,
+            filename,
+            fallback_mode,
+            self.current_language,
+            options,
+            self._analysis_cache_dir(),
+        )
+
+    def _on_preview_task_finished(self, task_id: int, result):
+        if not self._finish_analysis_task(task_id) or result is None:
+            return
+        if "decode_error" in result:
+            choice = self._show_fallback_dialog("preview_read_failed", result["filename"], result["decode_error"])
+            if choice in {"ffmpeg", "librosa"}:
+                self._start_preview_task(result["filename"], result["options"], choice)
+            return
+        self._preview_analysis = result["analysis"]
+        self._set_preview(result["envelope"], result["ranges"], result["overlay"])
+
+    def _on_generate_report(self):
+        if self.processing:
+            self._warningProcessNotFinished()
+            return
+        paths = self.task_model.paths()
+        if not paths:
+            QMessageBox.information(
+                self,
+                QApplication.applicationName(),
+                i18n.text("report_no_files", self.current_language),
+            )
             return
         try:
-            self._preview_with_file(filename)
-        except Exception as exc:
-            self._on_preview_error(filename, str(exc))
-
-    def _preview_with_file(self, filename: str):
-        audio, sr = soundfile.read(filename, dtype=np.float32)
-        if len(audio.shape) > 1:
-            audio = audio.T
-        slicer = Slicer(
-            sr=sr,
-            threshold=float(self.ui.leThreshold.text()),
-            min_length=int(self.ui.leMinLen.text()),
-            min_interval=int(self.ui.leMinInterval.text()),
-            hop_size=int(self.ui.leHopSize.text()),
-            max_sil_kept=int(self.ui.leMaxSilence.text()),
+            options = self._collect_processing_options()
+        except ValueError:
+            return
+        report_dir = QFileDialog.getExistingDirectory(
+            self,
+            i18n.text("report_select_dir", self.current_language),
+            options["output_dir"] or os.path.dirname(paths[0]),
         )
-        rms_list, dynamic_threshold_db, vad_mask = self._build_slice_analysis(slicer, audio)
-        sil_tags, total_frames, waveform_shape = slicer.get_slice_tags(
-            audio,
-            dynamic_threshold_db=dynamic_threshold_db,
-            vad_mask=vad_mask,
-            rms_list=rms_list,
+        if not report_dir:
+            return
+        self._start_analysis_task(
+            "analysis_progress_report",
+            self._on_report_task_finished,
+            _run_report_job,
+            paths,
+            report_dir,
+            options,
+            self._get_theme(),
+            self.current_language,
+            self._analysis_cache_dir(),
         )
-        preview = SlicingPreview(
-            filename=filename,
-            sil_tags=sil_tags,
-            hop_size=int(self.ui.leHopSize.text()),
-            total_frames=total_frames,
-            waveform_shape=waveform_shape,
-            theme=self._get_theme(),
-            language=self.current_language,
+
+    def _on_report_task_finished(self, task_id: int, result):
+        if not self._finish_analysis_task(task_id) or result is None:
+            return
+        ok, error, index_path = result
+        if not ok:
+            QMessageBox.warning(
+                self,
+                i18n.text("warning_title", self.current_language),
+                error or "Unknown error.",
+            )
+            return
+        QDesktopServices.openUrl(QUrl.fromLocalFile(index_path))
+
+    def _start_analysis_task(self, label_key: str, on_finished, fn, *args):
+        # Only one preview/recommendation runs at a time; a new request supersedes the old one.
+        if self._analysis_task:
+            self._analysis_task.cancel()
+        self._analysis_task_id += 1
+        task = BackgroundTask(self._analysis_task_id, fn, *args)
+        task.signals.progress.connect(self._on_analysis_progress)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(self._on_analysis_failed)
+        self._analysis_task = task
+        if self._analysis_progress is None:
+            self._analysis_progress = QProgressDialog(self)
+            self._analysis_progress.setWindowModality(Qt.NonModal)
+            self._analysis_progress.setRange(0, 100)
+            self._analysis_progress.setAutoClose(False)
+            self._analysis_progress.setAutoReset(False)
+            self._analysis_progress.setMinimumDuration(0)
+            self._analysis_progress.canceled.connect(self._on_analysis_canceled)
+        self._analysis_progress.setWindowTitle(QApplication.applicationName())
+        self._analysis_progress.setLabelText(i18n.text(label_key, self.current_language))
+        self._analysis_progress.setCancelButtonText(i18n.text("cancel", self.current_language))
+        self._analysis_progress.setValue(0)
+        self._analysis_progress.show()
+        QThreadPool.globalInstance().start(task)
+
+    def _finish_analysis_task(self, task_id: int) -> bool:
+        if task_id != self._analysis_task_id:
+            return False
+        self._analysis_task = None
+        if self._analysis_progress:
+            self._analysis_progress.hide()
+        return True
+
+    def _on_analysis_progress(self, task_id: int, percent: int):
+        if task_id == self._analysis_task_id and self._analysis_progress:
+            self._analysis_progress.setValue(percent)
+
+    def _on_analysis_failed(self, task_id: int, error: str):
+        if not self._finish_analysis_task(task_id):
+            return
+        QMessageBox.warning(
+            self,
+            i18n.text("warning_title", self.current_language),
+            error,
         )
-        preview_path = os.path.join(tempfile.gettempdir(), "audio_slicer_preview.png")
-        preview.save_plot(preview_path)
-        self._set_preview_image(preview_path)
-
-    def _on_preview_error(self, filename: str, error: str):
-        choice = self._show_fallback_dialog("preview_read_failed", filename, error)
-        if choice == "ffmpeg":
-            self._preview_with_ffmpeg(filename)
-        elif choice == "librosa":
-            self._preview_with_librosa(filename)
-
-    def _show_fallback_dialog(self, prompt_key: str, filename: str, error: str) -> str:
+
+    def _on_analysis_canceled(self):
+        if self._analysis_task:
+            self._analysis_task.cancel()
+            self._finish_analysis_task(self._analysis_task.task_id)
+
+    def _show_fallback_dialog(self, prompt_key: str, filename: str, error: str, **fields) -> str:
         msg = QMessageBox(self)
         msg.setIcon(QMessageBox.Warning)
         msg.setWindowTitle(i18n.text("warning_title", self.current_language))
@@ -1667,6 +2251,7 @@ class MainWindow(QMainWindow):
             i18n.text(prompt_key, self.current_language).format(
                 file=filename,
                 error=error,
+                **fields,
             )
         )
         btn_ffmpeg = msg.addButton(
@@ -1686,110 +2271,21 @@ class MainWindow(QMainWindow):
             return "librosa"
         return "cancel"
 
-    def _preview_with_ffmpeg(self, filename: str):
-        ffmpeg_path = resolve_ffmpeg_path()
-        if not ffmpeg_path:
-            QMessageBox.warning(
-                self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("ffmpeg_not_found", self.current_language),
-            )
-            return
-        with tempfile.NamedTemporaryFile(
-            prefix="audio_slicer_preview_",
-            suffix=".wav",
-            delete=False,
-        ) as tmp:
-            temp_path = tmp.name
-        try:
-            result = subprocess.run(
-                [
-                    ffmpeg_path,
-                    "-y",
-                    "-i",
-                    filename,
-                    "-vn",
-                    "-acodec",
-                    "pcm_s16le",
-                    temp_path,
-                ],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                QMessageBox.warning(
-                    self,
-                    i18n.text("warning_title", self.current_language),
-                    i18n.text("ffmpeg_failed", self.current_language).format(
-                        error=result.stderr.strip() or result.stdout.strip(),
-                    ),
-                )
-                return
-            try:
-                self._preview_with_file(temp_path)
-            except Exception as exc:
-                QMessageBox.warning(
-                    self,
-                    i18n.text("warning_title", self.current_language),
-                    i18n.text("read_failed", self.current_language).format(
-                        file=filename,
-                        error=str(exc),
-                    ),
-                )
-        finally:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
-
-    def _preview_with_librosa(self, filename: str):
-        try:
-            import librosa
-        except Exception as exc:
-            QMessageBox.warning(
-                self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("read_failed", self.current_language).format(
-                    file=filename,
-                    error=str(exc),
-                ),
-            )
-            return
-        try:
-            audio, sr = librosa.load(filename, sr=None, mono=False)
-            if audio.ndim > 1:
-                audio_to_write = audio.T
-            else:
-                audio_to_write = audio
-            with tempfile.NamedTemporaryFile(
-                prefix="audio_slicer_preview_",
-                suffix=".wav",
-                delete=False,
-            ) as tmp:
-                temp_path = tmp.name
-            soundfile.write(temp_path, audio_to_write, sr)
-            try:
-                self._preview_with_file(temp_path)
-            finally:
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
-        except Exception as exc:
-            QMessageBox.warning(
-                self,
-                i18n.text("warning_title", self.current_language),
-                i18n.text("read_failed", self.current_language).format(
-                    file=filename,
-                    error=str(exc),
-                ),
-            )
-
     # Event Handlers
     def closeEvent(self, event):
         if self.processing:
-            self._warningProcessNotFinished()
-            event.ignore()
+            answer = QMessageBox.question(
+                self,
+                QApplication.applicationName(),
+                i18n.text("confirm_stop_and_exit", self.current_language),
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+            self._cancel_processing(hard=True)
+            for worker in self.workers:
+                worker.finished.disconnect(self._threadFinished)
+                worker.wait()
 
     def dragEnterEvent(self, event):
         urls = event.mimeData().urls()
@@ -1799,7 +2295,7 @@ class MainWindow(QMainWindow):
                 continue
             path = url.toLocalFile()
             ext = os.path.splitext(path)[1]
-            if ext[1:].lower() in self.availableFormats:
+            if os.path.isdir(path) or ext[1:].lower() in self.availableFormats:
                 has_wav = True
                 break
         if has_wav:
@@ -1807,16 +2303,143 @@ class MainWindow(QMainWindow):
 
     def dropEvent(self, event):
         urls = event.mimeData().urls()
+        files = []
+        directories = []
         for url in urls:
             if not url.isLocalFile():
                 continue
             path = url.toLocalFile()
+            if os.path.isdir(path):
+                directories.append(path)
+                continue
             ext = os.path.splitext(path)[1]
             if ext[1:].lower() not in self.availableFormats:
                 continue
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(200, 24))
-            item.setText(QFileInfo(path).fileName())
-            item.setData(Qt.ItemDataRole.UserRole + 1,
-                         path)
-            self.ui.lwTaskList.addItem(item)
+            files.append(path)
+        self.task_model.add_paths(files)
+        if directories:
+            self._scan_task_paths(directories)
+
+
+def _run_preview_reslice(task: BackgroundTask, analysis: PreviewAnalysis, options: dict):
+    return analysis.analyze(options, is_cancelled=task.is_cancelled)
+
+
+def _decode_for_analysis(task: BackgroundTask, filename: str, fallback_mode: str | None, language: str):
+    if fallback_mode is None:
+        try:
+            audio, sr = read_audio_with_progress(
+                filename,
+                progress=lambda fraction: task.report_progress(int(fraction * 70)),
+                is_cancelled=task.is_cancelled,
+            )
+        except Exception as exc:
+            return None, None, str(exc)
+    else:
+        audio, sr, error = decode_audio(filename, fallback_mode=fallback_mode, language=language)
+        if audio is None:
+            raise RuntimeError(error or "Decode failed.")
+    if audio is not None and audio.ndim > 1:
+        audio = audio.T
+    task.report_progress(70)
+    return audio, sr, None
+
+
+def _run_preview_job(task: BackgroundTask, filename: str, fallback_mode: str | None, language: str, options: dict,
+                     cache_dir: str):
+    audio, sr, error = _decode_for_analysis(task, filename, fallback_mode, language)
+    if error is not None:
+        return {"filename": filename, "options": options, "decode_error": error}
+    if audio is None or task.is_cancelled():
+        return None
+    analysis = PreviewAnalysis(filename, audio, sr, cache=AnalysisCache(cache_dir))
+    result = analysis.analyze(options, is_cancelled=task.is_cancelled)
+    if result is None:
+        return None
+    task.report_progress(90)
+    envelope = PeakEnvelope(analysis.samples, sr)
+    task.report_progress(100)
+    return {"analysis": analysis, "envelope": envelope, "ranges": result[0], "overlay": result[1]}
+
+
+def _run_recommend_job(task: BackgroundTask, filename: str, fallback_mode: str | None, language: str, task_count: int):
+    audio, sr, error = _decode_for_analysis(task, filename, fallback_mode, language)
+    if error is not None:
+        return {"filename": filename, "decode_error": error}
+    if audio is None or task.is_cancelled():
+        return None
+    recommendation = recommend_for_audio(audio, sr, task_count)
+    task.report_progress(100)
+    return {"recommendation": recommendation}
+
+
+def _run_tune_job(task: BackgroundTask, filename: str, fallback_mode: str | None, language: str, options: dict,
+                  cache_dir: str, target_min: float, target_max: float):
+    envelope = cached_envelope(filename, options, cache_dir) if fallback_mode is None else None
+    if envelope is None:
+        audio, sr, error = _decode_for_analysis(task, filename, fallback_mode, language)
+        if error is not None:
+            return {"filename": filename, "decode_error": error}
+        if audio is None or task.is_cancelled():
+            return None
+        envelope = decoded_envelope(filename, audio, sr, options, cache_dir)
+    rms_list, sr, total_samples = envelope
+    tuned = tune_parameters(
+        rms_list,
+        sr=sr,
+        total_samples=total_samples,
+        hop_size=options["hop_size"],
+        target_min_sec=target_min,
+        target_max_sec=target_max,
+        is_cancelled=task.is_cancelled,
+    )
+    if tuned is None:
+        return None
+    task.report_progress(100)
+    recommendation = dict(options)
+    recommendation.update(tuned, target_min_sec=target_min, target_max_sec=target_max)
+    return {"recommendation": recommendation}
+
+
+def _run_fast_recommend_job(task: BackgroundTask, filename: str, excerpts: int, task_count: int):
+    try:
+        recommendation = recommend_for_file_excerpts(filename, task_count=task_count, excerpts=excerpts)
+    except Exception as exc:
+        # Excerpts need a seekable soundfile format; offer the decoders of the full path instead.
+        return {"filename": filename, "decode_error": str(exc)}
+    if task.is_cancelled():
+        return None
+    task.report_progress(100)
+    return {"recommendation": recommendation}
+
+
+def _run_corpus_recommend_job(task: BackgroundTask, paths: list[str], parallel_mode: str, jobs: int):
+    recommendation, errors = recommend_for_corpus(
+        paths,
+        parallel_mode="process" if parallel_mode == "process" else "thread",
+        jobs=jobs,
+        progress=lambda done, total: task.report_progress(done * 100 // max(total, 1)),
+        is_cancelled=task.is_cancelled,
+    )
+    if task.is_cancelled():
+        return None
+    return {"recommendation": recommendation, "errors": errors}
+
+
+def _run_report_job(task: BackgroundTask, paths: list[str], report_dir: str, options: dict, theme: str,
+                    language: str, cache_dir: str):
+    ok, error, index_path = generate_report(
+        paths,
+        report_dir,
+        options=options,
+        theme=theme,
+        language=language,
+        parallel_mode=options["parallel_mode"],
+        jobs=options["parallel_jobs"],
+        cache_dir=cache_dir,
+        progress=lambda done, total: task.report_progress(done * 100 // max(total, 1)),
+        is_cancelled=task.is_cancelled,
+    )
+    if not ok and error is None:
+        return None
+    return ok, error, index_path
@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class RunProgress:
+    """Counters, file states and errors of one slicing run, shared with the GUI.
+
+    Workers and the coordinating thread update it under a lock instead of
+    emitting a signal per event; the GUI collects everything with ``take`` on
+    a timer, so its cost depends on the poll rate, not on how fast files
+    finish. Only the latest state of each file is kept between two polls.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._finished = 0
+        self._last_output_dir: str | None = None
+        self._started: dict[str, float] = {}
+        self._statuses: dict[str, tuple[str, float | None]] = {}
+        self._errors: list[tuple[str, str]] = []
+
+    def set_status(self, path: str, stage: str):
+        now = time.monotonic()
+        with self._lock:
+            if stage != "queued":
+                self._started.setdefault(path, now)
+            elapsed = now - self._started.get(path, now) if stage in {"done", "failed"} else None
+            self._statuses[path] = (stage, elapsed)
+
+    def file_finished(self, output_dir: str | None = None):
+        with self._lock:
+            self._finished += 1
+            if output_dir:
+                self._last_output_dir = output_dir
+
+    def add_error(self, path: str, error: str):
+        with self._lock:
+            self._errors.append((path, error))
+
+    def take(self) -> tuple[int, str | None, dict[str, tuple[str, float | None]], list[tuple[str, str]]]:
+        """Return ``(finished, last output dir, new states, new errors)`` and reset the batches."""
+        with self._lock:
+            statuses, self._statuses = self._statuses, {}
+            errors, self._errors = self._errors, []
+            return self._finished, self._last_output_dir, statuses, errors
+
+
+class ErrorLogModel(QAbstractListModel):
+    """Errors of a run, one row per file, appended in batches."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._errors: list[tuple[str, str]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._errors)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._errors):
+            return None
+        path, error = self._errors[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            first_line = error.strip().splitlines()[0] if error.strip() else ""
+            return f"{os.path.basename(path)}: {first_line}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{path}\n\n{error}"
+        return None
+
+    def add_errors(self, errors: list[tuple[str, str]]):
+        if not errors:
+            return
+        first = len(self._errors)
+        self.beginInsertRows(QModelIndex(), first, first + len(errors) - 1)
+        self._errors.extend(errors)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._errors = []
+        self.endResetModel()
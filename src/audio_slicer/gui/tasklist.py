@@ -0,0 +1,250 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import soundfile
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QThread, Qt, Signal
+
+from audio_slicer.modules import i18n
+
+PATH_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def scan_audio_files(paths: list[str], extensions: set[str], is_cancelled=None):
+    """Yield the audio files in ``paths``, recursing into directories with ``os.scandir``."""
+
+    def _walk(directory: str):
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            if is_cancelled and is_cancelled():
+                return
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk(entry.path)
+                elif entry.is_file() and entry.name.rsplit(".", maxsplit=1)[-1].lower() in extensions:
+                    yield entry.path
+            except OSError:
+                continue
+
+    for path in paths:
+        if os.path.isdir(path):
+            yield from _walk(path)
+        elif os.path.isfile(path) and path.rsplit(".", maxsplit=1)[-1].lower() in extensions:
+            yield path
+
+
+def probe_audio(path: str) -> dict | None:
+    """Header information of one file, or None when soundfile cannot read it."""
+    try:
+        info = soundfile.info(path)
+    except Exception:
+        return None
+    return {
+        "duration_sec": info.duration,
+        "sample_rate": info.samplerate,
+        "channels": info.channels,
+        # Slicing decodes to float32.
+        "work_bytes": max(info.frames, 0) * info.channels * 4,
+    }
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class TaskScanner(QThread):
+    """Collect audio files below dropped or chosen directories off the GUI thread.
+
+    Paths are emitted through ``found`` in batches, at most every
+    ``interval`` seconds, so the view grows while a large tree is scanned.
+    """
+
+    found = Signal(list)
+
+    def __init__(self, paths: list[str], extensions: set[str], parent=None, *, interval: float = 0.2):
+        super().__init__(parent)
+        self.paths = paths
+        self.extensions = extensions
+        self.interval = interval
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        batch = []
+        last = time.monotonic()
+        for path in scan_audio_files(self.paths, self.extensions, is_cancelled=self._cancelled.is_set):
+            batch.append(path)
+            if time.monotonic() - last >= self.interval:
+                self.found.emit(batch)
+                batch = []
+                last = time.monotonic()
+        if batch and not self._cancelled.is_set():
+            self.found.emit(batch)
+
+
+class TaskListModel(QAbstractListModel):
+    """Task list of source paths with lazily probed header information.
+
+    ``soundfile.info`` runs on a small thread pool only for rows the view
+    asks data for, i.e. the visible ones, newest request first, so adding a
+    whole dataset never blocks the GUI. Paths are unique; adding one twice is
+    a no-op.
+
+    During a run each row also shows its stage, and once finished, how long
+    it took from leaving the queue.
+    """
+
+    probed = Signal(str, object)
+
+    def __init__(self, parent=None, *, probe_workers: int = 4):
+        super().__init__(parent)
+        self.language = "en"
+        self._paths: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._info: dict[str, dict | None] = {}
+        self._status: dict[str, tuple[str, float | None]] = {}
+        self._lock = threading.Lock()
+        self._queue: list[str] = []
+        self._queued: set[str] = set()
+        self._active = 0
+        self._workers = max(1, probe_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="task-probe")
+        self.probed.connect(self._on_probed)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._paths):
+            return None
+        path = self._paths[index.row()]
+        if role == PATH_ROLE:
+            return path
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return path
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        text = os.path.basename(path)
+        if path not in self._info:
+            self._request_probe(path)
+        elif self._info[path] is None:
+            text = f"{text}  ·  ?"
+        else:
+            info = self._info[path]
+            details = i18n.text("task_info", self.language).format(
+                duration=_format_duration(info["duration_sec"]),
+                sample_rate=info["sample_rate"],
+                channels=info["channels"],
+                size=f"{info['work_bytes'] / (1024 * 1024):.0f}",
+            )
+            text = f"{text}  ·  {details}"
+        if path in self._status:
+            stage, elapsed = self._status[path]
+            status = i18n.text(f"task_status_{stage}", self.language)
+            if elapsed is not None:
+                status = f"{status} ({elapsed:.1f} s)"
+            text = f"{text}  —  {status}"
+        return text
+
+    def set_language(self, language: str):
+        self.language = language
+        if self._paths:
+            self.dataChanged.emit(self.index(0), self.index(len(self._paths) - 1), [Qt.ItemDataRole.DisplayRole])
+
+    def reset_status(self, paths: list[str]):
+        """Mark ``paths`` as queued for a new run and drop the statuses of a previous one."""
+        self._status = {path: ("queued", None) for path in paths if path in self._rows}
+        self.set_language(self.language)
+
+    def update_statuses(self, statuses: dict[str, tuple[str, float | None]]):
+        """Apply a batch of ``{path: (stage, elapsed seconds or None)}`` with one ``dataChanged``."""
+        rows = []
+        for path, status in statuses.items():
+            row = self._rows.get(path)
+            if row is not None:
+                self._status[path] = status
+                rows.append(row)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [Qt.ItemDataRole.DisplayRole])
+
+    def paths(self) -> list[str]:
+        return list(self._paths)
+
+    def path(self, row: int) -> str | None:
+        return self._paths[row] if 0 <= row < len(self._paths) else None
+
+    def add_paths(self, paths: list[str]):
+        new_paths = []
+        seen = set()
+        for path in paths:
+            if path not in self._rows and path not in seen:
+                seen.add(path)
+                new_paths.append(path)
+        if not new_paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+        for offset, path in enumerate(new_paths):
+            self._rows[path] = first + offset
+        self._paths.extend(new_paths)
+        self.endInsertRows()
+
+    def remove_row(self, row: int):
+        if not 0 <= row < len(self._paths):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        path = self._paths.pop(row)
+        self._info.pop(path, None)
+        self._status.pop(path, None)
+        self._rows = {p: i for i, p in enumerate(self._paths)}
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._paths = []
+        self._rows = {}
+        self._info = {}
+        self._status = {}
+        with self._lock:
+            self._queue = []
+            self._queued = set()
+        self.endResetModel()
+
+    def _request_probe(self, path: str):
+        with self._lock:
+            if path in self._queued:
+                return
+            self._queued.add(path)
+            self._queue.append(path)
+            if self._active < self._workers:
+                self._active += 1
+                self._executor.submit(self._drain)
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._active -= 1
+                    return
+                # Newest first: rows that were just scrolled into view.
+                path = self._queue.pop()
+            self.probed.emit(path, probe_audio(path))
+
+    def _on_probed(self, path: str, info):
+        with self._lock:
+            self._queued.discard(path)
+        row = self._rows.get(path)
+        if row is None:
+            return
+        self._info[path] = info
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
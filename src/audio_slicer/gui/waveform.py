@@ -0,0 +1,406 @@
+import math
+
+import numpy as np
+from PySide6.QtCore import Qt, QLineF, QPointF, QRectF, Signal
+from PySide6.QtGui import QColor, QPainter, QPen, QTransform
+from PySide6.QtWidgets import (QGraphicsItem, QGraphicsScene, QGraphicsView, QHBoxLayout,
+                               QSizePolicy, QSplitter, QStyleOptionGraphicsItem,
+                               QVBoxLayout, QWidget)
+
+from audio_slicer.utils.preview import (DISTRIBUTION_ITEMS, AnalysisOverlay, PeakEnvelope, dark_theme_palette,
+                                        get_length_distribution, get_length_ranking,
+                                        light_theme_palette, preview_texts)
+
+# Same dB grid as the matplotlib preview.
+_DB_TICKS = [(1.0, "0"), (0.707, "-3"), (0.501, "-6"), (0.355, "-9"), (0.126, "-18")]
+_Y_EXTENT = 1.1
+
+
+def _palette(theme: str) -> dict:
+    return dark_theme_palette if theme == "dark" else light_theme_palette
+
+
+def _visible_range(painter: QPainter, option: QStyleOptionGraphicsItem, duration: float):
+    exposed = option.exposedRect
+    t0 = max(0.0, exposed.left())
+    t1 = min(duration, exposed.right())
+    px_per_sec = abs(painter.worldTransform().m11())
+    return t0, t1, px_per_sec
+
+
+class _WaveformItem(QGraphicsItem):
+    """Draws the cached peak envelope; cached per device transform by Qt."""
+
+    def __init__(self, envelope: PeakEnvelope, color: QColor):
+        super().__init__()
+        self.envelope = envelope
+        self.color = color
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0.0, -1.0, max(self.envelope.duration, 1e-6), 2.0)
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None):
+        t0, t1, px_per_sec = _visible_range(painter, option, self.envelope.duration)
+        if t1 <= t0 or px_per_sec <= 0:
+            return
+        times, mins, maxs = self.envelope.columns(t0, t1, math.ceil((t1 - t0) * px_per_sec))
+        pen = QPen(self.color)
+        pen.setCosmetic(True)
+        pen.setWidth(1)
+        painter.setPen(pen)
+        painter.drawLines([
+            QLineF(t, lo, t, hi)
+            for t, lo, hi in zip(times.tolist(), mins.tolist(), maxs.tolist())
+        ])
+
+
+class _OverlayItem(QGraphicsItem):
+    """RMS envelope and effective threshold, mirrored around zero like the waveform."""
+
+    def __init__(self, duration: float, rms_color: QColor, threshold_color: QColor):
+        super().__init__()
+        self.duration = duration
+        self.rms_color = rms_color
+        self.threshold_color = threshold_color
+        self.overlay: AnalysisOverlay | None = None
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.setZValue(0.5)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0.0, -1.0, max(self.duration, 1e-6), 2.0)
+
+    def set_overlay(self, overlay: AnalysisOverlay | None):
+        self.overlay = overlay
+        self.update()
+
+    def _draw_mirrored(self, painter: QPainter, times, values, color: QColor, style=Qt.SolidLine):
+        if times.shape[0] < 2:
+            return
+        pen = QPen(color, 1, style)
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        times = times.tolist()
+        values = values.tolist()
+        painter.drawPolyline([QPointF(t, v) for t, v in zip(times, values)])
+        painter.drawPolyline([QPointF(t, -v) for t, v in zip(times, values)])
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None):
+        if self.overlay is None:
+            return
+        t0, t1, px_per_sec = _visible_range(painter, option, self.duration)
+        if t1 <= t0 or px_per_sec <= 0:
+            return
+        n_columns = math.ceil((t1 - t0) * px_per_sec)
+        times, _, rms = self.overlay.rms.columns(t0, t1, n_columns)
+        self._draw_mirrored(painter, times, rms, self.rms_color)
+        if self.overlay.threshold is None:
+            return
+        # Minimum per column so frames released by VAD stay visible when zoomed out.
+        times, threshold, _ = self.overlay.threshold.columns(t0, t1, n_columns)
+        self._draw_mirrored(painter, times, threshold, self.threshold_color, Qt.DashLine)
+
+
+class _MarkerItem(QGraphicsItem):
+    """Slice boundaries and labels, kept apart so they can be swapped alone."""
+
+    def __init__(self, duration: float, color: QColor):
+        super().__init__()
+        self.duration = duration
+        self.color = color
+        self.starts = np.zeros(0)
+        self.ends = np.zeros(0)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.setZValue(1)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0.0, -_Y_EXTENT, max(self.duration, 1e-6), 2 * _Y_EXTENT)
+
+    def set_ranges(self, ranges_sec: list):
+        if ranges_sec:
+            arr = np.asarray(ranges_sec, dtype=np.float64)
+            self.starts = arr[:, 0]
+            self.ends = arr[:, 1]
+        else:
+            self.starts = np.zeros(0)
+            self.ends = np.zeros(0)
+        self.update()
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None):
+        if self.starts.shape[0] == 0:
+            return
+        t0, t1, px_per_sec = _visible_range(painter, option, self.duration)
+        first = int(np.searchsorted(self.ends, t0, side="left"))
+        last = int(np.searchsorted(self.starts, t1, side="right"))
+        if last <= first:
+            return
+        pen = QPen(self.color)
+        pen.setCosmetic(True)
+        pen.setWidth(1)
+        painter.setPen(pen)
+        lines = []
+        for t in np.unique(np.concatenate([self.starts[first:last], self.ends[first:last]])).tolist():
+            lines.append(QLineF(t, -_Y_EXTENT, t, _Y_EXTENT))
+        painter.drawLines(lines)
+
+        # Labels are drawn in device coordinates so the flipped y axis does not mirror them.
+        transform = painter.worldTransform()
+        metrics = painter.fontMetrics()
+        label_gap = metrics.horizontalAdvance("#0000") + 4
+        painter.save()
+        painter.resetTransform()
+        painter.setPen(self.color)
+        last_x = -math.inf
+        for i in range(first, last):
+            point = transform.map(QPointF(self.starts[i], 1.0))
+            if point.x() - last_x < label_gap:
+                continue
+            painter.drawText(QPointF(point.x() + 2, point.y() - 2), "#" + str(i))
+            last_x = point.x()
+        painter.restore()
+
+
+class WaveformView(QGraphicsView):
+    """Zoomable waveform with a separately replaceable layer of slice markers."""
+
+    zoomChanged = Signal(float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setScene(QGraphicsScene(self))
+        self.setRenderHint(QPainter.Antialiasing, False)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setMinimumHeight(160)
+        self._palette = _palette("light")
+        self._envelope: PeakEnvelope | None = None
+        self._waveform_item: _WaveformItem | None = None
+        self._overlay_item: _OverlayItem | None = None
+        self._marker_item: _MarkerItem | None = None
+        self._zoom = 1.0
+
+    def set_theme(self, theme: str):
+        self._palette = _palette(theme)
+        self.setBackgroundBrush(QColor(self._palette["figure_background"]))
+        if self._waveform_item:
+            self._waveform_item.color = QColor(self._palette["primary"])
+            self._waveform_item.update()
+        if self._overlay_item:
+            self._overlay_item.rms_color = QColor(self._palette["rms"])
+            self._overlay_item.threshold_color = QColor(self._palette["threshold"])
+            self._overlay_item.update()
+        if self._marker_item:
+            self._marker_item.color = QColor(self._palette["accent"])
+            self._marker_item.update()
+
+    def set_envelope(self, envelope: PeakEnvelope):
+        scene = self.scene()
+        scene.clear()
+        self._envelope = envelope
+        duration = max(envelope.duration, 1e-6)
+        scene.setSceneRect(QRectF(0.0, -_Y_EXTENT, duration, 2 * _Y_EXTENT))
+        self._waveform_item = _WaveformItem(envelope, QColor(self._palette["primary"]))
+        self._overlay_item = _OverlayItem(duration, QColor(self._palette["rms"]), QColor(self._palette["threshold"]))
+        self._marker_item = _MarkerItem(duration, QColor(self._palette["accent"]))
+        scene.addItem(self._waveform_item)
+        scene.addItem(self._overlay_item)
+        scene.addItem(self._marker_item)
+        self._zoom = 1.0
+        self._apply_transform()
+        self.zoomChanged.emit(self._zoom)
+
+    def set_ranges(self, ranges_sec: list):
+        """Replace the slice markers without touching the cached waveform."""
+        if self._marker_item:
+            self._marker_item.set_ranges(ranges_sec)
+
+    def set_overlay(self, overlay: AnalysisOverlay | None):
+        """Replace the RMS/threshold layer without touching the cached waveform."""
+        if self._overlay_item:
+            self._overlay_item.set_overlay(overlay)
+
+    def zoom(self) -> float:
+        return self._zoom
+
+    def max_zoom(self) -> float:
+        if not self._envelope or self._envelope.duration <= 0:
+            return 1.0
+        # Stop once one envelope bucket is a few pixels wide.
+        max_px_per_sec = 4.0 / self._envelope.bucket_seconds(0)
+        return max(1.0, max_px_per_sec / self._fit_px_per_sec())
+
+    def set_zoom(self, zoom: float):
+        zoom = min(max(1.0, zoom), self.max_zoom())
+        if abs(zoom - self._zoom) < 1e-9:
+            return
+        self._zoom = zoom
+        self._apply_transform()
+        self.zoomChanged.emit(self._zoom)
+
+    def _fit_px_per_sec(self) -> float:
+        if not self._envelope or self._envelope.duration <= 0:
+            return 1.0
+        return max(1, self.viewport().width()) / self._envelope.duration
+
+    def _apply_transform(self):
+        height = max(1, self.viewport().height())
+        self.setTransform(QTransform.fromScale(self._fit_px_per_sec() * self._zoom, -height / (2 * _Y_EXTENT)))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._apply_transform()
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.ShiftModifier:
+            super().wheelEvent(event)
+            return
+        delta = event.angleDelta().y()
+        if delta:
+            self.set_zoom(self._zoom * (1.25 ** (delta / 120.0)))
+        event.accept()
+
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        super().drawBackground(painter, rect)
+        pen = QPen(QColor(self._palette["grid"]))
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        lines = [QLineF(rect.left(), 0.0, rect.right(), 0.0)]
+        for level, _ in _DB_TICKS:
+            lines.append(QLineF(rect.left(), level, rect.right(), level))
+            lines.append(QLineF(rect.left(), -level, rect.right(), -level))
+        painter.drawLines(lines)
+
+    def drawForeground(self, painter: QPainter, rect: QRectF):
+        super().drawForeground(painter, rect)
+        transform = painter.worldTransform()
+        painter.save()
+        painter.resetTransform()
+        painter.setPen(QColor(self._palette["axis"]))
+        left = transform.map(QPointF(rect.left(), 0.0)).x() + 4
+        for level, label in _DB_TICKS:
+            for y in (level, -level):
+                point = transform.map(QPointF(rect.left(), y))
+                painter.drawText(QPointF(left, point.y() - 2), label)
+        painter.restore()
+
+
+class BarChart(QWidget):
+    """Small QPainter bar chart used for the length distribution and ranking."""
+
+    def __init__(self, horizontal: bool = False, parent=None):
+        super().__init__(parent)
+        self.horizontal = horizontal
+        self.title = ""
+        self.labels: list[str] = []
+        self.values: list[float] = []
+        self._palette = _palette("light")
+        self.setMinimumSize(200, 140)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def set_theme(self, theme: str):
+        self._palette = _palette(theme)
+        self.update()
+
+    def set_data(self, title: str, labels: list[str], values: list[float]):
+        self.title = title
+        self.labels = list(labels)
+        self.values = list(values)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        palette = self._palette
+        painter.fillRect(self.rect(), QColor(palette["page_background"]))
+        metrics = painter.fontMetrics()
+        title_h = metrics.height() + 6
+        painter.setPen(QColor(palette["title"]))
+        painter.drawText(QRectF(0, 0, self.width(), title_h), Qt.AlignCenter, self.title)
+        area = QRectF(8, title_h, self.width() - 16, self.height() - title_h - 8)
+        painter.fillRect(area, QColor(palette["figure_background"]))
+        painter.setPen(QColor(palette["figure_frame"]))
+        painter.drawRect(area)
+        if not self.values:
+            return
+        max_value = max(max(self.values), 1e-9) / 0.9
+        bar_color = QColor(palette["primary"])
+        count = len(self.values)
+        if self.horizontal:
+            label_w = max(metrics.horizontalAdvance(label) for label in self.labels) + 6
+            plot = area.adjusted(label_w, 4, -4, -4)
+            step = plot.height() / count
+            for i, (label, value) in enumerate(zip(self.labels, self.values)):
+                y = plot.bottom() - (i + 1) * step
+                bar = QRectF(plot.left(), y + step * 0.15, plot.width() * value / max_value, step * 0.7)
+                painter.fillRect(bar, bar_color)
+                painter.setPen(QColor(palette["axis"]))
+                painter.drawText(QRectF(area.left(), y, label_w - 4, step), Qt.AlignRight | Qt.AlignVCenter, label)
+                painter.setPen(QColor(palette["title"]))
+                painter.drawText(QRectF(bar.right() + 2, y, plot.right() - bar.right(), step),
+                                 Qt.AlignLeft | Qt.AlignVCenter, str(value))
+        else:
+            label_h = metrics.height() + 2
+            plot = area.adjusted(4, 4, -4, -label_h)
+            step = plot.width() / count
+            for i, (label, value) in enumerate(zip(self.labels, self.values)):
+                x = plot.left() + i * step
+                bar_h = plot.height() * value / max_value
+                bar = QRectF(x + step * 0.15, plot.bottom() - bar_h, step * 0.7, bar_h)
+                painter.fillRect(bar, bar_color)
+                painter.setPen(QColor(palette["title"]))
+                painter.drawText(QRectF(x, bar.top() - label_h, step, label_h), Qt.AlignCenter, str(value))
+                painter.setPen(QColor(palette["axis"]))
+                painter.drawText(QRectF(x, plot.bottom(), step, label_h), Qt.AlignCenter, label)
+
+
+class PreviewWidget(QWidget):
+    """Waveform view on top, length distribution and ranking below."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.language = "en"
+        self.theme = "light"
+        self.waveform = WaveformView(self)
+        self.distribution = BarChart(False, self)
+        self.ranking = BarChart(True, self)
+        charts = QWidget(self)
+        charts_layout = QHBoxLayout(charts)
+        charts_layout.setContentsMargins(0, 0, 0, 0)
+        charts_layout.addWidget(self.distribution)
+        charts_layout.addWidget(self.ranking)
+        splitter = QSplitter(Qt.Vertical, self)
+        splitter.setChildrenCollapsible(False)
+        splitter.addWidget(self.waveform)
+        splitter.addWidget(charts)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 2)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(splitter, 1)
+
+    def set_style(self, theme: str, language: str):
+        self.theme = theme
+        self.language = language
+        self.waveform.set_theme(theme)
+        self.distribution.set_theme(theme)
+        self.ranking.set_theme(theme)
+
+    def set_envelope(self, envelope: PeakEnvelope):
+        self.waveform.set_envelope(envelope)
+
+    def set_overlay(self, overlay: AnalysisOverlay | None):
+        self.waveform.set_overlay(overlay)
+
+    def set_ranges(self, ranges_ms: list):
+        ranges_sec = [(start / 1000.0, end / 1000.0) for start, end in ranges_ms]
+        lengths = [end - start for start, end in ranges_sec]
+        texts = preview_texts(self.language)
+        self.waveform.set_ranges(ranges_sec)
+        self.distribution.set_data(texts["length_distribution"], DISTRIBUTION_ITEMS,
+                                   get_length_distribution(lengths))
+        items, values = get_length_ranking(lengths)
+        self.ranking.set_data(texts["length_ranking"], items, values)
@@ -0,0 +1,49 @@
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class TaskSignals(QObject):
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+    progress = Signal(int, int)
+
+
+class BackgroundTask(QRunnable):
+    """Runs ``fn(task, *args)`` on a QThreadPool and reports back through signals.
+
+    Every task carries an id so the receiver can drop results of requests that
+    were superseded in the meantime. ``fn`` should poll ``task.is_cancelled()``
+    between expensive stages; results of cancelled tasks are never emitted.
+    """
+
+    def __init__(self, task_id: int, fn, *args):
+        super().__init__()
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.signals = TaskSignals()
+        self._cancelled = threading.Event()
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def report_progress(self, percent: int):
+        if not self.is_cancelled():
+            self.signals.progress.emit(self.task_id, int(percent))
+
+    def run(self):
+        if self.is_cancelled():
+            return
+        try:
+            result = self.fn(self, *self.args)
+        except Exception as exc:
+            if not self.is_cancelled():
+                self.signals.failed.emit(self.task_id, str(exc))
+            return
+        if not self.is_cancelled():
+            self.signals.finished.emit(self.task_id, result)
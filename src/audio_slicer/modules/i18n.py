@@ -1135,41 +1135,6 @@ STRINGS: dict[str, dict[str, str]] = {
         "pt-BR": "Failed to process file:\n{file}\n\n{error}\n\nChoose a fallback method:",
         "it": "Failed to process file:\n{file}\n\n{error}\n\nChoose a fallback method:",
     },
-    "parallel_process_fallback_hint": {
-        "en": "Multi-process mode does not support interactive fallback prompts.\n"
-              "It will switch to \"FFmpeg → Librosa\" automatically.\n"
-              "Continue?",
-        "zh-CN": "多进程模式无法逐个弹窗选择回退方式。\n"
-                 "将自动切换为“FFmpeg → Librosa”。\n"
-                 "是否继续？",
-        "zh-TW": "多行程模式無法逐個彈窗選擇回退方式。\n"
-                 "將自動切換為「FFmpeg → Librosa」。\n"
-                 "是否繼續？",
-        "ja": "マルチプロセスでは個別のフォールバック確認はできません。\n"
-              "自動的に「FFmpeg → Librosa」に切り替えます。\n"
-              "続行しますか？",
-        "ko": "멀티 프로세스에서는 개별 폴백 선택을 지원하지 않습니다.\n"
-              "자동으로 \"FFmpeg → Librosa\"로 전환합니다.\n"
-              "계속하시겠습니까?",
-        "fr": "Le mode multiprocessus ne prend pas en charge les demandes interactives.\n"
-              "Il basculera automatiquement sur « FFmpeg → Librosa ».\n"
-              "Continuer ?",
-        "de": "Im Multi-Process-Modus sind interaktive Rückfragen nicht verfügbar.\n"
-              "Es wird automatisch auf „FFmpeg → Librosa“ umgestellt.\n"
-              "Fortfahren?",
-        "es": "El modo multiproceso no admite confirmaciones interactivas.\n"
-              "Se cambiará automáticamente a \"FFmpeg → Librosa\".\n"
-              "¿Continuar?",
-        "ru": "Многопроцессный режим не поддерживает интерактивные запросы.\n"
-              "Будет автоматически переключено на «FFmpeg → Librosa».\n"
-              "Продолжить?",
-        "pt-BR": "O modo multiprocesso não suporta perguntas interativas.\n"
-                 "Ele alternará automaticamente para \"FFmpeg → Librosa\".\n"
-                 "Continuar?",
-        "it": "La modalità multiprocesso non supporta richieste interattive.\n"
-              "Passerà automaticamente a \"FFmpeg → Librosa\".\n"
-              "Continuare?",
-    },
     "skipped_by_user": {
         "en": "Skipped by user.",
         "zh-CN": "已由用户跳过。",
@@ -1235,38 +1200,38 @@ STRINGS: dict[str, dict[str, str]] = {
         "pt-BR": "FFmpeg conversion failed:\n{error}",
         "it": "FFmpeg conversion failed:\n{error}",
     },
-    "mp3_warning": {
-        "en": "MP3 is not recommended for saving vocals as it is lossy.\n"
+    "lossy_warning": {
+        "en": "{format} is not recommended for saving vocals as it is lossy.\n"
               "If you want to save disk space, consider using FLAC instead.\n"
               "Do you want to continue?",
-        "zh-CN": "不建议使用 MP3 保存人声，因为它是有损格式。\n"
+        "zh-CN": "不建议使用 {format} 保存人声，因为它是有损格式。\n"
                  "如果想节省磁盘空间，建议改用 FLAC。\n"
                  "是否继续？",
-        "zh-TW": "不建議使用 MP3 保存人聲，因為它是有損格式。\n"
+        "zh-TW": "不建議使用 {format} 保存人聲，因為它是有損格式。\n"
                  "若要節省空間，建議改用 FLAC。\n"
                  "是否繼續？",
-        "ja": "MP3 は不可逆圧縮のため、人声の保存にはおすすめしません。\n"
+        "ja": "{format} は不可逆圧縮のため、人声の保存にはおすすめしません。\n"
               "容量を抑えたい場合は FLAC を検討してください。\n"
               "続行しますか？",
-        "ko": "MP3는 손실 압축이라 보컬 저장에 권장되지 않습니다.\n"
+        "ko": "{format}는 손실 압축이라 보컬 저장에 권장되지 않습니다.\n"
               "용량을 줄이려면 FLAC을 고려하세요.\n"
               "계속하시겠습니까?",
-        "fr": "Le MP3 est déconseillé pour les voix car il est destructif.\n"
+        "fr": "Le {format} est déconseillé pour les voix car il est destructif.\n"
               "Pour économiser de l’espace, utilisez plutôt le FLAC.\n"
               "Voulez-vous continuer ?",
-        "de": "MP3 ist für Vocals nicht empfohlen, da es verlustbehaftet ist.\n"
+        "de": "{format} ist für Vocals nicht empfohlen, da es verlustbehaftet ist.\n"
               "Wenn du Speicher sparen willst, nutze lieber FLAC.\n"
               "Fortfahren?",
-        "es": "No se recomienda MP3 para voces porque es con pérdida.\n"
+        "es": "No se recomienda {format} para voces porque es con pérdida.\n"
               "Si quieres ahorrar espacio, usa FLAC.\n"
               "¿Deseas continuar?",
-        "ru": "MP3 не рекомендуется для вокала, так как это формат с потерями.\n"
+        "ru": "{format} не рекомендуется для вокала, так как это формат с потерями.\n"
               "Если хотите сэкономить место, используйте FLAC.\n"
               "Продолжить?",
-        "pt-BR": "MP3 não é recomendado para vocais por ser com perdas.\n"
+        "pt-BR": "{format} não é recomendado para vocais por ser com perdas.\n"
                  "Se quiser economizar espaço, use FLAC.\n"
                  "Deseja continuar?",
-        "it": "MP3 non è consigliato per le voci perché è lossy.\n"
+        "it": "{format} non è consigliato per le voci perché è lossy.\n"
               "Se vuoi risparmiare spazio, usa FLAC.\n"
               "Vuoi continuare?",
     },
@@ -1322,6 +1287,942 @@ STRINGS: dict[str, dict[str, str]] = {
         "pt-BR": "Selecione um arquivo na lista.",
         "it": "Seleziona un file nell'elenco.",
     },
+    "analysis_progress_preview": {
+        "en": "Decoding and analyzing audio for preview...",
+        "zh-CN": "正在解码并分析音频以生成预览...",
+        "zh-TW": "正在解碼並分析音訊以產生預覽...",
+        "ja": "プレビュー用に音声をデコード・解析しています...",
+        "ko": "미리보기를 위해 오디오를 디코딩하고 분석하는 중...",
+        "fr": "Décodage et analyse de l'audio pour l'aperçu...",
+        "de": "Audio wird für die Vorschau dekodiert und analysiert...",
+        "es": "Decodificando y analizando el audio para la vista previa...",
+        "ru": "Декодирование и анализ аудио для предпросмотра...",
+        "pt-BR": "Decodificando e analisando o áudio para a prévia...",
+        "it": "Decodifica e analisi dell'audio per l'anteprima...",
+    },
+    "analysis_progress_recommend": {
+        "en": "Decoding and analyzing audio for recommendations...",
+        "zh-CN": "正在解码并分析音频以生成推荐参数...",
+        "zh-TW": "正在解碼並分析音訊以產生推薦參數...",
+        "ja": "推奨パラメータ用に音声をデコード・解析しています...",
+        "ko": "추천 파라미터를 위해 오디오를 디코딩하고 분석하는 중...",
+        "fr": "Décodage et analyse de l'audio pour les recommandations...",
+        "de": "Audio wird für Empfehlungen dekodiert und analysiert...",
+        "es": "Decodificando y analizando el audio para las recomendaciones...",
+        "ru": "Декодирование и анализ аудио для рекомендаций...",
+        "pt-BR": "Decodificando e analisando o áudio para as recomendações...",
+        "it": "Decodifica e analisi dell'audio per i suggerimenti...",
+    },
+    "cancel": {
+        "en": "Cancel",
+        "zh-CN": "取消",
+        "zh-TW": "取消",
+        "ja": "キャンセル",
+        "ko": "취소",
+        "fr": "Annuler",
+        "de": "Abbrechen",
+        "es": "Cancelar",
+        "ru": "Отмена",
+        "pt-BR": "Cancelar",
+        "it": "Annulla",
+    },
+    "report_button": {
+        "en": "Report",
+        "zh-CN": "生成报告",
+        "zh-TW": "產生報告",
+        "ja": "レポート",
+        "ko": "보고서",
+        "fr": "Rapport",
+        "de": "Bericht",
+        "es": "Informe",
+        "ru": "Отчёт",
+        "pt-BR": "Relatório",
+        "it": "Report",
+    },
+    "report_select_dir": {
+        "en": "Select Report Directory",
+        "zh-CN": "选择报告输出目录",
+        "zh-TW": "選擇報告輸出目錄",
+        "ja": "レポートの出力先を選択",
+        "ko": "보고서 출력 폴더 선택",
+        "fr": "Choisir le dossier du rapport",
+        "de": "Berichtsordner auswählen",
+        "es": "Seleccionar carpeta del informe",
+        "ru": "Выберите папку для отчёта",
+        "pt-BR": "Selecionar pasta do relatório",
+        "it": "Seleziona la cartella del report",
+    },
+    "report_no_files": {
+        "en": "Add audio files before generating a report.",
+        "zh-CN": "请先添加音频文件再生成报告。",
+        "zh-TW": "請先新增音訊檔案再產生報告。",
+        "ja": "レポートを作成する前に音声ファイルを追加してください。",
+        "ko": "보고서를 생성하기 전에 오디오 파일을 추가하세요.",
+        "fr": "Ajoutez des fichiers audio avant de générer un rapport.",
+        "de": "Fügen Sie vor dem Erstellen eines Berichts Audiodateien hinzu.",
+        "es": "Agregue archivos de audio antes de generar un informe.",
+        "ru": "Добавьте аудиофайлы перед созданием отчёта.",
+        "pt-BR": "Adicione arquivos de áudio antes de gerar um relatório.",
+        "it": "Aggiungi file audio prima di generare un report.",
+    },
+    "analysis_progress_report": {
+        "en": "Analyzing files and rendering the preview report...",
+        "zh-CN": "正在分析文件并生成预览报告...",
+        "zh-TW": "正在分析檔案並產生預覽報告...",
+        "ja": "ファイルを解析してプレビューレポートを作成しています...",
+        "ko": "파일을 분석하고 미리보기 보고서를 생성하는 중...",
+        "fr": "Analyse des fichiers et création du rapport d'aperçu...",
+        "de": "Dateien werden analysiert und der Vorschaubericht erstellt...",
+        "es": "Analizando archivos y generando el informe de vista previa...",
+        "ru": "Анализ файлов и создание отчёта предпросмотра...",
+        "pt-BR": "Analisando arquivos e gerando o relatório de prévia...",
+        "it": "Analisi dei file e creazione del report di anteprima...",
+    },
+    "report_title": {
+        "en": "Slicing Preview Report",
+        "zh-CN": "切片预览报告",
+        "zh-TW": "切片預覽報告",
+        "ja": "スライスプレビューレポート",
+        "ko": "슬라이스 미리보기 보고서",
+        "fr": "Rapport d'aperçu du découpage",
+        "de": "Schnittvorschau-Bericht",
+        "es": "Informe de vista previa del corte",
+        "ru": "Отчёт предпросмотра нарезки",
+        "pt-BR": "Relatório de prévia do corte",
+        "it": "Report di anteprima del taglio",
+    },
+    "report_files": {
+        "en": "Files",
+        "zh-CN": "文件数",
+        "zh-TW": "檔案數",
+        "ja": "ファイル数",
+        "ko": "파일 수",
+        "fr": "Fichiers",
+        "de": "Dateien",
+        "es": "Archivos",
+        "ru": "Файлов",
+        "pt-BR": "Arquivos",
+        "it": "File",
+    },
+    "report_slices": {
+        "en": "Slices",
+        "zh-CN": "切片数",
+        "zh-TW": "切片數",
+        "ja": "スライス数",
+        "ko": "슬라이스 수",
+        "fr": "Tranches",
+        "de": "Abschnitte",
+        "es": "Cortes",
+        "ru": "Фрагментов",
+        "pt-BR": "Cortes",
+        "it": "Segmenti",
+    },
+    "report_duration": {
+        "en": "Duration",
+        "zh-CN": "总时长",
+        "zh-TW": "總時長",
+        "ja": "長さ",
+        "ko": "길이",
+        "fr": "Durée",
+        "de": "Dauer",
+        "es": "Duración",
+        "ru": "Длительность",
+        "pt-BR": "Duração",
+        "it": "Durata",
+    },
+    "report_failed": {
+        "en": "Failed files",
+        "zh-CN": "失败的文件",
+        "zh-TW": "失敗的檔案",
+        "ja": "失敗したファイル",
+        "ko": "실패한 파일",
+        "fr": "Fichiers en échec",
+        "de": "Fehlgeschlagene Dateien",
+        "es": "Archivos con error",
+        "ru": "Файлы с ошибками",
+        "pt-BR": "Arquivos com falha",
+        "it": "File non riusciti",
+    },
+    "recommend_scope_file": {
+        "en": "Selected file",
+        "zh-CN": "当前选中文件",
+        "zh-TW": "目前選取的檔案",
+        "ja": "選択中のファイル",
+        "ko": "선택한 파일",
+        "fr": "Fichier sélectionné",
+        "de": "Ausgewählte Datei",
+        "es": "Archivo seleccionado",
+        "ru": "Выбранный файл",
+        "pt-BR": "Arquivo selecionado",
+        "it": "File selezionato",
+    },
+    "recommend_scope_list": {
+        "en": "Whole list (sampled)",
+        "zh-CN": "整个列表（抽样）",
+        "zh-TW": "整個清單（抽樣）",
+        "ja": "リスト全体（サンプリング）",
+        "ko": "전체 목록(샘플링)",
+        "fr": "Toute la liste (échantillonnée)",
+        "de": "Gesamte Liste (Stichprobe)",
+        "es": "Toda la lista (muestreo)",
+        "ru": "Весь список (выборка)",
+        "pt-BR": "Lista inteira (amostragem)",
+        "it": "Intero elenco (campionato)",
+    },
+    "recommend_scope_fast": {
+        "en": "Selected file (fast, sampled)",
+        "zh-CN": "所选文件（快速抽样）",
+        "zh-TW": "所選檔案（快速抽樣）",
+        "ja": "選択したファイル（高速サンプリング）",
+        "ko": "선택한 파일(빠른 샘플링)",
+        "fr": "Fichier sélectionné (rapide, échantillonné)",
+        "de": "Ausgewählte Datei (schnell, Stichprobe)",
+        "es": "Archivo seleccionado (rápido, muestreo)",
+        "ru": "Выбранный файл (быстро, выборка)",
+        "pt-BR": "Arquivo selecionado (rápido, amostragem)",
+        "it": "File selezionato (veloce, campionato)",
+    },
+    "recommend_excerpts": {
+        "en": "Number of evenly spaced excerpts read in fast mode",
+        "zh-CN": "快速模式读取的均匀分布片段数",
+        "zh-TW": "快速模式讀取的均勻分布片段數",
+        "ja": "高速モードで読み込む等間隔の抜粋数",
+        "ko": "빠른 모드에서 읽을 균등 간격 발췌 수",
+        "fr": "Nombre d'extraits régulièrement espacés lus en mode rapide",
+        "de": "Anzahl gleichmäßig verteilter Ausschnitte im Schnellmodus",
+        "es": "Número de fragmentos equiespaciados leídos en modo rápido",
+        "ru": "Число равномерно расположенных фрагментов в быстром режиме",
+        "pt-BR": "Número de trechos igualmente espaçados lidos no modo rápido",
+        "it": "Numero di estratti equidistanti letti in modalità veloce",
+    },
+    "recommend_intervals": {
+        "en": "90% confidence from {excerpts} excerpts:\nThreshold: {threshold_low} to {threshold_high} dB\nMinimum Length: {min_length_low} to {min_length_high} ms\nMinimum Interval: {min_interval_low} to {min_interval_high} ms\nMaximum Silence Length: {max_silence_low} to {max_silence_high} ms",
+        "zh-CN": "基于 {excerpts} 个片段的 90% 置信区间：\n阈值：{threshold_low} 至 {threshold_high} dB\n最小长度：{min_length_low} 至 {min_length_high} ms\n最小间隔：{min_interval_low} 至 {min_interval_high} ms\n最大静音长度：{max_silence_low} 至 {max_silence_high} ms",
+        "zh-TW": "基於 {excerpts} 個片段的 90% 信賴區間：\n閾值：{threshold_low} 至 {threshold_high} dB\n最小長度：{min_length_low} 至 {min_length_high} ms\n最小間隔：{min_interval_low} 至 {min_interval_high} ms\n最大靜音長度：{max_silence_low} 至 {max_silence_high} ms",
+        "ja": "{excerpts} 個の抜粋による 90% 信頼区間：\nしきい値：{threshold_low}～{threshold_high} dB\n最小長：{min_length_low}～{min_length_high} ms\n最小間隔：{min_interval_low}～{min_interval_high} ms\n最大無音長：{max_silence_low}～{max_silence_high} ms",
+        "ko": "발췌 {excerpts}개 기준 90% 신뢰 구간:\n임계값: {threshold_low} ~ {threshold_high} dB\n최소 길이: {min_length_low} ~ {min_length_high} ms\n최소 간격: {min_interval_low} ~ {min_interval_high} ms\n최대 무음 길이: {max_silence_low} ~ {max_silence_high} ms",
+        "fr": "Confiance à 90 % sur {excerpts} extraits :\nSeuil : {threshold_low} à {threshold_high} dB\nLongueur minimale : {min_length_low} à {min_length_high} ms\nIntervalle minimal : {min_interval_low} à {min_interval_high} ms\nSilence maximal : {max_silence_low} à {max_silence_high} ms",
+        "de": "90 %-Konfidenz aus {excerpts} Ausschnitten:\nSchwelle: {threshold_low} bis {threshold_high} dB\nMindestlänge: {min_length_low} bis {min_length_high} ms\nMindestabstand: {min_interval_low} bis {min_interval_high} ms\nMaximale Stille: {max_silence_low} bis {max_silence_high} ms",
+        "es": "Confianza del 90 % con {excerpts} fragmentos:\nUmbral: {threshold_low} a {threshold_high} dB\nLongitud mínima: {min_length_low} a {min_length_high} ms\nIntervalo mínimo: {min_interval_low} a {min_interval_high} ms\nSilencio máximo: {max_silence_low} a {max_silence_high} ms",
+        "ru": "90% доверительный интервал по {excerpts} фрагментам:\nПорог: от {threshold_low} до {threshold_high} дБ\nМин. длина: от {min_length_low} до {min_length_high} мс\nМин. интервал: от {min_interval_low} до {min_interval_high} мс\nМакс. тишина: от {max_silence_low} до {max_silence_high} мс",
+        "pt-BR": "Confiança de 90% com {excerpts} trechos:\nLimiar: {threshold_low} a {threshold_high} dB\nComprimento mínimo: {min_length_low} a {min_length_high} ms\nIntervalo mínimo: {min_interval_low} a {min_interval_high} ms\nSilêncio máximo: {max_silence_low} a {max_silence_high} ms",
+        "it": "Confidenza al 90% su {excerpts} estratti:\nSoglia: da {threshold_low} a {threshold_high} dB\nLunghezza minima: da {min_length_low} a {min_length_high} ms\nIntervallo minimo: da {min_interval_low} a {min_interval_high} ms\nSilenzio massimo: da {max_silence_low} a {max_silence_high} ms",
+    },
+    "dynamic_threshold_window": {
+        "en": "Rolling Window (s)",
+        "zh-CN": "滚动窗口 (秒)",
+        "zh-TW": "滾動視窗 (秒)",
+        "ja": "ローリング窓 (秒)",
+        "ko": "롤링 창 (초)",
+        "fr": "Fenêtre glissante (s)",
+        "de": "Gleitendes Fenster (s)",
+        "es": "Ventana móvil (s)",
+        "ru": "Скользящее окно (с)",
+        "pt-BR": "Janela móvel (s)",
+        "it": "Finestra mobile (s)",
+    },
+    "dynamic_threshold_window_tip": {
+        "en": "Track a drifting noise floor: the dynamic threshold is re-estimated over windows of this length and interpolated between them. 0 uses one threshold for the whole file.",
+        "zh-CN": "跟踪漂移的底噪：按此长度的窗口重新估计动态阈值并在窗口间插值。0 表示整个文件使用同一阈值。",
+        "zh-TW": "追蹤漂移的底噪：按此長度的視窗重新估計動態閾值並在視窗間內插。0 表示整個檔案使用同一閾值。",
+        "ja": "変化するノイズフロアに追従します。この長さの窓ごとに動的しきい値を推定し、窓の間を補間します。0 はファイル全体で 1 つのしきい値を使います。",
+        "ko": "변하는 노이즈 플로어를 추적합니다. 이 길이의 창마다 동적 임계값을 다시 추정하고 창 사이를 보간합니다. 0이면 파일 전체에 하나의 임계값을 사용합니다.",
+        "fr": "Suit un bruit de fond qui dérive : le seuil dynamique est réestimé sur des fenêtres de cette durée et interpolé entre elles. 0 utilise un seul seuil pour tout le fichier.",
+        "de": "Folgt einem driftenden Grundrauschen: Die dynamische Schwelle wird in Fenstern dieser Länge neu geschätzt und dazwischen interpoliert. 0 verwendet eine Schwelle für die ganze Datei.",
+        "es": "Sigue un ruido de fondo variable: el umbral dinámico se reestima en ventanas de esta duración y se interpola entre ellas. 0 usa un único umbral para todo el archivo.",
+        "ru": "Следит за дрейфом уровня шума: динамический порог пересчитывается в окнах этой длины и интерполируется между ними. 0 — один порог на весь файл.",
+        "pt-BR": "Acompanha um ruído de fundo variável: o limiar dinâmico é reestimado em janelas desta duração e interpolado entre elas. 0 usa um único limiar para o arquivo inteiro.",
+        "it": "Segue un rumore di fondo che varia: la soglia dinamica viene ristimata su finestre di questa durata e interpolata tra di esse. 0 usa un'unica soglia per tutto il file.",
+    },
+    "recommend_scope_tune": {
+        "en": "Selected file (match target lengths)",
+        "zh-CN": "所选文件（匹配目标长度）",
+        "zh-TW": "所選檔案（符合目標長度）",
+        "ja": "選択したファイル（目標の長さに合わせる）",
+        "ko": "선택한 파일(목표 길이에 맞춤)",
+        "fr": "Fichier sélectionné (longueurs cibles)",
+        "de": "Ausgewählte Datei (Ziellängen)",
+        "es": "Archivo seleccionado (longitudes objetivo)",
+        "ru": "Выбранный файл (целевая длина)",
+        "pt-BR": "Arquivo selecionado (comprimentos-alvo)",
+        "it": "File selezionato (lunghezze obiettivo)",
+    },
+    "recommend_target_min": {
+        "en": "Shortest target slice length",
+        "zh-CN": "目标切片最短长度",
+        "zh-TW": "目標切片最短長度",
+        "ja": "目標とするスライスの最短長",
+        "ko": "목표 슬라이스 최소 길이",
+        "fr": "Longueur cible minimale des segments",
+        "de": "Kürzeste Ziellänge der Abschnitte",
+        "es": "Longitud mínima objetivo de los fragmentos",
+        "ru": "Минимальная целевая длина фрагмента",
+        "pt-BR": "Comprimento mínimo desejado dos trechos",
+        "it": "Lunghezza minima desiderata dei segmenti",
+    },
+    "recommend_target_max": {
+        "en": "Longest target slice length",
+        "zh-CN": "目标切片最长长度",
+        "zh-TW": "目標切片最長長度",
+        "ja": "目標とするスライスの最長長",
+        "ko": "목표 슬라이스 최대 길이",
+        "fr": "Longueur cible maximale des segments",
+        "de": "Längste Ziellänge der Abschnitte",
+        "es": "Longitud máxima objetivo de los fragmentos",
+        "ru": "Максимальная целевая длина фрагмента",
+        "pt-BR": "Comprimento máximo desejado dos trechos",
+        "it": "Lunghezza massima desiderata dei segmenti",
+    },
+    "recommend_tuned": {
+        "en": "With these settings {percent}% of the sliced audio is in slices of {target_min} to {target_max} s.",
+        "zh-CN": "使用这些参数时，{percent}% 的切片音频落在 {target_min} 至 {target_max} 秒的切片中。",
+        "zh-TW": "使用這些參數時，{percent}% 的切片音訊落在 {target_min} 至 {target_max} 秒的切片中。",
+        "ja": "この設定では、スライスされた音声の {percent}% が {target_min}～{target_max} 秒のスライスに収まります。",
+        "ko": "이 설정에서는 잘린 오디오의 {percent}%가 {target_min}~{target_max}초 길이의 슬라이스에 들어갑니다.",
+        "fr": "Avec ces réglages, {percent} % de l'audio découpé se trouve dans des segments de {target_min} à {target_max} s.",
+        "de": "Mit diesen Einstellungen liegen {percent} % des geschnittenen Audios in Abschnitten von {target_min} bis {target_max} s.",
+        "es": "Con estos ajustes, el {percent} % del audio cortado queda en fragmentos de {target_min} a {target_max} s.",
+        "ru": "С этими настройками {percent}% нарезанного аудио попадает во фрагменты длиной от {target_min} до {target_max} с.",
+        "pt-BR": "Com estas configurações, {percent}% do áudio cortado fica em trechos de {target_min} a {target_max} s.",
+        "it": "Con queste impostazioni il {percent}% dell'audio tagliato è in segmenti da {target_min} a {target_max} s.",
+    },
+    "output_mode": {
+        "en": "Output Mode",
+        "zh-CN": "输出方式",
+        "zh-TW": "輸出方式",
+        "ja": "出力方式",
+        "ko": "출력 방식",
+        "fr": "Mode de sortie",
+        "de": "Ausgabemodus",
+        "es": "Modo de salida",
+        "ru": "Режим вывода",
+        "pt-BR": "Modo de saída",
+        "it": "Modalità di output",
+    },
+    "output_mode_files": {
+        "en": "One file per slice",
+        "zh-CN": "每个切片一个文件",
+        "zh-TW": "每個切片一個檔案",
+        "ja": "スライスごとに 1 ファイル",
+        "ko": "슬라이스마다 파일 하나",
+        "fr": "Un fichier par segment",
+        "de": "Eine Datei pro Abschnitt",
+        "es": "Un archivo por fragmento",
+        "ru": "Один файл на фрагмент",
+        "pt-BR": "Um arquivo por trecho",
+        "it": "Un file per segmento",
+    },
+    "output_mode_shards": {
+        "en": "Tar shards (WebDataset)",
+        "zh-CN": "Tar 分片（WebDataset）",
+        "zh-TW": "Tar 分片（WebDataset）",
+        "ja": "Tar シャード（WebDataset）",
+        "ko": "Tar 샤드(WebDataset)",
+        "fr": "Archives tar (WebDataset)",
+        "de": "Tar-Shards (WebDataset)",
+        "es": "Fragmentos tar (WebDataset)",
+        "ru": "Tar-шарды (WebDataset)",
+        "pt-BR": "Shards tar (WebDataset)",
+        "it": "Shard tar (WebDataset)",
+    },
+    "shard_size": {
+        "en": "Shard Size (MB)",
+        "zh-CN": "分片大小 (MB)",
+        "zh-TW": "分片大小 (MB)",
+        "ja": "シャードサイズ (MB)",
+        "ko": "샤드 크기 (MB)",
+        "fr": "Taille d'archive (Mo)",
+        "de": "Shard-Größe (MB)",
+        "es": "Tamaño de fragmento (MB)",
+        "ru": "Размер шарда (МБ)",
+        "pt-BR": "Tamanho do shard (MB)",
+        "it": "Dimensione shard (MB)",
+    },
+    "shard_size_tip": {
+        "en": "Slices are appended to shards/slices-NNNNNN.tar in the output directory, each with a .json metadata member; a new shard is started at this size. The .idx.jsonl file next to each shard gives the byte offset of every slice.",
+        "zh-CN": "切片会追加到输出目录下的 shards/slices-NNNNNN.tar 中，并附带 .json 元数据；达到该大小后开始新的分片。每个分片旁的 .idx.jsonl 文件记录了每个切片的字节偏移。",
+        "zh-TW": "切片會附加到輸出目錄下的 shards/slices-NNNNNN.tar 中，並附帶 .json 中繼資料；達到此大小後開始新的分片。每個分片旁的 .idx.jsonl 檔案記錄了每個切片的位元組偏移。",
+        "ja": "スライスは出力フォルダーの shards/slices-NNNNNN.tar に .json メタデータとともに追記され、このサイズに達すると新しいシャードになります。各シャード横の .idx.jsonl に各スライスのバイトオフセットが記録されます。",
+        "ko": "슬라이스는 출력 폴더의 shards/slices-NNNNNN.tar에 .json 메타데이터와 함께 추가되며, 이 크기에 도달하면 새 샤드를 시작합니다. 각 샤드 옆의 .idx.jsonl 파일에 슬라이스별 바이트 오프셋이 기록됩니다.",
+        "fr": "Les segments sont ajoutés à shards/slices-NNNNNN.tar dans le dossier de sortie, chacun avec un membre .json de métadonnées ; une nouvelle archive commence à cette taille. Le fichier .idx.jsonl à côté de chaque archive donne la position de chaque segment.",
+        "de": "Abschnitte werden an shards/slices-NNNNNN.tar im Ausgabeordner angehängt, jeweils mit einem .json-Metadateneintrag; ab dieser Größe beginnt ein neuer Shard. Die .idx.jsonl-Datei neben jedem Shard enthält den Byte-Offset jedes Abschnitts.",
+        "es": "Los fragmentos se añaden a shards/slices-NNNNNN.tar en la carpeta de salida, cada uno con un miembro .json de metadatos; al llegar a este tamaño se empieza otro. El archivo .idx.jsonl junto a cada uno indica la posición en bytes de cada fragmento.",
+        "ru": "Фрагменты дописываются в shards/slices-NNNNNN.tar в папке вывода вместе с .json-метаданными; при достижении этого размера начинается новый шард. Файл .idx.jsonl рядом с шардом содержит байтовое смещение каждого фрагмента.",
+        "pt-BR": "Os trechos são anexados a shards/slices-NNNNNN.tar na pasta de saída, cada um com um membro .json de metadados; ao atingir este tamanho um novo shard é iniciado. O arquivo .idx.jsonl ao lado de cada shard traz o deslocamento em bytes de cada trecho.",
+        "it": "I segmenti vengono aggiunti a shards/slices-NNNNNN.tar nella cartella di output, ciascuno con un membro .json di metadati; a questa dimensione si inizia un nuovo shard. Il file .idx.jsonl accanto a ogni shard indica l'offset in byte di ogni segmento.",
+    },
+    "output_mode_index": {
+        "en": "Slice list only (no audio)",
+        "zh-CN": "仅切片列表（不输出音频）",
+        "zh-TW": "僅切片清單（不輸出音訊）",
+        "ja": "スライス一覧のみ（音声なし）",
+        "ko": "슬라이스 목록만(오디오 없음)",
+        "fr": "Liste des tranches seule (sans audio)",
+        "de": "Nur Slice-Liste (kein Audio)",
+        "es": "Solo lista de cortes (sin audio)",
+        "ru": "Только список фрагментов (без аудио)",
+        "pt-BR": "Somente lista de cortes (sem áudio)",
+        "it": "Solo elenco delle sezioni (senza audio)",
+    },
+    "export_labels": {
+        "en": "Export Audacity Labels",
+        "zh-CN": "导出 Audacity 标签",
+        "zh-TW": "匯出 Audacity 標籤",
+        "ja": "Audacity ラベルを書き出し",
+        "ko": "Audacity 레이블 내보내기",
+        "fr": "Exporter les étiquettes Audacity",
+        "de": "Audacity-Marken exportieren",
+        "es": "Exportar etiquetas de Audacity",
+        "ru": "Экспорт меток Audacity",
+        "pt-BR": "Exportar rótulos do Audacity",
+        "it": "Esporta etichette Audacity",
+    },
+    "export_cue": {
+        "en": "Export CUE Sheet",
+        "zh-CN": "导出 CUE 文件",
+        "zh-TW": "匯出 CUE 檔案",
+        "ja": "CUE シートを書き出し",
+        "ko": "CUE 시트 내보내기",
+        "fr": "Exporter une feuille CUE",
+        "de": "CUE-Sheet exportieren",
+        "es": "Exportar hoja CUE",
+        "ru": "Экспорт CUE-файла",
+        "pt-BR": "Exportar folha CUE",
+        "it": "Esporta foglio CUE",
+    },
+    "export_manifest": {
+        "en": "Batch Manifest",
+        "zh-CN": "批量清单",
+        "zh-TW": "批次清單",
+        "ja": "一括マニフェスト",
+        "ko": "일괄 매니페스트",
+        "fr": "Manifeste du lot",
+        "de": "Stapel-Manifest",
+        "es": "Manifiesto del lote",
+        "ru": "Общий манифест",
+        "pt-BR": "Manifesto do lote",
+        "it": "Manifesto del lotto",
+    },
+    "export_manifest_tip": {
+        "en": "Collect the slices of all files of a run in one slices_manifest file in the output directory (Parquet when pyarrow is installed, otherwise JSON Lines).",
+        "zh-CN": "将本次所有文件的切片汇总到输出目录中的一个 slices_manifest 文件（安装了 pyarrow 时为 Parquet，否则为 JSON Lines）。",
+        "zh-TW": "將本次所有檔案的切片彙整到輸出目錄中的一個 slices_manifest 檔案（安裝了 pyarrow 時為 Parquet，否則為 JSON Lines）。",
+        "ja": "実行中の全ファイルのスライスを出力フォルダーの slices_manifest ファイル 1 つにまとめます（pyarrow があれば Parquet、なければ JSON Lines）。",
+        "ko": "실행한 모든 파일의 슬라이스를 출력 폴더의 slices_manifest 파일 하나에 모읍니다(pyarrow가 설치되어 있으면 Parquet, 아니면 JSON Lines).",
+        "fr": "Regroupe les tranches de tous les fichiers d'une exécution dans un seul fichier slices_manifest du dossier de sortie (Parquet si pyarrow est installé, sinon JSON Lines).",
+        "de": "Sammelt die Slices aller Dateien eines Laufs in einer slices_manifest-Datei im Ausgabeordner (Parquet, wenn pyarrow installiert ist, sonst JSON Lines).",
+        "es": "Reúne los cortes de todos los archivos de una ejecución en un único archivo slices_manifest en la carpeta de salida (Parquet si pyarrow está instalado; si no, JSON Lines).",
+        "ru": "Собирает фрагменты всех файлов запуска в один файл slices_manifest в папке вывода (Parquet при установленном pyarrow, иначе JSON Lines).",
+        "pt-BR": "Reúne os cortes de todos os arquivos de uma execução em um único arquivo slices_manifest na pasta de saída (Parquet se o pyarrow estiver instalado; caso contrário, JSON Lines).",
+        "it": "Raccoglie le sezioni di tutti i file di un'esecuzione in un unico file slices_manifest nella cartella di output (Parquet se pyarrow è installato, altrimenti JSON Lines).",
+    },
+    "output_sample_rate": {
+        "en": "Output Sample Rate",
+        "zh-CN": "输出采样率",
+        "zh-TW": "輸出取樣率",
+        "ja": "出力サンプルレート",
+        "ko": "출력 샘플 레이트",
+        "fr": "Fréquence d'échantillonnage de sortie",
+        "de": "Ausgabe-Abtastrate",
+        "es": "Frecuencia de muestreo de salida",
+        "ru": "Частота дискретизации вывода",
+        "pt-BR": "Taxa de amostragem de saída",
+        "it": "Frequenza di campionamento in uscita",
+    },
+    "output_channels": {
+        "en": "Output Channels",
+        "zh-CN": "输出声道",
+        "zh-TW": "輸出聲道",
+        "ja": "出力チャンネル",
+        "ko": "출력 채널",
+        "fr": "Canaux de sortie",
+        "de": "Ausgabekanäle",
+        "es": "Canales de salida",
+        "ru": "Каналы вывода",
+        "pt-BR": "Canais de saída",
+        "it": "Canali in uscita",
+    },
+    "output_channels_mono": {
+        "en": "Mono",
+        "zh-CN": "单声道",
+        "zh-TW": "單聲道",
+        "ja": "モノラル",
+        "ko": "모노",
+        "fr": "Mono",
+        "de": "Mono",
+        "es": "Mono",
+        "ru": "Моно",
+        "pt-BR": "Mono",
+        "it": "Mono",
+    },
+    "output_keep_source": {
+        "en": "Same as source",
+        "zh-CN": "与源文件相同",
+        "zh-TW": "與來源檔案相同",
+        "ja": "元ファイルと同じ",
+        "ko": "원본과 동일",
+        "fr": "Identique à la source",
+        "de": "Wie Quelle",
+        "es": "Igual que el origen",
+        "ru": "Как в исходном файле",
+        "pt-BR": "Igual à origem",
+        "it": "Come la sorgente",
+    },
+    "output_subtype": {
+        "en": "Sample Format",
+        "zh-CN": "采样格式",
+        "zh-TW": "取樣格式",
+        "ja": "サンプル形式",
+        "ko": "샘플 형식",
+        "fr": "Format d'échantillon",
+        "de": "Sampleformat",
+        "es": "Formato de muestra",
+        "ru": "Формат сэмплов",
+        "pt-BR": "Formato de amostra",
+        "it": "Formato dei campioni",
+    },
+    "output_subtype_tip": {
+        "en": "Sample format of wav/flac slices. FLAC supports PCM_16 and PCM_24 only; ignored for list-only output.",
+        "zh-CN": "wav/flac 切片的采样格式。FLAC 仅支持 PCM_16 和 PCM_24；仅输出列表时忽略。",
+        "zh-TW": "wav/flac 切片的取樣格式。FLAC 僅支援 PCM_16 和 PCM_24；僅輸出清單時忽略。",
+        "ja": "wav/flac スライスのサンプル形式。FLAC は PCM_16 と PCM_24 のみ対応。一覧のみの出力では無視されます。",
+        "ko": "wav/flac 슬라이스의 샘플 형식입니다. FLAC은 PCM_16과 PCM_24만 지원하며, 목록만 출력할 때는 무시됩니다.",
+        "fr": "Format d'échantillon des tranches wav/flac. FLAC ne prend en charge que PCM_16 et PCM_24 ; ignoré pour la liste seule.",
+        "de": "Sampleformat von wav/flac-Slices. FLAC unterstützt nur PCM_16 und PCM_24; bei reiner Slice-Liste ignoriert.",
+        "es": "Formato de muestra de los cortes wav/flac. FLAC solo admite PCM_16 y PCM_24; se ignora con solo lista.",
+        "ru": "Формат сэмплов фрагментов wav/flac. FLAC поддерживает только PCM_16 и PCM_24; при выводе только списка не учитывается.",
+        "pt-BR": "Formato de amostra dos cortes wav/flac. FLAC aceita apenas PCM_16 e PCM_24; ignorado com somente lista.",
+        "it": "Formato dei campioni delle sezioni wav/flac. FLAC supporta solo PCM_16 e PCM_24; ignorato con il solo elenco.",
+    },
+    "output_subtype_unsupported": {
+        "en": "Sample format {subtype} is not supported for {format} output.",
+        "zh-CN": "{format} 输出不支持采样格式 {subtype}。",
+        "zh-TW": "{format} 輸出不支援取樣格式 {subtype}。",
+        "ja": "{format} 出力はサンプル形式 {subtype} に対応していません。",
+        "ko": "{format} 출력은 샘플 형식 {subtype}을(를) 지원하지 않습니다.",
+        "fr": "Le format d'échantillon {subtype} n'est pas pris en charge en sortie {format}.",
+        "de": "Das Sampleformat {subtype} wird für die Ausgabe als {format} nicht unterstützt.",
+        "es": "El formato de muestra {subtype} no es compatible con la salida {format}.",
+        "ru": "Формат сэмплов {subtype} не поддерживается для вывода в {format}.",
+        "pt-BR": "O formato de amostra {subtype} não é compatível com a saída {format}.",
+        "it": "Il formato dei campioni {subtype} non è supportato per l'uscita {format}.",
+    },
+    "incremental_export": {
+        "en": "Skip Unchanged Slices",
+        "zh-CN": "跳过未变化的切片",
+        "zh-TW": "略過未變更的切片",
+        "ja": "変更のないスライスを省略",
+        "ko": "변경 없는 슬라이스 건너뛰기",
+        "fr": "Ignorer les tranches inchangées",
+        "de": "Unveränderte Slices überspringen",
+        "es": "Omitir cortes sin cambios",
+        "ru": "Пропускать неизменённые фрагменты",
+        "pt-BR": "Pular cortes inalterados",
+        "it": "Salta le sezioni invariate",
+    },
+    "incremental_export_tip": {
+        "en": "Keep slice files of the previous run whose range and export settings are unchanged, write only new or changed slices and delete slices that are no longer produced (file output only).",
+        "zh-CN": "保留上次运行中范围与导出设置均未变化的切片文件，只写入新增或变化的切片，并删除不再产生的切片（仅限逐文件输出）。",
+        "zh-TW": "保留上次執行中範圍與匯出設定均未變更的切片檔案，只寫入新增或變更的切片，並刪除不再產生的切片（僅限逐檔輸出）。",
+        "ja": "前回の実行で範囲と書き出し設定が変わっていないスライスはそのまま残し、新規・変更分のみ書き込み、不要になったスライスは削除します（ファイル出力のみ）。",
+        "ko": "이전 실행에서 범위와 내보내기 설정이 바뀌지 않은 슬라이스 파일은 유지하고, 새로 생기거나 바뀐 슬라이스만 쓰며, 더 이상 생성되지 않는 슬라이스는 삭제합니다(파일 출력 전용).",
+        "fr": "Conserve les fichiers de l'exécution précédente dont la plage et les réglages d'export n'ont pas changé, n'écrit que les tranches nouvelles ou modifiées et supprime celles qui ne sont plus produites (sortie en fichiers uniquement).",
+        "de": "Behält Slice-Dateien des letzten Laufs mit unverändertem Bereich und Exporteinstellungen, schreibt nur neue oder geänderte Slices und löscht nicht mehr erzeugte (nur Dateiausgabe).",
+        "es": "Conserva los archivos de la ejecución anterior cuyo rango y ajustes de exportación no cambiaron, escribe solo los cortes nuevos o modificados y elimina los que ya no se generan (solo salida en archivos).",
+        "ru": "Сохраняет файлы прошлого запуска с неизменённым диапазоном и настройками экспорта, записывает только новые или изменённые фрагменты и удаляет больше не создаваемые (только вывод в файлы).",
+        "pt-BR": "Mantém os arquivos da execução anterior cujo intervalo e configurações de exportação não mudaram, grava apenas cortes novos ou alterados e remove os que não são mais gerados (somente saída em arquivos).",
+        "it": "Mantiene i file dell'esecuzione precedente con intervallo e impostazioni di esportazione invariati, scrive solo le sezioni nuove o modificate ed elimina quelle non più prodotte (solo output su file).",
+    },
+    "add_folder": {
+        "en": "Add Folder",
+        "zh-CN": "添加文件夹",
+        "zh-TW": "新增資料夾",
+        "ja": "フォルダーを追加",
+        "ko": "폴더 추가",
+        "fr": "Ajouter un dossier",
+        "de": "Ordner hinzufügen",
+        "es": "Agregar carpeta",
+        "ru": "Добавить папку",
+        "pt-BR": "Adicionar pasta",
+        "it": "Aggiungi cartella",
+    },
+    "select_audio_folder": {
+        "en": "Select Audio Folder",
+        "zh-CN": "选择音频文件夹",
+        "zh-TW": "選擇音訊資料夾",
+        "ja": "音声フォルダーを選択",
+        "ko": "오디오 폴더 선택",
+        "fr": "Sélectionner un dossier audio",
+        "de": "Audioordner auswählen",
+        "es": "Seleccionar carpeta de audio",
+        "ru": "Выберите папку с аудио",
+        "pt-BR": "Selecionar pasta de áudio",
+        "it": "Seleziona cartella audio",
+    },
+    "task_info": {
+        "en": "{duration} · {sample_rate} Hz · {channels} ch · ~{size} MB",
+        "zh-CN": "{duration} · {sample_rate} Hz · {channels} 声道 · 约 {size} MB",
+        "zh-TW": "{duration} · {sample_rate} Hz · {channels} 聲道 · 約 {size} MB",
+        "ja": "{duration} · {sample_rate} Hz · {channels} ch · 約 {size} MB",
+        "ko": "{duration} · {sample_rate} Hz · {channels}채널 · 약 {size} MB",
+        "fr": "{duration} · {sample_rate} Hz · {channels} can. · ~{size} Mo",
+        "de": "{duration} · {sample_rate} Hz · {channels} Kan. · ~{size} MB",
+        "es": "{duration} · {sample_rate} Hz · {channels} can. · ~{size} MB",
+        "ru": "{duration} · {sample_rate} Гц · {channels} кан. · ~{size} МБ",
+        "pt-BR": "{duration} · {sample_rate} Hz · {channels} can. · ~{size} MB",
+        "it": "{duration} · {sample_rate} Hz · {channels} can. · ~{size} MB",
+    },
+    "cancelled": {
+        "en": "Cancelled.",
+        "zh-CN": "已取消。",
+        "zh-TW": "已取消。",
+        "ja": "キャンセルされました。",
+        "ko": "취소되었습니다.",
+        "fr": "Annulé.",
+        "de": "Abgebrochen.",
+        "es": "Cancelado.",
+        "ru": "Отменено.",
+        "pt-BR": "Cancelado.",
+        "it": "Annullato.",
+    },
+    "stopping": {
+        "en": "Stopping... (click to force)",
+        "zh-CN": "正在停止…（再次点击强制停止）",
+        "zh-TW": "正在停止…（再次點擊強制停止）",
+        "ja": "停止中…（クリックで強制停止）",
+        "ko": "중지 중... (클릭하여 강제 중지)",
+        "fr": "Arrêt... (cliquer pour forcer)",
+        "de": "Wird gestoppt... (Klicken erzwingt)",
+        "es": "Deteniendo... (clic para forzar)",
+        "ru": "Остановка... (нажмите для принудительной)",
+        "pt-BR": "Parando... (clique para forçar)",
+        "it": "Arresto... (clic per forzare)",
+    },
+    "slicing_cancelled": {
+        "en": "Slicing cancelled.",
+        "zh-CN": "切片已取消。",
+        "zh-TW": "切片已取消。",
+        "ja": "切り出しをキャンセルしました。",
+        "ko": "분할이 취소되었습니다.",
+        "fr": "Découpage annulé.",
+        "de": "Schneiden abgebrochen.",
+        "es": "Corte cancelado.",
+        "ru": "Нарезка отменена.",
+        "pt-BR": "Corte cancelado.",
+        "it": "Taglio annullato.",
+    },
+    "confirm_stop_and_exit": {
+        "en": "Slicing is still running. Stop it and exit?",
+        "zh-CN": "切片仍在进行。要停止并退出吗？",
+        "zh-TW": "切片仍在進行。要停止並退出嗎？",
+        "ja": "切り出しはまだ実行中です。停止して終了しますか？",
+        "ko": "분할이 아직 진행 중입니다. 중지하고 종료할까요?",
+        "fr": "Le découpage est en cours. L'arrêter et quitter ?",
+        "de": "Das Schneiden läuft noch. Abbrechen und beenden?",
+        "es": "El corte sigue en curso. ¿Detenerlo y salir?",
+        "ru": "Нарезка ещё выполняется. Остановить и выйти?",
+        "pt-BR": "O corte ainda está em andamento. Parar e sair?",
+        "it": "Il taglio è ancora in corso. Interromperlo e uscire?",
+    },
+    "task_status_queued": {
+        "en": "queued",
+        "zh-CN": "排队中",
+        "zh-TW": "排隊中",
+        "ja": "待機中",
+        "ko": "대기 중",
+        "fr": "en attente",
+        "de": "wartet",
+        "es": "en cola",
+        "ru": "в очереди",
+        "pt-BR": "na fila",
+        "it": "in coda",
+    },
+    "task_status_running": {
+        "en": "processing",
+        "zh-CN": "处理中",
+        "zh-TW": "處理中",
+        "ja": "処理中",
+        "ko": "처리 중",
+        "fr": "traitement",
+        "de": "verarbeiten",
+        "es": "procesando",
+        "ru": "обработка",
+        "pt-BR": "processando",
+        "it": "elaborazione",
+    },
+    "task_status_decoding": {
+        "en": "decoding",
+        "zh-CN": "解码中",
+        "zh-TW": "解碼中",
+        "ja": "デコード中",
+        "ko": "디코딩 중",
+        "fr": "décodage",
+        "de": "dekodieren",
+        "es": "decodificando",
+        "ru": "декодирование",
+        "pt-BR": "decodificando",
+        "it": "decodifica",
+    },
+    "task_status_slicing": {
+        "en": "slicing",
+        "zh-CN": "切片中",
+        "zh-TW": "切片中",
+        "ja": "切り出し中",
+        "ko": "분할 중",
+        "fr": "découpage",
+        "de": "schneiden",
+        "es": "cortando",
+        "ru": "нарезка",
+        "pt-BR": "cortando",
+        "it": "taglio",
+    },
+    "task_status_writing": {
+        "en": "writing",
+        "zh-CN": "写入中",
+        "zh-TW": "寫入中",
+        "ja": "書き出し中",
+        "ko": "쓰는 중",
+        "fr": "écriture",
+        "de": "schreiben",
+        "es": "escribiendo",
+        "ru": "запись",
+        "pt-BR": "gravando",
+        "it": "scrittura",
+    },
+    "task_status_done": {
+        "en": "done",
+        "zh-CN": "完成",
+        "zh-TW": "完成",
+        "ja": "完了",
+        "ko": "완료",
+        "fr": "terminé",
+        "de": "fertig",
+        "es": "hecho",
+        "ru": "готово",
+        "pt-BR": "concluído",
+        "it": "fatto",
+    },
+    "task_status_failed": {
+        "en": "failed",
+        "zh-CN": "失败",
+        "zh-TW": "失敗",
+        "ja": "失敗",
+        "ko": "실패",
+        "fr": "échec",
+        "de": "fehlgeschlagen",
+        "es": "fallido",
+        "ru": "ошибка",
+        "pt-BR": "falhou",
+        "it": "non riuscito",
+    },
+    "task_status_cancelled": {
+        "en": "cancelled",
+        "zh-CN": "已取消",
+        "zh-TW": "已取消",
+        "ja": "キャンセル",
+        "ko": "취소됨",
+        "fr": "annulé",
+        "de": "abgebrochen",
+        "es": "cancelado",
+        "ru": "отменено",
+        "pt-BR": "cancelado",
+        "it": "annullato",
+    },
+    "task_status_deferred": {
+        "en": "waiting for fallback",
+        "zh-CN": "等待选择替代方式",
+        "zh-TW": "等待選擇替代方式",
+        "ja": "フォールバック待ち",
+        "ko": "대체 방식 대기 중",
+        "fr": "en attente d'un repli",
+        "de": "wartet auf Ausweichlösung",
+        "es": "esperando alternativa",
+        "ru": "ожидает резервного способа",
+        "pt-BR": "aguardando alternativa",
+        "it": "in attesa di alternativa",
+    },
+    "resolve_deferred_files": {
+        "en": "Choose Fallback ({count})",
+        "zh-CN": "选择替代方式（{count}）",
+        "zh-TW": "選擇替代方式（{count}）",
+        "ja": "フォールバックを選択（{count}）",
+        "ko": "대체 방식 선택 ({count})",
+        "fr": "Choisir un repli ({count})",
+        "de": "Ausweichlösung wählen ({count})",
+        "es": "Elegir alternativa ({count})",
+        "ru": "Выбрать резервный способ ({count})",
+        "pt-BR": "Escolher alternativa ({count})",
+        "it": "Scegli alternativa ({count})",
+    },
+    "deferred_read_failed": {
+        "en": "{count} file(s) could not be read:\n{file}\n\n{error}\n\nChoose a fallback method for all of them:",
+        "zh-CN": "有 {count} 个文件无法读取：\n{file}\n\n{error}\n\n请为这些文件选择一种替代方式：",
+        "zh-TW": "有 {count} 個檔案無法讀取：\n{file}\n\n{error}\n\n請為這些檔案選擇一種替代方式：",
+        "ja": "{count} 個のファイルを読み込めませんでした：\n{file}\n\n{error}\n\nすべてに使うフォールバック方法を選択してください：",
+        "ko": "{count}개 파일을 읽을 수 없습니다:\n{file}\n\n{error}\n\n모두에 사용할 대체 방식을 선택하세요:",
+        "fr": "{count} fichier(s) illisible(s) :\n{file}\n\n{error}\n\nChoisissez une méthode de repli pour tous :",
+        "de": "{count} Datei(en) konnten nicht gelesen werden:\n{file}\n\n{error}\n\nAusweichmethode für alle wählen:",
+        "es": "No se pudieron leer {count} archivo(s):\n{file}\n\n{error}\n\nElija un método alternativo para todos:",
+        "ru": "Не удалось прочитать файлов: {count}\n{file}\n\n{error}\n\nВыберите резервный способ для всех:",
+        "pt-BR": "{count} arquivo(s) não puderam ser lidos:\n{file}\n\n{error}\n\nEscolha um método alternativo para todos:",
+        "it": "Impossibile leggere {count} file:\n{file}\n\n{error}\n\nScegli un metodo alternativo per tutti:",
+    },
+    "error_log": {
+        "en": "Errors ({count})",
+        "zh-CN": "错误（{count}）",
+        "zh-TW": "錯誤（{count}）",
+        "ja": "エラー（{count}）",
+        "ko": "오류 ({count})",
+        "fr": "Erreurs ({count})",
+        "de": "Fehler ({count})",
+        "es": "Errores ({count})",
+        "ru": "Ошибки ({count})",
+        "pt-BR": "Erros ({count})",
+        "it": "Errori ({count})",
+    },
+    "slicing_errors": {
+        "en": "{count} file(s) failed; see the error list.",
+        "zh-CN": "{count} 个文件失败，详见错误列表。",
+        "zh-TW": "{count} 個檔案失敗，詳見錯誤清單。",
+        "ja": "{count} 個のファイルが失敗しました。エラー一覧を確認してください。",
+        "ko": "{count}개 파일이 실패했습니다. 오류 목록을 확인하세요.",
+        "fr": "{count} fichier(s) en échec ; voir la liste des erreurs.",
+        "de": "{count} Datei(en) fehlgeschlagen; siehe Fehlerliste.",
+        "es": "{count} archivo(s) fallaron; consulte la lista de errores.",
+        "ru": "Не удалось обработать файлов: {count}; см. список ошибок.",
+        "pt-BR": "{count} arquivo(s) falharam; veja a lista de erros.",
+        "it": "{count} file non riusciti; vedi l'elenco degli errori.",
+    },
+    "vad_mode": {
+        "en": "VAD Engine",
+        "zh-CN": "VAD 引擎",
+        "zh-TW": "VAD 引擎",
+        "ja": "VAD エンジン",
+        "ko": "VAD 엔진",
+        "fr": "Moteur VAD",
+        "de": "VAD-Verfahren",
+        "es": "Motor VAD",
+        "ru": "Движок VAD",
+        "pt-BR": "Mecanismo VAD",
+        "it": "Motore VAD",
+    },
+    "vad_mode_rms": {
+        "en": "Level (RMS)",
+        "zh-CN": "电平（RMS）",
+        "zh-TW": "電平（RMS）",
+        "ja": "レベル（RMS）",
+        "ko": "레벨 (RMS)",
+        "fr": "Niveau (RMS)",
+        "de": "Pegel (RMS)",
+        "es": "Nivel (RMS)",
+        "ru": "Уровень (RMS)",
+        "pt-BR": "Nível (RMS)",
+        "it": "Livello (RMS)",
+    },
+    "vad_mode_spectral": {
+        "en": "Speech band (spectral)",
+        "zh-CN": "语音频段（频谱）",
+        "zh-TW": "語音頻段（頻譜）",
+        "ja": "音声帯域（スペクトル）",
+        "ko": "음성 대역 (스펙트럼)",
+        "fr": "Bande vocale (spectrale)",
+        "de": "Sprachband (spektral)",
+        "es": "Banda de voz (espectral)",
+        "ru": "Речевая полоса (спектр)",
+        "pt-BR": "Banda de voz (espectral)",
+        "it": "Banda vocale (spettrale)",
+    },
+    "vad_mode_tip": {
+        "en": "Level re-thresholds the RMS envelope used for slicing. Speech band measures 300–3400 Hz energy and spectral flatness per hop, so hum and steady broadband noise (HVAC) no longer count as voice; its decision also marks frames outside speech as silence.",
+        "zh-CN": "电平：在切片所用的 RMS 包络上重新设定阈值。语音频段：逐帧计算 300–3400 Hz 能量与频谱平坦度，因此电源嗡声和稳定的宽带噪声（空调等）不再被当作人声；其判定结果也会把非语音帧视为静音。",
+        "zh-TW": "電平：在切片所用的 RMS 包絡上重新設定閾值。語音頻段：逐幀計算 300–3400 Hz 能量與頻譜平坦度，因此電源嗡聲和穩定的寬頻噪聲（空調等）不再被當作人聲；其判定結果也會把非語音幀視為靜音。",
+        "ja": "レベル：切り出しに使う RMS エンベロープを再度しきい値判定します。音声帯域：ホップごとに 300–3400 Hz のエネルギーとスペクトル平坦度を計算するため、ハムや定常的な広帯域ノイズ（空調など）は音声と見なされず、音声以外のフレームは無音として扱われます。",
+        "ko": "레벨: 분할에 쓰는 RMS 엔벨로프에 임계값을 다시 적용합니다. 음성 대역: 홉마다 300–3400 Hz 에너지와 스펙트럼 평탄도를 계산하므로 험이나 일정한 광대역 잡음(공조 등)을 음성으로 보지 않으며, 음성이 아닌 프레임은 무음으로 처리합니다.",
+        "fr": "Niveau : nouveau seuil sur l'enveloppe RMS utilisée pour le découpage. Bande vocale : énergie 300–3400 Hz et planéité spectrale par pas, si bien que le ronflement et le bruit large bande stable (ventilation) ne comptent plus comme voix ; les trames hors parole sont aussi traitées comme silence.",
+        "de": "Pegel: neue Schwelle auf der RMS-Hüllkurve des Schneidens. Sprachband: Energie bei 300–3400 Hz und spektrale Flachheit je Schritt, sodass Brummen und gleichmäßiges Breitbandrauschen (Lüftung) nicht mehr als Stimme gelten; Frames ohne Sprache werden außerdem als Stille behandelt.",
+        "es": "Nivel: vuelve a umbralizar la envolvente RMS usada para cortar. Banda de voz: mide la energía de 300–3400 Hz y la planitud espectral por salto, de modo que el zumbido y el ruido de banda ancha constante (climatización) ya no cuentan como voz; las tramas sin voz también se tratan como silencio.",
+        "ru": "Уровень: повторный порог по RMS-огибающей, используемой для нарезки. Речевая полоса: энергия 300–3400 Гц и спектральная плоскостность на каждом шаге, поэтому фон сети и ровный широкополосный шум (вентиляция) не считаются голосом; кадры без речи также считаются тишиной.",
+        "pt-BR": "Nível: aplica um novo limiar ao envelope RMS usado no corte. Banda de voz: mede a energia em 300–3400 Hz e a planura espectral por salto, assim zumbido e ruído de banda larga constante (ar-condicionado) não contam como voz; quadros sem fala também são tratados como silêncio.",
+        "it": "Livello: nuova soglia sull'inviluppo RMS usato per il taglio. Banda vocale: energia 300–3400 Hz e piattezza spettrale per passo, così ronzio e rumore a banda larga costante (climatizzazione) non contano come voce; i frame senza parlato sono trattati anche come silenzio.",
+    },
+    "slicer_engine": {
+        "en": "Slicing Engine",
+        "zh-CN": "切片引擎",
+        "zh-TW": "切片引擎",
+        "ja": "切り出しエンジン",
+        "ko": "분할 엔진",
+        "fr": "Moteur de découpage",
+        "de": "Schnittverfahren",
+        "es": "Motor de corte",
+        "ru": "Движок нарезки",
+        "pt-BR": "Mecanismo de corte",
+        "it": "Motore di taglio",
+    },
+    "slicer_engine_rms": {
+        "en": "RMS frames",
+        "zh-CN": "RMS 帧",
+        "zh-TW": "RMS 幀",
+        "ja": "RMS フレーム",
+        "ko": "RMS 프레임",
+        "fr": "Trames RMS",
+        "de": "RMS-Frames",
+        "es": "Tramas RMS",
+        "ru": "Кадры RMS",
+        "pt-BR": "Quadros RMS",
+        "it": "Frame RMS",
+    },
+    "slicer_engine_legacy": {
+        "en": "Sample-accurate (legacy)",
+        "zh-CN": "采样点精确（旧版）",
+        "zh-TW": "取樣點精確（舊版）",
+        "ja": "サンプル単位（旧版）",
+        "ko": "샘플 단위 (구버전)",
+        "fr": "Précis à l'échantillon (ancien)",
+        "de": "Samplegenau (alt)",
+        "es": "Precisión de muestra (antiguo)",
+        "ru": "С точностью до сэмпла (старый)",
+        "pt-BR": "Preciso por amostra (antigo)",
+        "it": "Preciso al campione (vecchio)",
+    },
+    "slicer_engine_tip": {
+        "en": "RMS frames cuts on hop frames of the RMS envelope. Sample-accurate is the original slicer: silence is where the peak over the minimum interval stays below the threshold, and cuts land on the quietest sample; the hop size is its short window. Dynamic threshold and VAD do not apply to it.",
+        "zh-CN": "RMS 帧：在 RMS 包络的跳帧上切分。采样点精确：原版切片算法，以最小间隔为窗口的峰值低于阈值处为静音，切点落在最安静的采样点上；跳跃步长作为其短窗口。动态阈值与 VAD 对其不生效。",
+        "zh-TW": "RMS 幀：在 RMS 包絡的跳幀上切分。取樣點精確：原版切片演算法，以最小間隔為視窗的峰值低於閾值處為靜音，切點落在最安靜的取樣點上；跳躍步長作為其短視窗。動態閾值與 VAD 對其不生效。",
+        "ja": "RMS フレーム：RMS エンベロープのホップ単位で切ります。サンプル単位：元の切り出し方式で、最小間隔の窓のピークがしきい値未満の区間を無音とし、最も静かなサンプルで切ります。ホップサイズが短い窓になります。動的しきい値と VAD は適用されません。",
+        "ko": "RMS 프레임: RMS 엔벨로프의 홉 프레임 단위로 자릅니다. 샘플 단위: 원래 분할 방식으로, 최소 간격 창의 피크가 임계값 아래인 구간을 무음으로 보고 가장 조용한 샘플에서 자릅니다. 홉 크기가 짧은 창이 됩니다. 동적 임계값과 VAD는 적용되지 않습니다.",
+        "fr": "Trames RMS : coupe sur les pas de l'enveloppe RMS. Précis à l'échantillon : le découpeur d'origine ; le silence est là où la crête sur l'intervalle minimal reste sous le seuil et la coupe tombe sur l'échantillon le plus calme ; le pas sert de fenêtre courte. Le seuil dynamique et la VAD ne s'appliquent pas.",
+        "de": "RMS-Frames: schneidet auf Schritten der RMS-Hüllkurve. Samplegenau: der ursprüngliche Schneider; Stille ist, wo der Spitzenpegel über den Mindestabstand unter der Schwelle bleibt, und geschnitten wird am leisesten Sample; die Schrittweite ist sein kurzes Fenster. Dynamische Schwelle und VAD gelten hier nicht.",
+        "es": "Tramas RMS: corta en los saltos de la envolvente RMS. Precisión de muestra: el cortador original; el silencio es donde el pico sobre el intervalo mínimo queda bajo el umbral y el corte cae en la muestra más silenciosa; el salto es su ventana corta. El umbral dinámico y el VAD no se aplican.",
+        "ru": "Кадры RMS: резы по шагам RMS-огибающей. С точностью до сэмпла: исходный алгоритм; тишина там, где пик в окне минимального интервала ниже порога, а рез приходится на самый тихий сэмпл; шаг служит коротким окном. Динамический порог и VAD не применяются.",
+        "pt-BR": "Quadros RMS: corta nos saltos do envelope RMS. Preciso por amostra: o cortador original; silêncio é onde o pico no intervalo mínimo fica abaixo do limiar e o corte cai na amostra mais silenciosa; o salto é sua janela curta. Limiar dinâmico e VAD não se aplicam.",
+        "it": "Frame RMS: taglia sui passi dell'inviluppo RMS. Preciso al campione: l'algoritmo di taglio originale; il silenzio è dove il picco sull'intervallo minimo resta sotto soglia e il taglio cade sul campione più silenzioso; il passo è la sua finestra corta. Soglia dinamica e VAD non si applicano.",
+    },
+    "fast_analysis": {
+        "en": "Fast Analysis",
+        "zh-CN": "快速分析",
+        "zh-TW": "快速分析",
+        "ja": "高速解析",
+        "ko": "빠른 분석",
+        "fr": "Analyse rapide",
+        "de": "Schnelle Analyse",
+        "es": "Análisis rápido",
+        "ru": "Быстрый анализ",
+        "pt-BR": "Análise rápida",
+        "it": "Analisi rapida",
+    },
+    "fast_analysis_tip": {
+        "en": "Compute the RMS envelope from ~1 ms block energies, reading the audio once. Exact when hop and window line up with the blocks (the default settings); otherwise frames next to a hard onset can read louder.",
+        "zh-CN": "由约 1 毫秒的分块能量计算 RMS 包络，音频只读取一遍。跳跃步长与窗口能与分块对齐时（默认设置）结果与精确计算一致；否则紧邻突发起音的帧可能偏响。",
+        "zh-TW": "由約 1 毫秒的分塊能量計算 RMS 包絡，音訊只讀取一遍。跳躍步長與視窗能與分塊對齊時（預設設定）結果與精確計算一致；否則緊鄰突發起音的幀可能偏響。",
+        "ja": "約 1 ms のブロックエネルギーから RMS エンベロープを計算し、音声を一度だけ読み込みます。ホップと窓がブロックに揃う場合（既定の設定）は厳密計算と一致し、そうでない場合は急な立ち上がりの直前のフレームが大きめに出ることがあります。",
+        "ko": "약 1 ms 블록 에너지로 RMS 엔벨로프를 계산하여 오디오를 한 번만 읽습니다. 홉과 창이 블록에 맞으면(기본 설정) 정확한 계산과 같고, 그렇지 않으면 급격한 어택 바로 앞 프레임이 더 크게 나올 수 있습니다.",
+        "fr": "Calcule l'enveloppe RMS à partir d'énergies par blocs d'environ 1 ms, en lisant l'audio une seule fois. Exact quand le pas et la fenêtre s'alignent sur les blocs (réglages par défaut) ; sinon, les trames juste avant une attaque franche peuvent paraître plus fortes.",
+        "de": "Berechnet die RMS-Hüllkurve aus Blockenergien von etwa 1 ms und liest das Audio nur einmal. Exakt, wenn Schrittweite und Fenster zu den Blöcken passen (Standardeinstellungen); sonst können Frames direkt vor einem harten Einsatz lauter ausfallen.",
+        "es": "Calcula la envolvente RMS a partir de energías por bloques de ~1 ms, leyendo el audio una sola vez. Exacto cuando el salto y la ventana se alinean con los bloques (ajustes por defecto); si no, las tramas junto a un ataque brusco pueden salir más fuertes.",
+        "ru": "Вычисляет RMS-огибающую по энергиям блоков около 1 мс, читая аудио один раз. Точно, когда шаг и окно совпадают с блоками (настройки по умолчанию); иначе кадры рядом с резкой атакой могут оказаться громче.",
+        "pt-BR": "Calcula o envelope RMS a partir de energias por blocos de ~1 ms, lendo o áudio uma única vez. Exato quando o salto e a janela se alinham aos blocos (configuração padrão); caso contrário, quadros junto a um ataque brusco podem sair mais altos.",
+        "it": "Calcola l'inviluppo RMS dalle energie per blocchi di circa 1 ms, leggendo l'audio una sola volta. Esatto quando passo e finestra si allineano ai blocchi (impostazioni predefinite); altrimenti i frame accanto a un attacco netto possono risultare più forti.",
+    },
 }
 
 
@@ -0,0 +1,342 @@
+import os
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import soundfile
+
+from audio_slicer.utils.cache import default_cache_dir
+from audio_slicer.utils.encoder import encoder_workers
+from audio_slicer.utils.grouping import process_audio_group
+from audio_slicer.utils.manifest import ManifestWriter, parquet_available
+from audio_slicer.utils.processing import process_audio_file
+from audio_slicer.utils.report import generate_report
+from audio_slicer.utils.tuning import tune_file
+
+
+def _audio_extensions() -> set[str]:
+    extensions = {ext.lower() for ext in soundfile.available_formats().keys()}
+    extensions.add("opus")
+    return extensions
+
+
+def collect_audio_files(paths: list[str]) -> list[str]:
+    extensions = _audio_extensions()
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.rsplit(".", maxsplit=1)[-1].lower() in extensions:
+                        files.append(os.path.join(root, name))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            print(f"Not found: {path}", file=sys.stderr)
+    return files
+
+
+def build_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="Slice audio files in batch, or render a preview report for them.")
+    parser.add_argument("paths", nargs="+", help="Audio files or directories (searched recursively).")
+    parser.add_argument("--out", help="Output directory. Defaults to the directory of each source file.")
+    parser.add_argument("--format", default="wav", choices=["wav", "flac", "mp3", "opus", "m4a"],
+                        help="Output format (mp3, opus and m4a are encoded with ffmpeg).")
+    parser.add_argument("--threshold", type=float, default=-40, help="RMS threshold in dB.")
+    parser.add_argument("--min-length", type=int, default=5000, help="Minimum slice length in ms.")
+    parser.add_argument("--min-interval", type=int, default=300, help="Minimum silence length in ms.")
+    parser.add_argument("--hop-size", type=int, default=10, help="RMS hop size in ms.")
+    parser.add_argument("--max-silence", type=int, default=1000, help="Maximum kept silence in ms.")
+    parser.add_argument("--engine", default="rms", choices=["rms", "legacy"],
+                        help="Slicing engine: 'rms' cuts on hop frames of the RMS envelope, 'legacy' at sample "
+                             "positions like scripts/slicer.py (minimum interval and hop size are its long and short "
+                             "window; no dynamic threshold or VAD).")
+    parser.add_argument("--dynamic", action="store_true", help="Enable the dynamic threshold.")
+    parser.add_argument("--dynamic-offset", type=float, default=6, help="Dynamic threshold offset in dB.")
+    parser.add_argument("--dynamic-window", type=float, default=0,
+                        help="Follow a drifting noise floor over windows of this many seconds (0 = one threshold per file).")
+    parser.add_argument("--vad", action="store_true", help="Enable VAD compensation.")
+    parser.add_argument("--vad-mode", default="rms", choices=["rms", "spectral"],
+                        help="VAD engine: re-threshold the RMS envelope, or decide on speech-band energy and "
+                             "spectral flatness (ignores hum and broadband noise).")
+    parser.add_argument("--vad-sensitivity", type=float, default=6, help="VAD sensitivity in dB.")
+    parser.add_argument("--vad-hangover", type=int, default=120, help="VAD hangover in ms.")
+    parser.add_argument("--fast-analysis", action="store_true",
+                        help="Compute the RMS envelope from ~1 ms block energies (exact when the hop and window "
+                             "align with the blocks, otherwise approximate at hard onsets).")
+    parser.add_argument("--parallel", default="process", choices=["single", "thread", "process"],
+                        help="Run files serially, in threads or in processes.")
+    parser.add_argument("--jobs", type=int, default=min(4, os.cpu_count() or 1), help="Number of workers.")
+    parser.add_argument("--fallback", default="ffmpeg_then_librosa",
+                        choices=["ffmpeg_then_librosa", "ffmpeg", "librosa", "skip"],
+                        help="Decoder to use when soundfile cannot read a file.")
+    parser.add_argument("--prefix", default="", help="Output name prefix.")
+    parser.add_argument("--suffix", default="", help="Output name suffix.")
+    parser.add_argument("--timestamp", action="store_true", help="Append a timestamp to output names.")
+    parser.add_argument("--shards", action="store_true",
+                        help="Append slices to WebDataset-style tar shards (OUT/shards) instead of one file per slice.")
+    parser.add_argument("--index-only", action="store_true",
+                        help="Write no audio, only the slice list with sample-exact ranges (JSON unless another "
+                             "list format is chosen).")
+    parser.add_argument("--sample-rate", type=int, help="Resample the slices to this rate in Hz.")
+    parser.add_argument("--mono", action="store_true", help="Mix the slices down to mono.")
+    parser.add_argument("--subtype", choices=["PCM_16", "PCM_24", "PCM_32", "FLOAT"],
+                        help="Sample format of wav/flac slices.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Keep slice files of the previous run whose range and export settings are unchanged "
+                             "and only write new or changed slices.")
+    parser.add_argument("--shard-size", type=int, default=1024, help="Maximum size of a tar shard in MB.")
+    parser.add_argument("--csv", action="store_true", help="Export the slice list as CSV.")
+    parser.add_argument("--json", action="store_true", help="Export the slice list as JSON.")
+    parser.add_argument("--labels", action="store_true", help="Export the slice list as an Audacity label track.")
+    parser.add_argument("--cue", action="store_true", help="Export the slice list as a CUE sheet.")
+    parser.add_argument("--manifest", metavar="PATH",
+                        help="Collect the slices of all files in one manifest (Parquet if PATH ends in .parquet, "
+                             "otherwise JSON Lines).")
+    parser.add_argument("--target-length", type=float, nargs=2, metavar=("MIN", "MAX"),
+                        help="Tune threshold, minimum length, minimum interval and maximum silence per file so "
+                             "that most slices are between MIN and MAX seconds.")
+    parser.add_argument("--group-files", type=int, default=1, metavar="N",
+                        help="Analyse short files (up to 30 s) in groups of N with one batched RMS and silence pass "
+                             "instead of one file at a time. Ignored with --target-length.")
+    parser.add_argument("--report", metavar="DIR",
+                        help="Write a preview report (index.html and images) to DIR instead of slicing.")
+    parser.add_argument("--theme", default="light", choices=["light", "dark"], help="Report image theme.")
+    parser.add_argument("--language", default="en", help="Language of report and error texts.")
+    parser.add_argument("--cache-dir", default=default_cache_dir(),
+                        help="Directory of the RMS analysis cache shared by reports and slicing runs.")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the analysis cache.")
+    return parser
+
+
+def _options_from_args(args) -> dict:
+    return {
+        "threshold_db": args.threshold,
+        "min_length": args.min_length,
+        "min_interval": args.min_interval,
+        "hop_size": args.hop_size,
+        "max_silence": args.max_silence,
+        "slicer_engine": args.engine,
+        "dynamic_enabled": args.dynamic,
+        "dynamic_offset_db": args.dynamic_offset,
+        "dynamic_window_sec": args.dynamic_window,
+        "vad_enabled": args.vad,
+        "vad_mode": args.vad_mode,
+        "vad_sensitivity_db": args.vad_sensitivity,
+        "vad_hangover_ms": args.vad_hangover,
+        "fast_analysis": args.fast_analysis,
+        "parallel_mode": args.parallel,
+        "parallel_jobs": args.jobs,
+        "fallback_mode": args.fallback,
+        "name_prefix": args.prefix,
+        "name_suffix": args.suffix,
+        "name_timestamp": args.timestamp,
+        "export_csv": args.csv,
+        "export_json": args.json,
+        "export_labels": args.labels,
+        "export_cue": args.cue,
+        "export_manifest": bool(args.manifest),
+        "output_dir": args.out,
+        "output_mode": "index" if args.index_only else "shards" if args.shards else "files",
+        "shard_size_mb": args.shard_size,
+        "target_sr": args.sample_rate,
+        "target_channels": 1 if args.mono else None,
+        "output_subtype": args.subtype,
+        "incremental": args.incremental,
+    }
+
+
+def _print_progress(done: int, total: int):
+    print(f"[{done}/{total}]", end="\n" if done == total else "\r", flush=True)
+
+
+def _process_kwargs(options: dict, *, output_ext: str, language: str, cache_dir: str | None) -> dict:
+    return {
+        "output_ext": output_ext,
+        "threshold_db": options["threshold_db"],
+        "min_length": options["min_length"],
+        "min_interval": options["min_interval"],
+        "hop_size": options["hop_size"],
+        "max_silence": options["max_silence"],
+        "slicer_engine": options["slicer_engine"],
+        "fast_analysis": options["fast_analysis"],
+        "dynamic_enabled": options["dynamic_enabled"],
+        "dynamic_offset_db": options["dynamic_offset_db"],
+        "dynamic_window_sec": options["dynamic_window_sec"],
+        "vad_enabled": options["vad_enabled"],
+        "vad_mode": options["vad_mode"],
+        "vad_sensitivity_db": options["vad_sensitivity_db"],
+        "vad_hangover_ms": options["vad_hangover_ms"],
+        "name_prefix": options["name_prefix"],
+        "name_suffix": options["name_suffix"],
+        "name_timestamp": options["name_timestamp"],
+        "export_csv": options["export_csv"],
+        "export_json": options["export_json"],
+        "export_labels": options["export_labels"],
+        "export_cue": options["export_cue"],
+        "export_manifest": options["export_manifest"],
+        "output_dir": options["output_dir"],
+        "fallback_mode": options["fallback_mode"],
+        "language": language,
+        "cache_dir": cache_dir,
+        "output_mode": options["output_mode"],
+        "shard_size_mb": options["shard_size_mb"],
+        "target_sr": options["target_sr"],
+        "target_channels": options["target_channels"],
+        "output_subtype": options["output_subtype"],
+        "incremental": options["incremental"],
+        "encoder_workers": encoder_workers(options["parallel_mode"], options["parallel_jobs"]),
+    }
+
+
+def slice_file(
+    filename: str,
+    options: dict,
+    *,
+    output_ext: str,
+    language: str,
+    cache_dir: str | None,
+    target_length: tuple[float, float] | None = None,
+) -> tuple[bool, str | None, str | None, list[dict]]:
+    if target_length:
+        options, error = tune_file(
+            filename,
+            options=options,
+            target_min_sec=min(target_length),
+            target_max_sec=max(target_length),
+            language=language,
+            cache_dir=cache_dir,
+        )
+        if options is None:
+            return False, error, None, []
+    return process_audio_file(
+        filename,
+        **_process_kwargs(options, output_ext=output_ext, language=language, cache_dir=cache_dir),
+    )
+
+
+def slice_group(
+    filenames: list[str],
+    options: dict,
+    *,
+    output_ext: str,
+    language: str,
+    cache_dir: str | None,
+    target_length: tuple[float, float] | None = None,
+) -> list[tuple[bool, str | None, str | None, list[dict]]]:
+    if target_length or len(filenames) == 1 or options["slicer_engine"] == "legacy":
+        results = []
+        for filename in filenames:
+            try:
+                results.append(slice_file(filename, options, output_ext=output_ext, language=language,
+                                          cache_dir=cache_dir, target_length=target_length))
+            except Exception as exc:
+                results.append((False, str(exc), None, []))
+        return results
+    return process_audio_group(
+        filenames,
+        **_process_kwargs(options, output_ext=output_ext, language=language, cache_dir=cache_dir),
+    )
+
+
+def run_slicing(
+    files: list[str],
+    options: dict,
+    *,
+    output_ext: str,
+    language: str,
+    cache_dir: str | None,
+    target_length: tuple[float, float] | None = None,
+    manifest_path: str | None = None,
+    group_size: int = 1,
+) -> int:
+    kwargs = {
+        "output_ext": output_ext,
+        "language": language,
+        "cache_dir": cache_dir,
+        "target_length": target_length,
+    }
+    failures = 0
+    done = 0
+    total = len(files)
+    size = 1 if target_length else max(1, group_size)
+    groups = [files[start:start + size] for start in range(0, total, size)]
+    manifest = ManifestWriter(manifest_path) if manifest_path else None
+
+    def _finish(group: list[str], results: list[tuple]):
+        nonlocal failures, done
+        for filename, (ok, error, _, records) in zip(group, results):
+            if not ok:
+                failures += 1
+                print(f"Failed: {filename}: {error}", file=sys.stderr)
+            elif manifest is not None:
+                manifest.write(records)
+            done += 1
+            _print_progress(done, total)
+
+    try:
+        if options["parallel_mode"] == "single":
+            for group in groups:
+                try:
+                    results = slice_group(group, options, **kwargs)
+                except Exception as exc:
+                    results = [(False, str(exc), None, [])] * len(group)
+                _finish(group, results)
+        else:
+            executor_cls = ProcessPoolExecutor if options["parallel_mode"] == "process" else ThreadPoolExecutor
+            with executor_cls(max_workers=max(1, options["parallel_jobs"])) as executor:
+                futures = {executor.submit(slice_group, group, options, **kwargs): group for group in groups}
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        results = future.result()
+                    except Exception as exc:
+                        results = [(False, str(exc), None, [])] * len(group)
+                    _finish(group, results)
+    finally:
+        if manifest is not None:
+            manifest.close()
+    print(f"Sliced {total - failures}/{total} files.")
+    if manifest is not None:
+        print(f"Manifest written to {manifest.path} ({manifest.rows} slices)")
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    files = collect_audio_files(args.paths)
+    if not files:
+        print("No audio files found.", file=sys.stderr)
+        return 1
+    if args.manifest and args.manifest.lower().endswith(".parquet") and not parquet_available():
+        print("Writing a Parquet manifest requires pyarrow.", file=sys.stderr)
+        return 1
+    options = _options_from_args(args)
+    cache_dir = None if args.no_cache else args.cache_dir
+    if args.report:
+        ok, error, index_path = generate_report(
+            files,
+            args.report,
+            options=options,
+            theme=args.theme,
+            language=args.language,
+            parallel_mode=args.parallel,
+            jobs=args.jobs,
+            cache_dir=cache_dir,
+            progress=_print_progress,
+        )
+        if not ok:
+            print(f"Report failed: {error}", file=sys.stderr)
+            return 1
+        print(f"Report written to {index_path}")
+        return 0
+    return run_slicing(
+        files,
+        options,
+        output_ext=args.format,
+        language=args.language,
+        cache_dir=cache_dir,
+        target_length=tuple(args.target_length) if args.target_length else None,
+        manifest_path=args.manifest,
+        group_size=args.group_files,
+    )
@@ -0,0 +1,127 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from audio_slicer.utils.slicer2 import Slicer
+
+# Size cap of a cache directory; ``prune`` brings it down to 90 % of it.
+DEFAULT_MAX_CACHE_MB = 512
+
+# Bytes in each cache directory as this process last counted them, plus its own writes since.
+_directory_sizes: dict[str, int] = {}
+_sizes_lock = threading.Lock()
+
+
+def default_cache_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".audio_slicer", "analysis_cache")
+
+
+class AnalysisCache:
+    """On-disk cache of RMS envelopes.
+
+    Entries are keyed by the absolute path, size and modification time of the
+    source file plus the hop and window size in samples (and the block length
+    of the fast analysis), so an edited file or a different hop size simply
+    misses. Writes go through a temporary file and
+    ``os.replace``, which keeps the cache safe to share between worker
+    processes.
+
+    The directory is capped at ``max_bytes``: a hit refreshes the entry's
+    modification time, and once a store takes the directory past the cap
+    the least recently used entries are deleted. Each process counts the
+    directory once and then adds its own writes, so several workers can
+    overshoot the cap by what they write between two counts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_CACHE_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, filename: str, slicer: Slicer) -> str | None:
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        identity = f"{os.path.abspath(filename)}|{stat.st_size}|{stat.st_mtime_ns}|{slicer.hop_size}|{slicer.win_size}"
+        if slicer.rms_block:
+            identity = f"{identity}|{slicer.rms_block}"
+        digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.npy")
+
+    def load(self, filename: str, slicer: Slicer) -> np.ndarray | None:
+        path = self._entry_path(filename, slicer)
+        if path is None or not os.path.isfile(path):
+            return None
+        try:
+            rms_list = np.load(path, allow_pickle=False)
+        except Exception:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return rms_list
+
+    def store(self, filename: str, slicer: Slicer, rms_list: np.ndarray):
+        path = self._entry_path(filename, slicer)
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(path))
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, rms_list, allow_pickle=False)
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        with _sizes_lock:
+            total = _directory_sizes.get(self.directory)
+            if total is not None:
+                total = _directory_sizes[self.directory] = total + size
+        if total is None or total > self.max_bytes:
+            self.prune()
+
+    def prune(self):
+        """Delete the least recently used entries until the cache is within 90 % of ``max_bytes``."""
+        entries = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith(".npy"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+        with _sizes_lock:
+            _directory_sizes[self.directory] = total
+
+    def rms_list(self, filename: str, slicer: Slicer, waveform: np.ndarray) -> np.ndarray:
+        rms_list = self.load(filename, slicer)
+        if rms_list is None:
+            rms_list = slicer.get_rms_list(waveform)
+            self.store(filename, slicer, rms_list)
+        return rms_list
@@ -0,0 +1,119 @@
+import os
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+# Codec arguments per output extension for formats encoded through ffmpeg.
+FFMPEG_CODECS = {
+    "mp3": ["-c:a", "libmp3lame", "-q:a", "2"],
+    "opus": ["-c:a", "libopus", "-b:a", "128k"],
+    "m4a": ["-c:a", "aac", "-b:a", "192k"],
+}
+
+_pool_lock = threading.Lock()
+_pool = None
+
+
+def ffmpeg_encode(chunk: np.ndarray, sr: int, path: str, output_ext: str, ffmpeg_path: str):
+    """Encode one frames-first float chunk to ``path`` by piping raw PCM into ffmpeg."""
+    channels = 1 if chunk.ndim == 1 else chunk.shape[1]
+    data = np.ascontiguousarray(chunk, dtype="<f4").tobytes()
+    result = subprocess.run(
+        [
+            ffmpeg_path,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "f32le",
+            "-ar",
+            str(sr),
+            "-ac",
+            str(channels),
+            "-i",
+            "pipe:0",
+            *FFMPEG_CODECS[output_ext],
+            path,
+        ],
+        input=data,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode(errors="ignore").strip() or "ffmpeg failed.")
+
+
+def ffmpeg_encode_bytes(chunk: np.ndarray, sr: int, output_ext: str, ffmpeg_path: str) -> bytes:
+    # m4a cannot be muxed into a pipe, so go through a temporary file for every format.
+    with tempfile.NamedTemporaryFile(prefix="audio_slicer_encode_", suffix=f".{output_ext}", delete=False) as tmp:
+        temp_path = tmp.name
+    try:
+        ffmpeg_encode(chunk, sr, temp_path, output_ext, ffmpeg_path)
+        with open(temp_path, "rb") as f:
+            return f.read()
+    finally:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+class EncoderPool:
+    """Bounded pool of concurrent ffmpeg encoder processes.
+
+    Each worker thread starts one short-lived ffmpeg process per slice and
+    waits for it, so up to ``max_workers`` slices are encoded on separate
+    cores; there are no long-lived encoders fed over pipes. ``submit`` blocks
+    while ``2 * max_workers`` chunks are already waiting, which keeps the
+    memory held by queued slices bounded.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ffmpeg-encoder")
+        self._slots = threading.BoundedSemaphore(2 * self.max_workers)
+
+    def submit(self, chunk: np.ndarray, sr: int, path: str, output_ext: str, ffmpeg_path: str) -> Future:
+        return self._submit(ffmpeg_encode, chunk, sr, path, output_ext, ffmpeg_path)
+
+    def submit_bytes(self, chunk: np.ndarray, sr: int, output_ext: str, ffmpeg_path: str) -> Future:
+        """Like ``submit``, but the future's result is the encoded file as bytes."""
+        return self._submit(ffmpeg_encode_bytes, chunk, sr, output_ext, ffmpeg_path)
+
+    def _submit(self, fn, *args) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+def encoder_workers(parallel_mode: str, jobs: int) -> int | None:
+    """Encoder pool size for a run; None for one pool per core.
+
+    Process workers each have their own pool, so the cores are shared out
+    between them instead of every worker starting one encoder per core.
+    """
+    if parallel_mode != "process":
+        return None
+    return max(1, (os.cpu_count() or 1) // max(1, jobs))
+
+
+def shared_encoder_pool(max_workers: int | None = None) -> EncoderPool:
+    """The process-wide encoder pool, shared by all files sliced in this process.
+
+    ``max_workers`` only applies when the pool is created by this call.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EncoderPool(max_workers)
+        return _pool
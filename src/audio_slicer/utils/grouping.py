@@ -0,0 +1,237 @@
+import numpy as np
+
+from audio_slicer.utils.processing import analyze_slice_tags, decode_audio, process_audio_file
+from audio_slicer.utils.slicer2 import Slicer, rms_to_db
+
+
+def batched_rms(
+    rows: list[np.ndarray],
+    *,
+    frame_length: int,
+    hop_length: int,
+    block_length: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """RMS envelopes of several mono signals, computed on one zero-padded matrix.
+
+    Frames are the ones ``get_rms`` uses (centred, zero padded). Each frame
+    is the difference of two entries of a cumulative sum of squares, so the
+    whole group takes a handful of array operations. Returns the envelopes
+    as a ``(files, frames)`` array and the frame count of each file; frames
+    past a file's count are 0. With a ``block_length`` the frame edges snap
+    to blocks as in ``get_rms_decimated``, the envelope of the fast analysis.
+    """
+    pad = frame_length // 2
+    lengths = np.array([row.shape[0] for row in rows], dtype=np.int64)
+    counts = np.maximum(1 + (lengths + 2 * pad - frame_length) // hop_length, 0)
+    width = int(lengths.max()) + 2 * pad
+    cumulative = np.zeros((len(rows), width + 1), dtype=np.float64)
+    for i, row in enumerate(rows):
+        cumulative[i, pad + 1: pad + 1 + row.shape[0]] = np.square(row, dtype=np.float64)
+    np.cumsum(cumulative, axis=1, out=cumulative)
+    starts = np.arange(int(counts.max())) * hop_length
+    if block_length:
+        # Snapped edges in samples of the rows; ``cumulative[:, pad + k]`` sums the first k samples.
+        low = (starts - pad + block_length // 2) // block_length * block_length
+        high = (starts - pad + frame_length + block_length // 2) // block_length * block_length
+        longest = width - 2 * pad
+        sums = cumulative[:, np.clip(high, 0, longest) + pad] - cumulative[:, np.clip(low, 0, longest) + pad]
+        power = sums / (high - low)
+    else:
+        sums = cumulative[:, starts + frame_length] - cumulative[:, starts]
+        power = sums / frame_length
+    rms = np.sqrt(np.maximum(power, 0.0)).astype(np.float32)
+    rms[np.arange(rms.shape[1]) >= counts[:, None]] = 0.0
+    return rms, counts
+
+
+def _row_percentile(values: np.ndarray, counts: np.ndarray, percentile: float) -> np.ndarray:
+    # ``np.percentile`` (linear interpolation) of the first ``counts[i]`` values of each row.
+    ordered = np.sort(np.where(np.arange(values.shape[1]) < counts[:, None], values, np.inf), axis=1)
+    last = np.maximum(counts - 1, 0)
+    rank = percentile / 100.0 * last
+    low = np.floor(rank).astype(np.int64)
+    high = np.minimum(low + 1, last)
+    low_values = np.take_along_axis(ordered, low[:, None], axis=1)[:, 0]
+    high_values = np.take_along_axis(ordered, high[:, None], axis=1)[:, 0]
+    return low_values + (high_values - low_values) * (rank - low)
+
+
+def _longest_runs(mask: np.ndarray) -> np.ndarray:
+    # Longest run of True per row, from the edges of the flattened mask with a False column between rows.
+    rows, width = mask.shape
+    flat = np.zeros((rows, width + 1), dtype=np.int8)
+    flat[:, :width] = mask
+    edges = np.flatnonzero(np.diff(flat.ravel(), prepend=0))
+    starts, ends = edges[0::2], edges[1::2]
+    longest = np.zeros(rows, dtype=np.int64)
+    np.maximum.at(longest, starts // (width + 1), ends - starts)
+    return longest
+
+
+def _hangover(mask: np.ndarray, frames: int) -> np.ndarray:
+    # Row-wise ``np.convolve(mask, ones(frames), mode="same") > 0``, as ``build_vad_mask`` does per file.
+    if frames <= 1:
+        return mask
+    left, right = frames // 2, (frames - 1) // 2
+    padded = np.zeros((mask.shape[0], mask.shape[1] + frames), dtype=np.int32)
+    padded[:, left + 1: left + 1 + mask.shape[1]] = mask
+    np.cumsum(padded, axis=1, out=padded)
+    index = np.arange(mask.shape[1])
+    return padded[:, index + left + right + 1] - padded[:, index] > 0
+
+
+def analyze_group(
+    slicer: Slicer,
+    sr: int,
+    rows: list[np.ndarray],
+    *,
+    hop_size: int,
+    dynamic_enabled: bool,
+    dynamic_offset_db: float,
+    dynamic_window_sec: float,
+    vad_enabled: bool,
+    vad_sensitivity_db: float,
+    vad_hangover_ms: int,
+    vad_mode: str = "rms",
+) -> list[tuple[list, int]]:
+    """Silence tags and frame count of each mono signal in ``rows``, all at one sample rate.
+
+    RMS, dB, the per-file dynamic threshold, the VAD mask and the silent
+    mask are computed for the whole group at once. ``Slicer.get_slice_tags``
+    then only runs for files that have a silent run long enough to produce a
+    tag; every other file is one slice. The spectral VAD and rolling
+    thresholds shorter than a file fall back to the per-file analysis on the
+    batched envelope.
+    """
+    rms, counts = batched_rms(rows, frame_length=slicer.win_size, hop_length=slicer.hop_size,
+                              block_length=slicer.rms_block)
+    valid = np.arange(rms.shape[1]) < counts[:, None]
+    per_file = np.zeros(len(rows), dtype=bool)
+    threshold_db = np.full(len(rows), slicer.threshold_db, dtype=np.float64)
+    rms_db = rms_to_db(rms)
+    if dynamic_enabled:
+        threshold_db = np.clip(_row_percentile(rms_db, counts, 20.0) + dynamic_offset_db, -80.0, -5.0)
+        if dynamic_window_sec > 0 and hop_size > 0:
+            per_file |= counts > int(round(dynamic_window_sec * 1000 / hop_size))
+            # A file within one window gets the rolling estimate's float32 constant.
+            threshold_db = threshold_db.astype(np.float32)
+    voiced = np.zeros_like(valid)
+    if vad_enabled:
+        if vad_mode == "spectral":
+            per_file[:] = True
+        hangover_frames = 0
+        if vad_hangover_ms > 0 and hop_size > 0:
+            hangover_frames = max(1, int(round(vad_hangover_ms / hop_size)))
+        voiced = _hangover((rms_db >= (threshold_db - vad_sensitivity_db)[:, None]) & valid, hangover_frames)
+    silent = (rms < (10 ** (threshold_db / 20.0))[:, None]) & valid & ~voiced
+    frames = (np.array([row.shape[0] for row in rows]) + slicer.hop_size - 1) // slicer.hop_size
+    needs_tags = per_file | (
+        (frames > slicer.min_length) & (_longest_runs(silent) >= min(slicer.min_interval, slicer.max_sil_kept + 1))
+    )
+
+    results = []
+    for i, row in enumerate(rows):
+        if not needs_tags[i]:
+            # ``get_slice_tags`` counts envelope frames once a file is long enough to slice.
+            results.append(([], int(frames[i] if frames[i] <= slicer.min_length else counts[i])))
+            continue
+        rms_list = rms[i, :counts[i]]
+        if per_file[i]:
+            results.append(analyze_slice_tags(
+                slicer,
+                row,
+                sr,
+                filename="",
+                cache_dir=None,
+                hop_size=hop_size,
+                dynamic_enabled=dynamic_enabled,
+                dynamic_offset_db=dynamic_offset_db,
+                dynamic_window_sec=dynamic_window_sec,
+                vad_enabled=vad_enabled,
+                vad_sensitivity_db=vad_sensitivity_db,
+                vad_hangover_ms=vad_hangover_ms,
+                vad_mode=vad_mode,
+                rms_list=rms_list,
+            ))
+            continue
+        sil_tags, total_frames, _ = slicer.get_slice_tags(
+            row,
+            dynamic_threshold_db=float(threshold_db[i]) if dynamic_enabled else None,
+            vad_mask=voiced[i, :counts[i]] if vad_enabled else None,
+            rms_list=rms_list,
+        )
+        results.append((sil_tags, total_frames))
+    return results
+
+
+def process_audio_group(
+    filenames: list[str],
+    *,
+    max_file_seconds: float = 30.0,
+    max_group_samples: int = 1 << 23,
+    **kwargs,
+) -> list[tuple[bool, str | None, str | None, list[dict]]]:
+    """Slice many short files with their analysis batched; one result per file, in order.
+
+    ``kwargs`` are the keyword arguments of ``process_audio_file``. Files are
+    decoded one by one; those up to ``max_file_seconds`` long are analysed
+    together (see ``analyze_group``) in groups of one sample rate holding at
+    most ``max_group_samples`` samples, and then written with
+    ``process_audio_file``. Longer files are sliced on their own. The
+    analysis cache is not used for grouped files, whose envelopes are
+    cheaper to compute than to look up.
+    """
+    results: list = [None] * len(filenames)
+    pending: dict[int, list[tuple[int, np.ndarray, np.ndarray]]] = {}
+
+    def _process(index: int, **extra):
+        try:
+            results[index] = process_audio_file(filenames[index], **kwargs, **extra)
+        except Exception as exc:
+            results[index] = (False, str(exc), None, [])
+
+    for index, filename in enumerate(filenames):
+        audio, sr, error = decode_audio(filename, fallback_mode=kwargs["fallback_mode"], language=kwargs["language"])
+        if audio is None or sr is None:
+            results[index] = (False, error or "Decode failed.", None, [])
+        elif audio.shape[0] > max_file_seconds * sr:
+            _process(index, decoded=(audio, sr))
+        else:
+            # Frames-first like soundfile returns it; slicing analyses the channel mean.
+            samples = audio.mean(axis=1) if audio.ndim > 1 else audio
+            pending.setdefault(sr, []).append((index, audio, samples.astype(np.float32, copy=False)))
+
+    for sr, items in pending.items():
+        slicer = Slicer(
+            sr=sr,
+            threshold=kwargs["threshold_db"],
+            min_length=kwargs["min_length"],
+            min_interval=kwargs["min_interval"],
+            hop_size=kwargs["hop_size"],
+            max_sil_kept=kwargs["max_silence"],
+            fast_analysis=kwargs.get("fast_analysis", False),
+        )
+        start = 0
+        while start < len(items):
+            end, size = start, 0
+            while end < len(items) and (end == start or size + items[end][2].shape[0] <= max_group_samples):
+                size += items[end][2].shape[0]
+                end += 1
+            group = items[start:end]
+            tags = analyze_group(
+                slicer,
+                sr,
+                [samples for _, _, samples in group],
+                hop_size=kwargs["hop_size"],
+                dynamic_enabled=kwargs["dynamic_enabled"],
+                dynamic_offset_db=kwargs["dynamic_offset_db"],
+                dynamic_window_sec=kwargs["dynamic_window_sec"],
+                vad_enabled=kwargs["vad_enabled"],
+                vad_sensitivity_db=kwargs["vad_sensitivity_db"],
+                vad_hangover_ms=kwargs["vad_hangover_ms"],
+                vad_mode=kwargs.get("vad_mode", "rms"),
+            )
+            for (index, audio, _), slice_tags in zip(group, tags):
+                _process(index, decoded=(audio, sr), slice_tags=slice_tags)
+            start = end
+    return results
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import tempfile
+
+_STATE_VERSION = 1
+
+
+def source_identity(filename: str) -> str | None:
+    """Path, size and modification time of a source, as used by the analysis cache."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return f"{os.path.abspath(filename)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def slice_identity(source: str, start: int, end: int, export_settings: str) -> str:
+    return hashlib.sha1(f"{source}|{start}|{end}|{export_settings}".encode("utf-8")).hexdigest()
+
+
+class SliceState:
+    """Slices written by the previous run for one source, keyed by slice identity.
+
+    Stored as ``.<file core>.slices.json`` next to the slices. A slice whose
+    identity (source identity, sample range and export settings) is unchanged
+    can keep its file, possibly under a new index; ``plan`` moves those files
+    out of the way, removes files no longer produced, and tells the caller
+    which slices still have to be written.
+    """
+
+    def __init__(self, out_dir: str, file_core: str):
+        self.path = os.path.join(out_dir, f".{file_core}.slices.json")
+        self.previous = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == _STATE_VERSION:
+                self.previous = {entry["id"]: entry for entry in data["slices"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            self.previous = {}
+
+    def plan(self, identities: list[str]) -> dict[str, str]:
+        """Return ``{identity: temporary path}`` of the files that can be kept.
+
+        Kept files are renamed to temporary names first, so that a slice
+        moving to an index another kept slice used before does not overwrite
+        it. Every other file of the previous run is deleted.
+        """
+        wanted = set(identities)
+        kept = {}
+        for identity, entry in self.previous.items():
+            path = entry["path"]
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            if identity in wanted and size == entry["size"]:
+                temp_path = f"{path}.{identity[:12]}.keep"
+                os.replace(path, temp_path)
+                kept[identity] = temp_path
+            else:
+                os.remove(path)
+        return kept
+
+    def save(self, slices: list[dict]):
+        directory = os.path.dirname(self.path)
+        fd, temp_path = tempfile.mkstemp(prefix=".slices_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": _STATE_VERSION, "slices": slices}, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
@@ -0,0 +1,108 @@
+import numpy as np
+from scipy.ndimage import maximum_filter1d, uniform_filter1d
+
+
+def _window_maximum(arr, win_sz):
+    return maximum_filter1d(arr, size=win_sz)[win_sz // 2: win_sz // 2 + arr.shape[0] - win_sz + 1]
+
+
+def _window_rms(arr, win_sz):
+    filtered = np.sqrt(uniform_filter1d(np.power(arr, 2), win_sz) - np.power(uniform_filter1d(arr, win_sz), 2))
+    return filtered[win_sz // 2: win_sz // 2 + arr.shape[0] - win_sz + 1]
+
+
+def level2db(levels, eps=1e-12):
+    return 20 * np.log10(np.clip(levels, a_min=eps, a_max=1))
+
+
+class LegacySlicer:
+    """The original sample-accurate slicer (``scripts/slicer.py``).
+
+    Silence is where the peak level over a sliding ``win_l`` window stays
+    below the threshold; each cut lands on the quietest ``win_s`` window
+    within ``max_silence_kept`` of the silence edges, then on the quietest
+    sample in it. Cut points are sample positions, not frames.
+
+    The silent runs are found with one comparison over the whole signal
+    instead of a per-sample loop, so the loop only visits the runs. The
+    short-window RMS stays per silence edge: those segments cover less than
+    the file, and ``uniform_filter1d`` sums from the start of its input, so a
+    whole-file RMS would move cuts in digital silence, where windows tie up
+    to rounding. The cut points are identical to the per-sample version.
+    """
+
+    def __init__(self,
+                 sr: int,
+                 db_threshold: float = -40,
+                 min_length: int = 5000,
+                 win_l: int = 300,
+                 win_s: int = 20,
+                 max_silence_kept: int = 500):
+        self.db_threshold = db_threshold
+        self.min_samples = round(sr * min_length / 1000)
+        self.win_ln = round(sr * win_l / 1000)
+        self.win_sn = round(sr * win_s / 1000)
+        self.max_silence = round(sr * max_silence_kept / 1000)
+        if not self.min_samples >= self.win_ln >= self.win_sn:
+            raise ValueError("The following condition must be satisfied: min_length >= win_l >= win_s")
+        if not self.max_silence >= self.win_sn:
+            raise ValueError("The following condition must be satisfied: max_silence_kept >= win_s")
+
+    def get_slice_tags(self, audio) -> list[tuple[int, int]]:
+        """Sample ranges ``(start, end)`` of the silences to cut out of ``audio``."""
+        if len(audio.shape) > 1:
+            samples = audio.mean(axis=0)
+        else:
+            samples = audio
+        if samples.shape[0] <= self.min_samples:
+            return []
+        abs_amp = np.abs(samples - np.mean(samples))
+        win_max_db = level2db(_window_maximum(abs_amp, win_sz=self.win_ln))
+        total = win_max_db.shape[0]
+
+        def _quietest(begin: int, end: int) -> int:
+            # Quietest sample of the quietest short window within samples[begin:end].
+            split_win = begin + int(np.argmin(level2db(_window_rms(samples[begin: end], win_sz=self.win_sn))))
+            return split_win + int(np.argmin(abs_amp[split_win: split_win + self.win_sn]))
+
+        sil_tags = []
+        silent = (win_max_db < self.db_threshold).astype(np.int8)
+        edges = np.flatnonzero(np.diff(silent, prepend=0, append=0))
+        for left, right in zip(edges[0::2].tolist(), edges[1::2].tolist()):
+            sil_n = min(self.max_silence, (right + self.win_ln - left) // 2)
+            if right == total:
+                # Trailing silence is cut to the end of the audio.
+                sil_tags.append((_quietest(left, min(left + sil_n, samples.shape[0])), samples.shape[0]))
+                break
+            split_loc_l = 0 if left == 0 else _quietest(left, min(left + sil_n, samples.shape[0]))
+            if sil_tags and split_loc_l - sil_tags[-1][1] < self.min_samples and right < total - 1:
+                continue
+            if right == total - 1:
+                split_loc_r = right + self.win_ln
+            else:
+                split_loc_r = _quietest(right + self.win_ln - sil_n, right + self.win_ln)
+            sil_tags.append((split_loc_l, split_loc_r))
+        return sil_tags
+
+    @staticmethod
+    def get_sample_ranges(sil_tags: list[tuple[int, int]], total_samples: int) -> list[tuple[int, int]]:
+        """Sample ranges of the chunks ``slice`` returns for ``sil_tags``."""
+        if len(sil_tags) == 0:
+            return [(0, total_samples)]
+        ranges = []
+        if sil_tags[0][0] > 0:
+            ranges.append((0, min(total_samples, sil_tags[0][0])))
+        for i in range(len(sil_tags) - 1):
+            ranges.append((min(total_samples, sil_tags[i][1]), min(total_samples, sil_tags[i + 1][0])))
+        if sil_tags[-1][1] < total_samples - 1:
+            ranges.append((sil_tags[-1][1], total_samples))
+        return ranges
+
+    def slice(self, audio):
+        sil_tags = self.get_slice_tags(audio)
+        if len(sil_tags) == 0:
+            return [audio]
+        total_samples = audio.shape[-1]
+        if len(audio.shape) > 1:
+            return [audio[:, begin: end] for begin, end in self.get_sample_ranges(sil_tags, total_samples)]
+        return [audio[begin: end] for begin, end in self.get_sample_ranges(sil_tags, total_samples)]
@@ -0,0 +1,91 @@
+import json
+import os
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+MANIFEST_FIELDS = (
+    ("source_file", "string"),
+    ("index", "int64"),
+    ("start_sample", "int64"),
+    ("end_sample", "int64"),
+    ("sample_rate", "int64"),
+    ("start_ms", "float64"),
+    ("end_ms", "float64"),
+    ("length_ms", "float64"),
+    ("peak_db", "float64"),
+    ("rms_db", "float64"),
+    ("output_path", "string"),
+)
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+def default_manifest_path(directory: str) -> str:
+    """``slices_manifest.parquet`` in ``directory`` when pyarrow is installed, else ``.jsonl``."""
+    ext = "parquet" if parquet_available() else "jsonl"
+    return os.path.join(directory, f"slices_manifest.{ext}")
+
+
+class ManifestWriter:
+    """Stream the slice records of a whole run into one manifest file.
+
+    Records are appended by the coordinating thread as each source finishes,
+    so a run over many files leaves a single table instead of one slice list
+    per source. A path ending in ``.parquet`` is written with pyarrow in row
+    groups of ``batch_rows``; any other path is written as JSON Lines. Only
+    the columns in ``MANIFEST_FIELDS`` are kept.
+    """
+
+    def __init__(self, path: str, *, batch_rows: int = 8192):
+        self.path = path
+        self.batch_rows = max(1, int(batch_rows))
+        self.rows = 0
+        self._pending = []
+        self._parquet = None
+        self._file = None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        if path.lower().endswith(".parquet"):
+            if pyarrow is None:
+                raise ImportError("Writing a Parquet manifest requires pyarrow.")
+            self._schema = pyarrow.schema([(name, getattr(pyarrow, kind)()) for name, kind in MANIFEST_FIELDS])
+            self._parquet = pyarrow.parquet.ParquetWriter(path, self._schema)
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+
+    def __enter__(self) -> "ManifestWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, records: list[dict]):
+        for record in records:
+            row = {name: record.get(name) for name, _ in MANIFEST_FIELDS}
+            if self._file is not None:
+                self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+            else:
+                self._pending.append(row)
+            self.rows += 1
+        if len(self._pending) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self._parquet.write_table(pyarrow.Table.from_pylist(self._pending, schema=self._schema))
+            self._pending = []
+
+    def close(self):
+        if self._parquet is not None:
+            self._flush()
+            self._parquet.close()
+            self._parquet = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,13 +1,18 @@
+import io
+import threading
+
 import soundfile
 import numpy as np
-import matplotlib.pyplot as plt
-
-plt.rcParams["font.sans-serif"] = ["Microsoft YaHei", "SimHei", "Arial Unicode MS", "DejaVu Sans"]
-plt.rcParams["font.family"] = "sans-serif"
-plt.rcParams["axes.unicode_minus"] = False
-plt.rcParams["mathtext.fontset"] = "stix"
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
 
 from audio_slicer.utils.audioutil import AudioUtil
+from audio_slicer.utils.cache import AnalysisCache
+from audio_slicer.utils.legacy_slicer import LegacySlicer
+from audio_slicer.utils.processing import build_slice_analysis, compute_spectral_features, get_sample_ranges
+from audio_slicer.utils.slicer2 import Slicer, match_frames
 
 dark_theme_palette = {
     'primary': '#8ab4f7',
@@ -17,7 +22,9 @@ dark_theme_palette = {
     'figure_background': '#202020',
     'axis': '#A0A0A0',
     'title': '#e4e7eb',
-    'grid': '#404040'
+    'grid': '#404040',
+    'rms': '#fdd663',
+    'threshold': '#f28b82'
 }
 light_theme_palette = {
     'primary': '#1a73e8',
@@ -27,7 +34,9 @@ light_theme_palette = {
     'figure_background': '#F0F0F0',
     'axis': '#505050',
     'title': '#4d5157',
-    'grid': '#B0B0B0'
+    'grid': '#B0B0B0',
+    'rms': '#b06000',
+    'threshold': '#d93025'
 }
 
 
@@ -101,6 +110,379 @@ _TEXTS = {
 }
 
 
+DISTRIBUTION_ITEMS = ["<2", "<5", "<8", "<11", "<14", "<17", "<20", ">=20"]
+_DISTRIBUTION_EDGES = [2, 5, 8, 11, 14, 17, 20]
+
+
+def preview_texts(language: str) -> dict:
+    return _TEXTS.get(language, _TEXTS["en"])
+
+
+def get_slice_ranges_ms(sil_tags: list, total_frames: int, hop_samples: int, sr: int, total_samples: int) -> list:
+    """Slice ranges in ms, from the same sample ranges slicing writes.
+
+    ``hop_samples`` is the slicer's hop in samples (``Slicer.hop_size``);
+    ``frame * hop_ms`` would drift from it whenever ``sr * hop_ms / 1000`` is
+    not a whole number.
+    """
+    return [
+        [begin / sr * 1000.0, end / sr * 1000.0]
+        for begin, end in get_sample_ranges(sil_tags, total_frames, hop_samples, total_samples)
+    ]
+
+
+def get_length_distribution(lengths_sec) -> list[int]:
+    # range 0-2 2-5 5-8 8-11 11-14 14-17 17-20 20+
+    bins = np.searchsorted(_DISTRIBUTION_EDGES, np.asarray(lengths_sec, dtype=np.float64), side="right")
+    return np.bincount(bins, minlength=len(DISTRIBUTION_ITEMS)).astype(int).tolist()
+
+
+def get_length_ranking(lengths_sec, limit: int = 10) -> tuple[list[str], list[float]]:
+    order = sorted(range(len(lengths_sec)), key=lambda i: lengths_sec[i])
+    if len(order) > limit:
+        order = order[len(order) - limit:]
+    return ["#" + str(i) for i in order], [round(float(lengths_sec[i]), 3) for i in order]
+
+
+class PeakEnvelope:
+    """Min/max pyramid of a 1-D signal.
+
+    Level 0 holds the min/max of every ``block_size`` values, each further
+    level halves the resolution. Drawing code picks the coarsest level that
+    still has at least one bucket per pixel, so the cost of painting depends
+    on the widget width rather than on the length of the recording.
+    """
+
+    def __init__(self, values: np.ndarray, rate: float, *, block_size: int = 256):
+        values = np.asarray(values, dtype=np.float32)
+        self.rate = float(rate)
+        self.block_size = max(1, int(block_size))
+        self.duration = values.shape[0] / self.rate if self.rate > 0 else 0.0
+        if values.shape[0] == 0:
+            values = np.zeros(1, dtype=np.float32)
+        n_blocks = -(-values.shape[0] // self.block_size)
+        pad = n_blocks * self.block_size - values.shape[0]
+        if pad:
+            values = np.pad(values, (0, pad), mode="edge")
+        blocks = values.reshape(n_blocks, self.block_size)
+        mins = blocks.min(axis=1)
+        maxs = blocks.max(axis=1)
+        self.levels = [(mins, maxs)]
+        while mins.shape[0] > 1:
+            if mins.shape[0] % 2:
+                mins = np.append(mins, mins[-1])
+                maxs = np.append(maxs, maxs[-1])
+            mins = np.minimum(mins[0::2], mins[1::2])
+            maxs = np.maximum(maxs[0::2], maxs[1::2])
+            self.levels.append((mins, maxs))
+
+    def bucket_seconds(self, level: int) -> float:
+        return self.block_size * (1 << level) / self.rate
+
+    def columns(self, t0: float, t1: float, n_columns: int):
+        """Return ``(times, mins, maxs)`` with at most ``n_columns`` entries covering ``[t0, t1]``."""
+        n_columns = max(1, int(n_columns))
+        t0 = max(0.0, t0)
+        t1 = min(self.duration, t1)
+        if t1 <= t0:
+            empty = np.zeros(0, dtype=np.float32)
+            return empty, empty, empty
+        seconds_per_column = (t1 - t0) / n_columns
+        level = 0
+        while level + 1 < len(self.levels) and self.bucket_seconds(level + 1) <= seconds_per_column:
+            level += 1
+        mins, maxs = self.levels[level]
+        bucket = self.bucket_seconds(level)
+        i0 = min(int(t0 / bucket), mins.shape[0] - 1)
+        i1 = min(int(np.ceil(t1 / bucket)), mins.shape[0])
+        i1 = max(i1, i0 + 1)
+        if i1 - i0 <= n_columns:
+            times = (np.arange(i0, i1) + 0.5) * bucket
+            return times, mins[i0:i1], maxs[i0:i1]
+        edges = np.unique(np.linspace(i0, i1, n_columns + 1).astype(np.int64)[:-1])
+        times = (edges + 0.5 * (np.append(edges[1:], i1) - edges)) * bucket
+        return times, np.minimum.reduceat(mins[i0:i1], edges - i0), np.maximum.reduceat(maxs[i0:i1], edges - i0)
+
+
+class AnalysisOverlay:
+    """RMS envelope and effective silence threshold at hop resolution.
+
+    Built from the arrays ``get_slice_tags`` already works on, in linear
+    amplitude like the waveform. Frames that VAD forces to voice get a
+    threshold of 0, so the line shows exactly where a frame may count as silence.
+    With ``vad_gate`` (the spectral VAD) the mask is the whole decision:
+    every other frame is silent whatever its level and gets a threshold at
+    full scale (1.0).
+    Without a threshold (the legacy engine does not cut on the RMS envelope)
+    only the envelope is drawn and ``threshold`` is None.
+    """
+
+    def __init__(self,
+                 rms_list: np.ndarray,
+                 *,
+                 hop_seconds: float,
+                 threshold_db: float | None,
+                 dynamic_threshold_db: float | np.ndarray | None = None,
+                 vad_mask: np.ndarray | None = None,
+                 vad_gate: bool = False):
+        rms_list = np.asarray(rms_list, dtype=np.float32)
+        self.dynamic = dynamic_threshold_db is not None
+        self.threshold_db = dynamic_threshold_db if self.dynamic else threshold_db
+        rate = 1.0 / hop_seconds
+        self.rms = PeakEnvelope(rms_list, rate, block_size=1)
+        self.threshold = None
+        if self.threshold_db is None:
+            return
+        threshold = 10 ** (np.asarray(self.threshold_db, dtype=np.float32) / 20.)
+        if threshold.ndim:
+            # A rolling threshold is already one value per frame.
+            threshold = match_frames(threshold, rms_list.shape[0])
+        else:
+            threshold = np.full(rms_list.shape[0], threshold, dtype=np.float32)
+        if vad_mask is not None:
+            length = min(rms_list.shape[0], len(vad_mask))
+            voiced = np.asarray(vad_mask[:length], dtype=bool)
+            threshold[:length][voiced] = 0.0
+            if vad_gate:
+                threshold[:length][~voiced] = 1.0
+        self.threshold = PeakEnvelope(threshold, rate, block_size=1)
+
+
+class PreviewAnalysis:
+    """Decoded audio of the previewed file and its cached RMS envelopes.
+
+    Re-slicing with new parameters only reruns the tagging on the cached
+    envelope; the RMS itself is recomputed only when hop size or window change.
+    With an ``AnalysisCache`` the envelopes are also looked up on disk, so a
+    previewed or reported file does not need its RMS computed again.
+    """
+
+    _MAX_CACHED_ENVELOPES = 4
+
+    def __init__(self, filename: str, audio: np.ndarray, sr: int, *, cache: AnalysisCache | None = None):
+        self.filename = filename
+        self.sr = sr
+        self.cache = cache
+        # ``audio`` is channel-first like everywhere else in the slicer.
+        self.samples = audio.mean(axis=0) if audio.ndim > 1 else audio
+        self.duration_ms = self.samples.shape[0] / sr * 1000.0
+        self._rms_cache: dict[tuple[int, int, int], np.ndarray] = {}
+        self._spectral_cache: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def rms_list(self, slicer: Slicer) -> np.ndarray:
+        key = (slicer.hop_size, slicer.win_size, slicer.rms_block)
+        with self._lock:
+            rms_list = self._rms_cache.get(key)
+        if rms_list is None:
+            if self.cache is not None:
+                rms_list = self.cache.rms_list(self.filename, slicer, self.samples)
+            else:
+                rms_list = slicer.get_rms_list(self.samples)
+            with self._lock:
+                while len(self._rms_cache) >= self._MAX_CACHED_ENVELOPES:
+                    self._rms_cache.pop(next(iter(self._rms_cache)))
+                self._rms_cache[key] = rms_list
+        return rms_list
+
+    def spectral_features(self, slicer: Slicer) -> tuple[np.ndarray, np.ndarray]:
+        """Speech-band level and flatness for the spectral VAD, cached like the envelopes."""
+        key = (slicer.hop_size, slicer.win_size)
+        with self._lock:
+            features = self._spectral_cache.get(key)
+        if features is None:
+            features = compute_spectral_features(slicer, self.samples, self.sr)
+            with self._lock:
+                while len(self._spectral_cache) >= self._MAX_CACHED_ENVELOPES:
+                    self._spectral_cache.pop(next(iter(self._spectral_cache)))
+                self._spectral_cache[key] = features
+        return features
+
+    def analyze(self, options: dict, is_cancelled=None) -> tuple[list, AnalysisOverlay] | None:
+        """Return the slice ranges in ms and the overlay of the analysis behind them."""
+        slicer = Slicer(
+            sr=self.sr,
+            threshold=options["threshold_db"],
+            min_length=options["min_length"],
+            min_interval=options["min_interval"],
+            hop_size=options["hop_size"],
+            max_sil_kept=options["max_silence"],
+            fast_analysis=options.get("fast_analysis", False),
+        )
+        rms_list = self.rms_list(slicer)
+        if is_cancelled and is_cancelled():
+            return None
+        if options.get("slicer_engine") == "legacy":
+            legacy_slicer = LegacySlicer(
+                sr=self.sr,
+                db_threshold=options["threshold_db"],
+                min_length=options["min_length"],
+                win_l=options["min_interval"],
+                win_s=options["hop_size"],
+                max_silence_kept=options["max_silence"],
+            )
+            sil_tags = legacy_slicer.get_slice_tags(self.samples)
+            ranges = [
+                [begin / self.sr * 1000.0, end / self.sr * 1000.0]
+                for begin, end in legacy_slicer.get_sample_ranges(sil_tags, self.samples.shape[0])
+            ]
+            # LegacySlicer cuts on its own peak windows, so there is no RMS threshold to draw.
+            overlay = AnalysisOverlay(rms_list, hop_seconds=slicer.hop_size / self.sr, threshold_db=None)
+            return ranges, overlay
+        spectral_features = None
+        if options["vad_enabled"] and options["vad_mode"] == "spectral":
+            spectral_features = self.spectral_features(slicer)
+        dynamic_threshold_db, vad_mask = build_slice_analysis(
+            slicer,
+            rms_list,
+            hop_size=options["hop_size"],
+            dynamic_enabled=options["dynamic_enabled"],
+            dynamic_offset_db=options["dynamic_offset_db"],
+            dynamic_window_sec=options["dynamic_window_sec"],
+            vad_enabled=options["vad_enabled"],
+            vad_sensitivity_db=options["vad_sensitivity_db"],
+            vad_hangover_ms=options["vad_hangover_ms"],
+            vad_mode=options["vad_mode"],
+            spectral_features=spectral_features,
+        )
+        if is_cancelled and is_cancelled():
+            return None
+        sil_tags, total_frames, _ = slicer.get_slice_tags(
+            self.samples,
+            dynamic_threshold_db=dynamic_threshold_db,
+            vad_mask=vad_mask,
+            vad_gate=spectral_features is not None,
+            rms_list=rms_list,
+        )
+        ranges = get_slice_ranges_ms(sil_tags, total_frames, slicer.hop_size, self.sr, self.samples.shape[0])
+        overlay = AnalysisOverlay(
+            rms_list,
+            hop_seconds=slicer.hop_size / self.sr,
+            threshold_db=slicer.threshold_db,
+            dynamic_threshold_db=dynamic_threshold_db,
+            vad_mask=vad_mask,
+            vad_gate=spectral_features is not None,
+        )
+        return ranges, overlay
+
+
+# Passed per text artist instead of through ``rcParams`` so renderers in
+# different threads never touch shared matplotlib state.
+_FONT = FontProperties(family=["Microsoft YaHei", "SimHei", "Arial Unicode MS", "DejaVu Sans"])
+_DB_TICKS = [-1, -0.707, -0.501, -0.355, -0.126, 0, 0.126, 0.355, 0.501, 0.707, 1]
+_DB_TICK_LABELS = ['0', '-3', '-6', '-9', '-18', '-INF', '-18', '-9', '-6', '-3', '0']
+
+
+class PreviewRenderer:
+    """Object-oriented Agg renderer for the slicing preview.
+
+    The figure is created once and cleared between renders, boundaries are a
+    single ``LineCollection`` and the image is returned as bytes. A renderer is
+    not shared between threads; use ``render_preview`` to get one per thread.
+    """
+
+    MAX_LABELS = 40
+
+    def __init__(self, *, width: float = 10, height: float = 6, dpi: int = 150):
+        self.dpi = dpi
+        self.figure = Figure(figsize=(width, height), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+
+    def _style_axes(self, ax, palette: dict):
+        ax.set_facecolor(palette['figure_background'])
+        for spine in ax.spines.values():
+            spine.set_color(palette['figure_frame'])
+        ax.tick_params(axis='both', color=palette['axis'], labelcolor=palette['axis'])
+
+    def _plot_waveform(self, ax, envelope: PeakEnvelope, ranges_ms: list, overlay: AnalysisOverlay | None,
+                       palette: dict, texts: dict):
+        self._style_axes(ax, palette)
+        n_columns = int(self.figure.get_figwidth() * self.dpi)
+        times, mins, maxs = envelope.columns(0.0, envelope.duration, n_columns)
+        ax.fill_between(times, mins, maxs, color=palette['primary'], linewidth=0.5, edgecolor=palette['primary'])
+        if overlay is not None:
+            times, _, rms = overlay.rms.columns(0.0, overlay.rms.duration, n_columns)
+            ax.plot(times, rms, times, -rms, color=palette['rms'], linewidth=0.8)
+        if overlay is not None and overlay.threshold is not None:
+            # Minimum per column so frames released by VAD stay visible when zoomed out.
+            times, threshold, _ = overlay.threshold.columns(0.0, overlay.threshold.duration, n_columns)
+            ax.plot(times, threshold, times, -threshold, color=palette['threshold'], linewidth=0.8,
+                    linestyle='--', drawstyle='steps-mid')
+        ax.set_xlabel(texts["xlabel"], color=palette['axis'], fontproperties=_FONT)
+        ax.set_ylabel(texts["ylabel"], color=palette['axis'], fontproperties=_FONT)
+        ax.grid(color=palette['grid'])
+        ax.set_xlim(0, max(envelope.duration, 1e-3))
+        ax.set_ylim(-1, 1)
+        ax.set_yticks(_DB_TICKS, _DB_TICK_LABELS)
+
+        bounds = np.asarray(ranges_ms, dtype=np.float64).reshape(-1, 2) / 1000.0
+        xs = bounds.ravel()
+        segments = np.zeros((xs.shape[0], 2, 2))
+        segments[:, :, 0] = xs[:, None]
+        segments[:, 1, 1] = 1.0
+        ax.add_collection(LineCollection(
+            segments,
+            colors=palette['accent'],
+            linewidths=1.0,
+            transform=ax.get_xaxis_transform(),
+        ))
+        step = max(1, -(-bounds.shape[0] // self.MAX_LABELS))
+        for i in range(0, bounds.shape[0], step):
+            ax.annotate(
+                "#" + str(i),
+                xy=(bounds[i, 0], 1),
+                xycoords=("data", "axes fraction"),
+                color=palette['accent'],
+            )
+
+    def _plot_distribution(self, ax, lengths_sec: list, palette: dict, texts: dict):
+        self._style_axes(ax, palette)
+        len_values = get_length_distribution(lengths_sec)
+        ax.set_ylim(0, max(max(len_values), 1) / 0.9)
+        bars = ax.bar(DISTRIBUTION_ITEMS, len_values, color=palette['primary'])
+        ax.bar_label(bars, color=palette['title'])
+        ax.set_title(texts["length_distribution"], color=palette['title'], fontproperties=_FONT)
+
+    def _plot_ranking(self, ax, lengths_sec: list, palette: dict, texts: dict):
+        self._style_axes(ax, palette)
+        ranking_items, ranking_values = get_length_ranking(lengths_sec)
+        ax.set_xlim(0, max(max(ranking_values, default=0), 1e-3) / 0.9)
+        bars = ax.barh(ranking_items, ranking_values, color=palette['primary'])
+        ax.bar_label(bars, color=palette['title'], padding=2)
+        ax.set_title(texts["length_ranking"], color=palette['title'], fontproperties=_FONT)
+
+    def render(self, envelope: PeakEnvelope, ranges_ms: list, *, overlay: AnalysisOverlay | None = None,
+               theme: str, language: str = "en", fmt: str = "png") -> bytes:
+        palette = dark_theme_palette if theme == 'dark' else light_theme_palette
+        texts = preview_texts(language)
+        lengths_sec = [(end - start) / 1000.0 for start, end in ranges_ms]
+        fig = self.figure
+        fig.clear()
+        fig.set_facecolor(palette['page_background'])
+        grid = fig.add_gridspec(2, 2)
+        self._plot_waveform(fig.add_subplot(grid[0, :]), envelope, ranges_ms, overlay, palette, texts)
+        self._plot_distribution(fig.add_subplot(grid[1, 0]), lengths_sec, palette, texts)
+        self._plot_ranking(fig.add_subplot(grid[1, 1]), lengths_sec, palette, texts)
+        fig.tight_layout(pad=3, w_pad=2, h_pad=3)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=self.dpi, facecolor=palette['page_background'])
+        fig.clear()
+        return buffer.getvalue()
+
+
+_renderers = threading.local()
+
+
+def render_preview(envelope: PeakEnvelope, ranges_ms: list, *, overlay: AnalysisOverlay | None = None,
+                   theme: str, language: str = "en", fmt: str = "png") -> bytes:
+    """Render with the calling thread's reusable ``PreviewRenderer``."""
+    renderer = getattr(_renderers, "renderer", None)
+    if renderer is None:
+        renderer = PreviewRenderer()
+        _renderers.renderer = renderer
+    return renderer.render(envelope, ranges_ms, overlay=overlay, theme=theme, language=language, fmt=fmt)
+
+
 class SlicingPreview:
     def __init__(self,
                  filename: str,
@@ -109,7 +491,15 @@ class SlicingPreview:
                  total_frames: int,
                  waveform_shape: int,
                  theme: str,
-                 language: str = "en"):
+                 language: str = "en",
+                 *,
+                 audio: np.ndarray | None = None,
+                 sr: int | None = None,
+                 rms_list: np.ndarray | None = None,
+                 threshold_db: float | None = None,
+                 dynamic_threshold_db: float | np.ndarray | None = None,
+                 vad_mask: np.ndarray | None = None,
+                 vad_gate: bool = False):
         self.filename = filename
         self.sil_tags = sil_tags
         self.hop_size = hop_size
@@ -117,217 +507,42 @@ class SlicingPreview:
         self.waveform_shape = waveform_shape
         self.theme = theme
         self.language = language
-        ori_audio, ori_sr = soundfile.read(filename, dtype=np.float32)
-
-        # Convert to mono if not
-        if len(ori_audio.shape) > 1:
-            ori_audio = ori_audio.T
-            ori_audio = AudioUtil.to_mono(ori_audio)
-
-        self.duration_ms = (ori_audio.shape[-1] / ori_sr) * 1000.0
-
-        # Downsample audio before plotting due to performance issue
-        target_sr = 6000
-        self.target_sr = target_sr
-        self.audio_samples = AudioUtil.resample(y=ori_audio, orig_sr=ori_sr, target_sr=target_sr, res_type="soxr_hq")
-
-    def _apply_slice(self, begin, end):
-        end_ms = end * self.hop_size
-        return [begin * self.hop_size, min(self.duration_ms, end_ms)]
+        # Callers that already decoded the file (channel-first) can pass it in.
+        if audio is None or sr is None:
+            audio, sr = soundfile.read(filename, dtype=np.float32)
+            if audio.ndim > 1:
+                audio = audio.T
+        ori_audio = AudioUtil.to_mono(audio)
+        self.sr = sr
+        self.total_samples = ori_audio.shape[-1]
+        # The hop in samples of a ``Slicer`` with this hop size in ms.
+        self.hop_samples = round(sr * hop_size / 1000)
+        self.duration_ms = (ori_audio.shape[-1] / sr) * 1000.0
+        self.envelope = PeakEnvelope(ori_audio, sr)
+        # The analysis that produced ``sil_tags`` is drawn as is, never recomputed here.
+        self.overlay = None
+        if rms_list is not None and threshold_db is not None:
+            self.overlay = AnalysisOverlay(
+                rms_list,
+                hop_seconds=self.hop_samples / sr,
+                threshold_db=threshold_db,
+                dynamic_threshold_db=dynamic_threshold_db,
+                vad_mask=vad_mask,
+                vad_gate=vad_gate,
+            )
 
     def _get_ranges(self, sil_tags: list):
-        if len(sil_tags) == 0:
-            return [[0, self.duration_ms]]
-        else:
-            ranges = []
-            if sil_tags[0][0] > 0:
-                ranges.append(self._apply_slice(0, sil_tags[0][0]))
-            for i in range(len(sil_tags) - 1):
-                ranges.append(self._apply_slice(sil_tags[i][1], sil_tags[i + 1][0]))
-            if sil_tags[-1][1] < self.total_frames:
-                ranges.append(self._apply_slice(sil_tags[-1][1], self.total_frames))
-            return ranges
-
-    def _get_length_distribution(self):
-        values = [0, 0, 0, 0, 0, 0, 0, 0]  # range 0-2 2-5 5-8 8-11 11-14 14-17 17-20 20+
-        for length in self.length_list:
-            if length[1] < 2:
-                values[0] += 1
-            elif length[1] < 5:
-                values[1] += 1
-            elif length[1] < 8:
-                values[2] += 1
-            elif length[1] < 11:
-                values[3] += 1
-            elif length[1] < 14:
-                values[4] += 1
-            elif length[1] < 17:
-                values[5] += 1
-            elif length[1] < 20:
-                values[6] += 1
-            else:
-                values[7] += 1
-        return values
-
-    def _get_length_ranking_list(self):
-        items = []
-        values = []
-        self.length_list.sort(key=lambda x: x[1])
-        count = len(self.length_list)
-        cropped_list = self.length_list if count <= 10 else self.length_list[count - 10:]
-        for list_item in cropped_list:
-            items.append(list_item[0])
-            values.append(round(list_item[1], 3))
-        return items, values
-
-    def _plot_preview(self, preview_filename: str):
-        time = np.arange(0, len(self.audio_samples)) * (1.0 / self.target_sr)
-
-        palette = dark_theme_palette if self.theme == 'dark' else light_theme_palette
-        texts = _TEXTS.get(self.language, _TEXTS["en"])
-        plt.rcParams['toolbar'] = 'None'
-        plt.figure(figsize=(10, 6))
-
-        # Plot Waveform
-        plt.subplot(211)
-        plt.plot(time, self.audio_samples, color=palette['primary'])
-        fig = plt.gcf()
-        fig.set_facecolor(palette['page_background'])
-        fig.tight_layout(pad=3, w_pad=2, h_pad=3)
-        ax = plt.gca()
-        ax.set_facecolor(palette['figure_background'])
-        ax.spines['top'].set_color(palette['figure_frame'])
-        ax.spines['bottom'].set_color(palette['figure_frame'])
-        ax.spines['left'].set_color(palette['figure_frame'])
-        ax.spines['right'].set_color(palette['figure_frame'])
-        ax.tick_params(
-            axis='x',
-            color=palette['axis'],
-            labelcolor=palette['axis']
-        )
-        ax.tick_params(
-            axis='y',
-            color=palette['axis'],
-            labelcolor=palette['axis']
-        )
-        # plt.title(
-        #     label='Audio WaveForm',
-        #     fontdict={
-        #         "color": palette['title']
-        #     }
-        # )
-        plt.xlabel(
-            xlabel=texts["xlabel"],
-            fontdict={
-                "color": palette['axis']
-            }
-        )
-        plt.ylabel(
-            ylabel=texts["ylabel"],
-            fontdict={
-                "color": palette['axis']
-            }
-        )
-        plt.grid(
-            color=palette['grid']
-        )
-        plt.autoscale(enable=True, axis='x', tight=True)
-        plt.ylim((-1, 1))
-        plt.yticks([-1, -0.707, -0.501, -0.355, -0.126, 0, 0.126, 0.355, 0.501, 0.707, 1],
-                   ['0', '-3', '-6', '-9', '-18', '-INF', '-18', '-9', '-6', '-3', '0'])
-        ranges = self._get_ranges(sil_tags=self.sil_tags)
-        self.length_list = []
-        for i in range(len(ranges)):
-            start_pos = ranges[i][0] / 1000.  # Convert ms to s
-            end_pos = ranges[i][1] / 1000.
-            length = end_pos - start_pos
-            self.length_list.append(('#' + str(i), length))  # Add length to list
-            plt.annotate("#" + str(i),
-                         xy=(start_pos, 1),
-                         xycoords=("data", "axes fraction"),
-                         color=palette['accent']
-                         )
-            plt.axvline(x=start_pos, color=palette['accent'])
-            plt.axvline(x=end_pos, color=palette['accent'])
-
-        # Plot Length Distribution
-        plt.subplot(223)
-        distribution_items = ["<2", "<5", "<8", "<11", "<14", "<17", "<20", ">=20"]
-        # values = [1, 5, 7, 11, 13, 7, 5, 1]
-        len_values = self._get_length_distribution()
-        plt.ylim(0, max(len_values) / 0.9)
-        plt.bar(distribution_items,
-                len_values,
-                color=palette['primary'])
-        for a, b in zip(distribution_items, len_values):
-            plt.text(a, b, b, ha='center', va='bottom', fontdict={
-                "color": palette['title']
-            })
-        ax = plt.gca()
-        ax.set_facecolor(palette['figure_background'])
-        ax.spines['top'].set_color(palette['figure_frame'])
-        ax.spines['bottom'].set_color(palette['figure_frame'])
-        ax.spines['left'].set_color(palette['figure_frame'])
-        ax.spines['right'].set_color(palette['figure_frame'])
-        ax.tick_params(
-            axis='x',
-            color=palette['axis'],
-            labelcolor=palette['axis']
-        )
-        ax.tick_params(
-            axis='y',
-            color=palette['axis'],
-            labelcolor=palette['axis']
-        )
-        plt.title(
-            label=texts["length_distribution"],
-            fontdict={
-                "color": palette['title']
-            }
-        )
+        return get_slice_ranges_ms(sil_tags, self.total_frames, self.hop_samples, self.sr, self.total_samples)
 
-        # Plot Length Ranking List
-        plt.subplot(224)
-        # items = ["#5", "#1", "#6", "#8", "#12", "#7"]
-        # values = [21, 28, 32, 36, 45, 51]
-        ranking_items, ranking_values = self._get_length_ranking_list()
-        plt.xlim(0, max(ranking_values) / 0.9)
-        plt.barh(ranking_items, ranking_values, color=palette['primary'])
-        for a, b in zip(ranking_items, ranking_values):
-            plt.text(b, a, b, ha='left', va='center', fontdict={
-                "color": palette['title']
-            })
-        ax = plt.gca()
-        ax.set_facecolor(palette['figure_background'])
-        ax.spines['top'].set_color(palette['figure_frame'])
-        ax.spines['bottom'].set_color(palette['figure_frame'])
-        ax.spines['left'].set_color(palette['figure_frame'])
-        ax.spines['right'].set_color(palette['figure_frame'])
-        ax.tick_params(
-            axis='x',
-            color=palette['axis'],
-            labelcolor=palette['axis']
-        )
-        ax.tick_params(
-            axis='y',
-            color=palette['axis'],
-            labelcolor=palette['axis']
-        )
-        plt.title(
-            label=texts["length_ranking"],
-            fontdict={
-                "color": palette['title']
-            }
-        )
-        plt.savefig(preview_filename, dpi=150)
-        # plt.show()
+    def render(self, fmt: str = "png") -> bytes:
+        ranges = self._get_ranges(sil_tags=self.sil_tags)
+        return render_preview(self.envelope, ranges, overlay=self.overlay, theme=self.theme,
+                              language=self.language, fmt=fmt)
 
     def save_plot(self, filename: str):
-        self._plot_preview(filename)
+        with open(filename, "wb") as f:
+            f.write(self.render())
 
 
 if __name__ == "__main__":
     pass
-    # showWaveForm("D:/测试/slicer测试音频/2009000334.wav")
-    # showWaveForm("D:\\编曲学习\\小小\\小小（伊拾七干声）.wav")
-    # showWaveForm("D:\\测试\\slicer测试音频\\Vocal (4).wav")
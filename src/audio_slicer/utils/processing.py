@@ -6,13 +6,21 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from collections import deque
 from pathlib import Path
 
 import numpy as np
 import soundfile
 
 from audio_slicer.modules import i18n
-from audio_slicer.utils.slicer2 import Slicer, estimate_dynamic_threshold_db, build_vad_mask
+from audio_slicer.utils.audioutil import AudioUtil
+from audio_slicer.utils.cache import AnalysisCache
+from audio_slicer.utils.encoder import FFMPEG_CODECS, shared_encoder_pool
+from audio_slicer.utils.incremental import SliceState, slice_identity, source_identity
+from audio_slicer.utils.legacy_slicer import LegacySlicer
+from audio_slicer.utils.shards import ShardWriter, encode_audio
+from audio_slicer.utils.slicer2 import (Slicer, build_spectral_vad_mask, build_vad_mask, estimate_dynamic_threshold_db,
+                                       estimate_rolling_threshold_db, rms_to_db, spectral_vad_features)
 
 
 def resolve_ffmpeg_path() -> str | None:
@@ -76,49 +84,27 @@ def _read_with_librosa(filename: str) -> tuple[np.ndarray | None, int | None, st
         return None, None, str(exc)
     try:
         audio, sr = librosa.load(filename, sr=None, mono=False)
+        # librosa is channel-first; match the frames-first layout of soundfile.
+        if audio.ndim > 1:
+            audio = audio.T
         return audio, sr, None
     except Exception as exc:
         return None, None, str(exc)
 
 
-def _prepare_audio(audio: np.ndarray) -> tuple[np.ndarray, bool]:
-    is_mono = True
-    if audio.ndim > 1:
-        is_mono = False
-        audio = audio.T
-    return audio, is_mono
-
-
-def process_audio_file(
+def decode_audio(
     filename: str,
     *,
-    output_ext: str,
-    threshold_db: float,
-    min_length: int,
-    min_interval: int,
-    hop_size: int,
-    max_silence: int,
-    dynamic_enabled: bool,
-    dynamic_offset_db: float,
-    vad_enabled: bool,
-    vad_sensitivity_db: float,
-    vad_hangover_ms: int,
-    name_prefix: str,
-    name_suffix: str,
-    name_timestamp: bool,
-    export_csv: bool,
-    export_json: bool,
-    output_dir: str | None,
     fallback_mode: str,
     language: str,
-) -> tuple[bool, str | None, str | None]:
+) -> tuple[np.ndarray | None, int | None, str | None]:
     error = None
     try:
         audio, sr = soundfile.read(filename, dtype=np.float32)
     except Exception as exc:
         error = str(exc)
         if fallback_mode not in {"ffmpeg", "librosa", "ffmpeg_then_librosa"}:
-            return False, error, None
+            return None, None, error
         audio = None
         sr = None
     if audio is None:
@@ -126,57 +112,354 @@ def process_audio_file(
             ffmpeg_path = resolve_ffmpeg_path()
             if not ffmpeg_path:
                 if fallback_mode == "ffmpeg":
-                    return False, i18n.text("ffmpeg_not_found", language), None
+                    return None, None, i18n.text("ffmpeg_not_found", language)
             else:
                 audio, sr, ffmpeg_error = _read_with_ffmpeg(filename, ffmpeg_path)
                 if audio is None and fallback_mode == "ffmpeg":
-                    return False, i18n.text("ffmpeg_failed", language).format(error=ffmpeg_error or ""), None
+                    return None, None, i18n.text("ffmpeg_failed", language).format(error=ffmpeg_error or "")
                 if audio is None:
                     error = ffmpeg_error
         if audio is None and fallback_mode in {"librosa", "ffmpeg_then_librosa"}:
             audio, sr, librosa_error = _read_with_librosa(filename)
             if audio is None:
-                return False, librosa_error or error or "Decode failed.", None
+                return None, None, librosa_error or error or "Decode failed."
     if audio is None or sr is None:
-        return False, error or "Decode failed.", None
-
-    audio, is_mono = _prepare_audio(audio)
-    slicer = Slicer(
-        sr=sr,
-        threshold=threshold_db,
-        min_length=min_length,
-        min_interval=min_interval,
-        hop_size=hop_size,
-        max_sil_kept=max_silence,
-    )
-    rms_list = None
+        return None, None, error or "Decode failed."
+    return audio, sr, None
+
+
+def read_audio_with_progress(
+    filename: str,
+    *,
+    progress=None,
+    is_cancelled=None,
+    block_seconds: float = 10.0,
+) -> tuple[np.ndarray | None, int]:
+    """Read with soundfile block by block so long files can report progress and be cancelled.
+
+    Returns ``(None, sr)`` when cancelled. Read errors propagate like ``soundfile.read``.
+    """
+    with soundfile.SoundFile(filename) as f:
+        sr = f.samplerate
+        frames = f.frames
+        if frames <= 0:
+            audio = f.read(dtype=np.float32)
+            return audio, sr
+        out = np.empty((frames, f.channels), dtype=np.float32)
+        block = max(1, int(sr * block_seconds))
+        pos = 0
+        while pos < frames:
+            if is_cancelled and is_cancelled():
+                return None, sr
+            n = f.read(out=out[pos:pos + block], dtype=np.float32, always_2d=True).shape[0]
+            if n == 0:
+                break
+            pos += n
+            if progress:
+                progress(pos / frames)
+    out = out[:pos]
+    if out.shape[1] == 1:
+        out = out[:, 0]
+    return out, sr
+
+
+def _prepare_audio(audio: np.ndarray) -> tuple[np.ndarray, bool]:
+    is_mono = True
+    if audio.ndim > 1:
+        is_mono = False
+        audio = audio.T
+    return audio, is_mono
+
+
+def convert_for_export(
+    audio: np.ndarray,
+    sr: int,
+    *,
+    target_sr: int | None = None,
+    target_channels: int | None = None,
+) -> tuple[np.ndarray, int]:
+    """Remix channel-first ``audio`` to mono (``target_channels=1``) and resample it to ``target_sr``.
+
+    Runs once on the whole file, so every slice is cut from the converted
+    audio and written without a second read and resample pass.
+    """
+    if target_channels == 1 and audio.ndim > 1:
+        audio = AudioUtil.to_mono(audio)
+    if target_sr and target_sr != sr:
+        audio = AudioUtil.resample(np.ascontiguousarray(audio), orig_sr=sr, target_sr=target_sr)
+        sr = target_sr
+    return audio, sr
+
+
+def compute_spectral_features(slicer: Slicer, audio: np.ndarray, sr: int) -> tuple[np.ndarray, np.ndarray]:
+    """Speech-band level and flatness of channel-first ``audio`` on the frames of ``slicer``."""
+    samples = audio.mean(axis=0) if audio.ndim > 1 else audio
+    return spectral_vad_features(samples, sr, frame_length=slicer.win_size, hop_length=slicer.hop_size)
+
+
+def build_slice_analysis(
+    slicer: Slicer,
+    rms_list: np.ndarray | None,
+    *,
+    hop_size: int,
+    dynamic_enabled: bool,
+    dynamic_offset_db: float,
+    dynamic_window_sec: float,
+    vad_enabled: bool,
+    vad_sensitivity_db: float,
+    vad_hangover_ms: int,
+    vad_mode: str = "rms",
+    spectral_features: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[float | np.ndarray | None, np.ndarray | None]:
+    """Return the dynamic threshold and the VAD mask for ``rms_list``.
+
+    With ``dynamic_window_sec`` > 0 the dynamic threshold is a per-frame array
+    that follows the noise floor over windows of that length; otherwise it is
+    one value for the whole file.
+
+    ``vad_mode="spectral"`` builds the mask from ``spectral_features`` (see
+    ``compute_spectral_features``) instead of the RMS envelope; that mask is
+    meant to gate slicing, see ``Slicer.get_slice_tags(vad_gate=True)``.
+    """
     dynamic_threshold_db = None
     vad_mask = None
-    if dynamic_enabled or vad_enabled:
-        rms_list = slicer.get_rms_list(audio)
-    if dynamic_enabled and rms_list is not None:
+    if rms_list is None:
+        return dynamic_threshold_db, vad_mask
+    if dynamic_enabled and dynamic_window_sec > 0 and hop_size > 0:
+        dynamic_threshold_db = estimate_rolling_threshold_db(
+            rms_list,
+            block_frames=int(round(dynamic_window_sec * 1000 / hop_size)),
+            offset_db=dynamic_offset_db,
+        )
+    elif dynamic_enabled:
         dynamic_threshold_db = estimate_dynamic_threshold_db(rms_list, offset_db=dynamic_offset_db)
-    if vad_enabled and rms_list is not None:
+    if vad_enabled:
         base_threshold = dynamic_threshold_db if dynamic_threshold_db is not None else slicer.threshold_db
         hangover_frames = 0
         if vad_hangover_ms > 0 and hop_size > 0:
             hangover_frames = max(1, int(round(vad_hangover_ms / hop_size)))
-        vad_mask = build_vad_mask(
-            rms_list,
-            threshold_db=base_threshold,
-            sensitivity_db=vad_sensitivity_db,
-            hangover_frames=hangover_frames,
-        )
+        if vad_mode == "spectral" and spectral_features is not None:
+            vad_mask = build_spectral_vad_mask(
+                *spectral_features,
+                threshold_db=base_threshold,
+                sensitivity_db=vad_sensitivity_db,
+                hangover_frames=hangover_frames,
+            )
+        else:
+            vad_mask = build_vad_mask(
+                rms_list,
+                threshold_db=base_threshold,
+                sensitivity_db=vad_sensitivity_db,
+                hangover_frames=hangover_frames,
+            )
+    return dynamic_threshold_db, vad_mask
+
+
+def analyze_slice_tags(
+    slicer: Slicer,
+    audio: np.ndarray,
+    sr: int,
+    *,
+    filename: str,
+    cache_dir: str | None,
+    hop_size: int,
+    dynamic_enabled: bool,
+    dynamic_offset_db: float,
+    dynamic_window_sec: float,
+    vad_enabled: bool,
+    vad_sensitivity_db: float,
+    vad_hangover_ms: int,
+    vad_mode: str = "rms",
+    rms_list: np.ndarray | None = None,
+) -> tuple[list, int]:
+    """Silence tags and frame count of channel-first ``audio``, as ``process_audio_file`` slices it."""
+    if rms_list is None:
+        if cache_dir:
+            rms_list = AnalysisCache(cache_dir).rms_list(filename, slicer, audio)
+        elif dynamic_enabled or vad_enabled:
+            rms_list = slicer.get_rms_list(audio)
+    spectral_features = None
+    if vad_enabled and vad_mode == "spectral":
+        spectral_features = compute_spectral_features(slicer, audio, sr)
+    dynamic_threshold_db, vad_mask = build_slice_analysis(
+        slicer,
+        rms_list,
+        hop_size=hop_size,
+        dynamic_enabled=dynamic_enabled,
+        dynamic_offset_db=dynamic_offset_db,
+        dynamic_window_sec=dynamic_window_sec,
+        vad_enabled=vad_enabled,
+        vad_sensitivity_db=vad_sensitivity_db,
+        vad_hangover_ms=vad_hangover_ms,
+        vad_mode=vad_mode,
+        spectral_features=spectral_features,
+    )
     sil_tags, total_frames, _ = slicer.get_slice_tags(
         audio,
         dynamic_threshold_db=dynamic_threshold_db,
         vad_mask=vad_mask,
+        vad_gate=spectral_features is not None,
         rms_list=rms_list,
     )
-    chunks = slicer.slice(audio, sil_tags, total_frames)
+    return sil_tags, total_frames
+
+
+def process_audio_file(
+    filename: str,
+    *,
+    output_ext: str,
+    threshold_db: float,
+    min_length: int,
+    min_interval: int,
+    hop_size: int,
+    max_silence: int,
+    dynamic_enabled: bool,
+    dynamic_offset_db: float,
+    dynamic_window_sec: float,
+    vad_enabled: bool,
+    vad_sensitivity_db: float,
+    vad_hangover_ms: int,
+    name_prefix: str,
+    name_suffix: str,
+    name_timestamp: bool,
+    export_csv: bool,
+    export_json: bool,
+    output_dir: str | None,
+    fallback_mode: str,
+    language: str,
+    cache_dir: str | None = None,
+    output_mode: str = "files",
+    shard_size_mb: int = 1024,
+    export_labels: bool = False,
+    export_cue: bool = False,
+    export_manifest: bool = False,
+    target_sr: int | None = None,
+    target_channels: int | None = None,
+    output_subtype: str | None = None,
+    incremental: bool = False,
+    vad_mode: str = "rms",
+    is_cancelled=None,
+    report_status=None,
+    decoded: tuple[np.ndarray, int] | None = None,
+    slice_tags: tuple[list, int] | None = None,
+    slicer_engine: str = "rms",
+    fast_analysis: bool = False,
+    encoder_workers: int | None = None,
+) -> tuple[bool, str | None, str | None, list[dict]]:
+    """Slice one file and write the slices to ``output_dir``.
 
-    hop_ms = hop_size
-    ranges = _get_ranges(sil_tags, total_frames, hop_ms)
+    ``output_mode`` "files" writes one audio file per slice; "shards" appends
+    the slices to size-capped tar shards under ``<output_dir>/shards`` (see
+    ``ShardWriter``); "index" writes no audio at all, only the slice list with
+    sample-exact ranges into the source file (as JSON when no other list
+    export, including the batch manifest, is selected).
+
+    ``target_sr``, ``target_channels`` and ``output_subtype`` convert the
+    written slices (see ``convert_for_export``); the ranges in the records
+    always refer to the source file. mp3, opus and m4a slices are encoded by
+    ffmpeg on the process-wide encoder pool (mp3 falls back to soundfile when
+    ffmpeg is missing); the sample format only applies to wav/flac.
+
+    With ``incremental`` (file output only), slice files of the previous run
+    whose source, sample range and export settings are unchanged are kept
+    (see ``SliceState``) and only new or changed slices are written.
+
+    ``vad_mode`` "spectral" replaces the RMS-based VAD compensation with a
+    speech-band VAD that decides on its own which frames are voiced.
+
+    ``slicer_engine`` "legacy" cuts with ``LegacySlicer`` at sample positions
+    instead of hop frames; minimum interval and hop size become its long and
+    short window, and the dynamic threshold and VAD do not apply.
+
+    ``encoder_workers`` sizes the encoder pool of this process when the
+    first ffmpeg slice creates it (see ``encoder_workers`` in the encoder
+    module); process workers of a run get their share of the cores.
+
+    ``fast_analysis`` computes the RMS envelope from ~1 ms block energies
+    (see ``get_rms_decimated`` for its error against the exact kernel).
+
+    ``decoded`` (audio and sample rate as ``decode_audio`` returns them) and
+    ``slice_tags`` (silence tags and frame count of ``Slicer.get_slice_tags``)
+    skip decoding and analysis when a caller already did them, see
+    ``process_audio_group``.
+
+    ``report_status`` is called with "decoding", "slicing" and "writing" as
+    the stages begin. ``is_cancelled`` is polled between stages and between
+    slices; a cancelled run returns ``ok`` False with the "cancelled" text.
+
+    Returns ``(ok, error, out_dir, records)``; ``records`` holds one dict per
+    slice (ranges, peak and RMS level, output path) for a batch manifest.
+    """
+    ffmpeg_path = None
+    if output_ext in FFMPEG_CODECS:
+        output_subtype = None
+        if output_mode != "index":
+            ffmpeg_path = resolve_ffmpeg_path()
+            if ffmpeg_path is None and output_ext != "mp3":
+                return False, i18n.text("ffmpeg_not_found", language), None, []
+    if output_mode != "index" and output_subtype and not soundfile.check_format(output_ext.upper(), output_subtype):
+        return False, i18n.text("output_subtype_unsupported", language).format(
+            subtype=output_subtype,
+            format=output_ext,
+        ), None, []
+    if report_status:
+        report_status("decoding")
+    if decoded is not None:
+        (audio, sr), error = decoded, None
+    else:
+        audio, sr, error = decode_audio(filename, fallback_mode=fallback_mode, language=language)
+    if audio is None or sr is None:
+        return False, error or "Decode failed.", None, []
+    if is_cancelled and is_cancelled():
+        return False, i18n.text("cancelled", language), None, []
+    if report_status:
+        report_status("slicing")
+
+    audio, _ = _prepare_audio(audio)
+    total_samples = audio.shape[-1]
+    if slicer_engine == "legacy":
+        legacy_slicer = LegacySlicer(
+            sr=sr,
+            db_threshold=threshold_db,
+            min_length=min_length,
+            win_l=min_interval,
+            win_s=hop_size,
+            max_silence_kept=max_silence,
+        )
+        ranges = legacy_slicer.get_sample_ranges(legacy_slicer.get_slice_tags(audio), total_samples)
+    else:
+        slicer = Slicer(
+            sr=sr,
+            threshold=threshold_db,
+            min_length=min_length,
+            min_interval=min_interval,
+            hop_size=hop_size,
+            max_sil_kept=max_silence,
+            fast_analysis=fast_analysis,
+        )
+        if slice_tags is not None:
+            sil_tags, total_frames = slice_tags
+        else:
+            sil_tags, total_frames = analyze_slice_tags(
+                slicer,
+                audio,
+                sr,
+                filename=filename,
+                cache_dir=cache_dir,
+                hop_size=hop_size,
+                dynamic_enabled=dynamic_enabled,
+                dynamic_offset_db=dynamic_offset_db,
+                dynamic_window_sec=dynamic_window_sec,
+                vad_enabled=vad_enabled,
+                vad_sensitivity_db=vad_sensitivity_db,
+                vad_hangover_ms=vad_hangover_ms,
+                vad_mode=vad_mode,
+            )
+        ranges = get_sample_ranges(sil_tags, total_frames, slicer.hop_size, total_samples)
+    if is_cancelled and is_cancelled():
+        return False, i18n.text("cancelled", language), None, []
+    if report_status:
+        report_status("writing")
     out_dir = output_dir or os.path.dirname(os.path.abspath(filename))
     info = Path(out_dir)
     info.mkdir(parents=True, exist_ok=True)
@@ -188,53 +471,201 @@ def process_audio_file(
         file_core = f"{file_core}_{time_tag}"
 
     slice_records = []
-    for i, chunk in enumerate(chunks):
-        path = os.path.join(out_dir, f"{file_core}_{i}.{output_ext}")
-        if not is_mono:
-            chunk = chunk.T
-        soundfile.write(path, chunk, sr)
-        if i < len(ranges):
-            start_ms, end_ms = ranges[i]
-        else:
-            start_ms, end_ms = None, None
-        length_ms = (end_ms - start_ms) if start_ms is not None and end_ms is not None else None
-        slice_records.append(
-            {
+    state = None
+    identities = []
+    kept = {}
+    source = source_identity(filename) if incremental and output_mode == "files" else None
+    if source is not None:
+        settings = f"{output_ext}|{target_sr}|{target_channels}|{output_subtype}|{FFMPEG_CODECS.get(output_ext)}"
+        identities = [slice_identity(source, start, end, settings) for start, end in ranges]
+        state = SliceState(str(out_dir), file_core)
+        kept = state.plan(identities)
+    out_audio, out_sr, out_scale = audio, sr, 1.0
+    if output_mode != "index" and len(kept) < len(ranges):
+        out_audio, out_sr = convert_for_export(audio, sr, target_sr=target_sr, target_channels=target_channels)
+        out_scale = out_sr / sr
+    encodes = []
+    cancelled = False
+    shard_writer = None
+    if output_mode == "shards":
+        shard_writer = ShardWriter(os.path.join(out_dir, "shards"), max_bytes=shard_size_mb * 1024 * 1024)
+    # ffmpeg encodes of shard members, written in slice order as they finish.
+    pending_shards = deque()
+
+    def _write_shards(keep: int):
+        # Waits for the oldest encode while more than ``keep`` are pending.
+        while pending_shards and (len(pending_shards) > keep or pending_shards[0][1].done()):
+            key, future, metadata, shard_record = pending_shards.popleft()
+            if future.exception() is None:
+                entry = shard_writer.write(key, future.result(), output_ext, metadata)
+                shard_record["output_path"] = f"{shard_writer.path}#{entry['audio']['name']}"
+
+    try:
+        for i, (start, end) in enumerate(ranges):
+            if is_cancelled and is_cancelled():
+                cancelled = True
+                break
+            record = {
                 "index": i,
-                "start_ms": start_ms,
-                "end_ms": end_ms,
-                "length_ms": length_ms,
-                "output_path": path,
+                "start_sample": start,
+                "end_sample": end,
+                "sample_rate": sr,
+                "start_ms": round(start * 1000 / sr, 3),
+                "end_ms": round(end * 1000 / sr, 3),
+                "length_ms": round((end - start) * 1000 / sr, 3),
+                "output_path": None,
                 "source_file": filename,
             }
-        )
+            # The same samples ``Slicer.slice`` would cut.
+            record.update(_level_stats(audio[..., start:end]))
+            if output_mode == "index":
+                slice_records.append(record)
+                continue
+            chunk = out_audio[..., int(round(start * out_scale)):int(round(end * out_scale))]
+            if chunk.ndim > 1:
+                chunk = chunk.T
+            if shard_writer is not None:
+                metadata = {key: value for key, value in record.items() if key != "output_path"}
+                if ffmpeg_path:
+                    pool = shared_encoder_pool(encoder_workers)
+                    encodes.append(pool.submit_bytes(chunk, out_sr, output_ext, ffmpeg_path))
+                    pending_shards.append((f"{file_core}_{i}", encodes[-1], metadata, record))
+                    _write_shards(2 * pool.max_workers)
+                else:
+                    entry = shard_writer.write(
+                        f"{file_core}_{i}",
+                        encode_audio(chunk, out_sr, output_ext, output_subtype),
+                        output_ext,
+                        metadata,
+                    )
+                    record["output_path"] = f"{shard_writer.path}#{entry['audio']['name']}"
+            else:
+                path = os.path.join(out_dir, f"{file_core}_{i}.{output_ext}")
+                if identities and identities[i] in kept:
+                    os.replace(kept[identities[i]], path)
+                elif ffmpeg_path:
+                    encodes.append(shared_encoder_pool(encoder_workers).submit(chunk, out_sr, path, output_ext, ffmpeg_path))
+                else:
+                    soundfile.write(path, chunk, out_sr, subtype=output_subtype)
+                record["output_path"] = path
+            slice_records.append(record)
+        _write_shards(0)
+    finally:
+        if shard_writer is not None:
+            shard_writer.close()
+        # Kept slices the loop did not reach (cancelled or failed) move to
+        # their file of this run, so an interrupted re-run deletes nothing.
+        restored = {}
+        for i, identity in enumerate(identities):
+            temp_path = kept.get(identity)
+            if temp_path is not None and os.path.exists(temp_path):
+                restored[i] = os.path.join(out_dir, f"{file_core}_{i}.{output_ext}")
+                os.replace(temp_path, restored[i])
+    errors = [future.exception() for future in encodes]
+    errors = [str(exc) for exc in errors if exc is not None]
+    if state is not None:
+        written = []
+        paths = [(identity, record["output_path"]) for identity, record in zip(identities, slice_records)]
+        paths += [(identities[i], path) for i, path in restored.items()]
+        for identity, path in paths:
+            try:
+                written.append({"id": identity, "path": path, "size": os.path.getsize(path)})
+            except OSError:
+                continue
+        state.save(written)
+    if cancelled:
+        return False, i18n.text("cancelled", language), str(out_dir), []
+    if errors:
+        return False, i18n.text("ffmpeg_failed", language).format(error=errors[0]), str(out_dir), []
 
     if export_csv:
         csv_path = os.path.join(out_dir, f"{file_core}_slices.csv")
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(
                 f,
-                fieldnames=["index", "start_ms", "end_ms", "length_ms", "output_path", "source_file"],
+                fieldnames=[
+                    "index",
+                    "start_sample",
+                    "end_sample",
+                    "sample_rate",
+                    "start_ms",
+                    "end_ms",
+                    "length_ms",
+                    "peak_db",
+                    "rms_db",
+                    "output_path",
+                    "source_file",
+                ],
             )
             writer.writeheader()
             for record in slice_records:
                 writer.writerow({key: "" if value is None else value for key, value in record.items()})
-    if export_json:
+    if export_json or (
+        output_mode == "index" and not (export_csv or export_labels or export_cue or export_manifest)
+    ):
         json_path = os.path.join(out_dir, f"{file_core}_slices.json")
         with open(json_path, "w", encoding="utf-8") as f:
             json.dump(slice_records, f, ensure_ascii=False, indent=2)
+    if export_labels:
+        _write_audacity_labels(os.path.join(out_dir, f"{file_core}_labels.txt"), slice_records, file_core)
+    if export_cue:
+        _write_cue_sheet(os.path.join(out_dir, f"{file_core}.cue"), filename, slice_records, file_core)
 
-    return True, None, str(out_dir)
+    return True, None, str(out_dir), slice_records
 
 
-def _get_ranges(sil_tags, total_frames: int, hop_ms: int):
+def _level_stats(chunk: np.ndarray) -> dict:
+    if chunk.size == 0:
+        return {"peak_db": None, "rms_db": None}
+    peak = float(np.max(np.abs(chunk)))
+    rms = float(np.sqrt(np.mean(np.square(chunk, dtype=np.float64))))
+    return {
+        "peak_db": round(float(rms_to_db(np.float64(peak))), 2),
+        "rms_db": round(float(rms_to_db(np.float64(rms))), 2),
+    }
+
+
+def get_sample_ranges(sil_tags, total_frames: int, hop_size: int, total_samples: int) -> list[tuple[int, int]]:
+    """Sample ranges of the chunks ``Slicer.slice`` returns for ``sil_tags``.
+
+    Frames are converted with the slicer's own hop in samples, so the ranges
+    do not drift the way ``frame * hop_ms`` does when ``sr * hop_ms / 1000``
+    is not a whole number.
+    """
+    def _span(begin: int, end: int) -> tuple[int, int]:
+        return int(begin) * hop_size, min(total_samples, int(end) * hop_size)
+
     if len(sil_tags) == 0:
-        return [(0, total_frames * hop_ms)]
+        return [(0, total_samples)]
     ranges = []
     if sil_tags[0][0] > 0:
-        ranges.append((0, sil_tags[0][0] * hop_ms))
+        ranges.append(_span(0, sil_tags[0][0]))
     for i in range(len(sil_tags) - 1):
-        ranges.append((sil_tags[i][1] * hop_ms, sil_tags[i + 1][0] * hop_ms))
+        ranges.append(_span(sil_tags[i][1], sil_tags[i + 1][0]))
     if sil_tags[-1][1] < total_frames:
-        ranges.append((sil_tags[-1][1] * hop_ms, total_frames * hop_ms))
+        ranges.append(_span(sil_tags[-1][1], total_frames))
     return ranges
+
+
+def _write_audacity_labels(path: str, records: list[dict], file_core: str):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            start = record["start_sample"] / record["sample_rate"]
+            end = record["end_sample"] / record["sample_rate"]
+            f.write(f"{start:.6f}\t{end:.6f}\t{file_core}_{record['index']}\n")
+
+
+def _write_cue_sheet(path: str, source_file: str, records: list[dict], file_core: str):
+    # CUE positions are mm:ss:ff with 75 frames per second; a sheet only marks
+    # where each track starts, so removed silence stays in the previous track.
+    file_type = "MP3" if source_file.lower().endswith(".mp3") else "WAVE"
+    lines = [f'FILE "{os.path.basename(source_file)}" {file_type}']
+    for record in records:
+        frames = int(round(record["start_sample"] * 75 / record["sample_rate"]))
+        minutes, frames = divmod(frames, 75 * 60)
+        seconds, frames = divmod(frames, 75)
+        lines.append(f"  TRACK {record['index'] + 1:02d} AUDIO")
+        lines.append(f'    TITLE "{file_core}_{record["index"]}"')
+        lines.append(f"    INDEX 01 {minutes:02d}:{seconds:02d}:{frames:02d}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
@@ -0,0 +1,269 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import numpy as np
+import soundfile
+
+from audio_slicer.utils.slicer2 import DbHistogram, get_rms, rms_to_db
+
+_ANALYSIS_HOP_MS = 10
+
+
+def run_lengths(mask: np.ndarray, *, drop_edges: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """Return the lengths of the True runs and of the False runs of ``mask``.
+
+    With ``drop_edges`` the first and last run are left out, because in an
+    excerpt they are cut off by the window and would bias the lengths down.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    if mask.shape[0] == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(mask.astype(np.int8))) + 1))
+    lengths = np.diff(np.append(starts, mask.shape[0]))
+    values = mask[starts]
+    if drop_edges:
+        starts, lengths, values = starts[1:-1], lengths[1:-1], values[1:-1]
+    return lengths[values], lengths[~values]
+
+
+def _rms_db(samples: np.ndarray, sr: int, hop_ms: int) -> np.ndarray:
+    hop_length = max(1, int(sr * hop_ms / 1000))
+    win_length = max(hop_length, min(int(sr * 0.03), 4 * hop_length))
+    rms_list = get_rms(y=samples, frame_length=win_length, hop_length=hop_length).squeeze(0)
+    return rms_to_db(rms_list)
+
+
+def analyze_file_windows(
+    filename: str,
+    *,
+    windows: int,
+    window_seconds: float,
+    seed: int,
+    spacing: str = "random",
+    hop_ms: int = _ANALYSIS_HOP_MS,
+) -> dict:
+    """Read ``windows`` excerpts of a file through ``SoundFile.seek``.
+
+    Excerpts are placed at random (``spacing="random"``) or evenly from start
+    to end (``spacing="even"``). Files shorter than the excerpts together are
+    read whole. Returns the dB histogram of the excerpts and their RMS in dB
+    for the run-length pass.
+    """
+    with soundfile.SoundFile(filename) as f:
+        sr = f.samplerate
+        frames = f.frames
+        window_frames = max(1, int(window_seconds * sr))
+        if frames <= 0 or not f.seekable() or frames <= windows * window_frames:
+            starts = [0]
+            window_frames = frames if frames > 0 else -1
+        elif spacing == "even":
+            starts = np.linspace(0, frames - window_frames, windows).astype(np.int64).tolist()
+        else:
+            rng = random.Random(f"{seed}:{os.path.basename(filename)}")
+            starts = sorted(rng.sample(range(frames - window_frames), windows))
+        segments = []
+        for start in starts:
+            if start:
+                f.seek(start)
+            block = f.read(window_frames, dtype=np.float32, always_2d=True)
+            if block.shape[0] == 0:
+                continue
+            segments.append(_rms_db(block.mean(axis=1), sr, hop_ms))
+    histogram = DbHistogram()
+    for rms_db in segments:
+        histogram.update(rms_db)
+    return {
+        "filename": filename,
+        "duration_sec": frames / sr if frames > 0 else 0.0,
+        "histogram": histogram,
+        "segments": segments,
+        "whole": len(starts) == 1 and starts[0] == 0,
+    }
+
+
+def recommend_from_analysis(
+    histogram: DbHistogram,
+    segments: list[tuple[np.ndarray, bool]],
+    *,
+    duration_sec: float,
+    task_count: int,
+    hop_ms: int = _ANALYSIS_HOP_MS,
+) -> dict:
+    """Turn a merged dB histogram and RMS segments into slicing parameters.
+
+    ``segments`` holds ``(rms_db, whole)`` pairs; runs touching the edges of
+    excerpts (``whole`` False) are ignored.
+    """
+    noise_floor = histogram.percentile(20)
+    threshold_db = float(np.clip(noise_floor + 6.0, -80.0, -10.0))
+
+    sil_frames = []
+    voice_frames = []
+    for rms_db, whole in segments:
+        silent_runs, voice_runs = run_lengths(rms_db < threshold_db, drop_edges=not whole)
+        sil_frames.append(silent_runs)
+        voice_frames.append(voice_runs)
+    sil_ms = np.concatenate(sil_frames) * hop_ms if sil_frames else np.zeros(0)
+    voice_ms = np.concatenate(voice_frames) * hop_ms if voice_frames else np.zeros(0)
+
+    recommended_hop = 20 if duration_sec > 1200 else 10
+    min_interval = int(np.clip(np.percentile(sil_ms, 50), 200, 1200)) if sil_ms.size else 300
+    max_silence = int(np.clip(np.percentile(sil_ms, 90), 500, 5000)) if sil_ms.size else 1000
+    min_length = int(np.clip(np.percentile(voice_ms, 20), 500, 8000)) if voice_ms.size else 5000
+    min_interval = max(min_interval, recommended_hop)
+    max_silence = max(max_silence, recommended_hop)
+    min_length = max(min_length, min_interval)
+
+    parallel_mode = "thread" if task_count > 1 else "single"
+    parallel_jobs = min(4, max(1, (os.cpu_count() or 1)))
+
+    return {
+        "threshold_db": round(threshold_db, 1),
+        "min_length": min_length,
+        "min_interval": min_interval,
+        "hop_size": recommended_hop,
+        "max_silence": max_silence,
+        "dynamic_enabled": True,
+        "dynamic_offset_db": 6.0,
+        "vad_enabled": True,
+        "vad_sensitivity_db": 6.0,
+        "vad_hangover_ms": 120,
+        "parallel_mode": parallel_mode,
+        "parallel_jobs": parallel_jobs,
+        "fallback_mode": "ffmpeg_then_librosa",
+    }
+
+
+_INTERVAL_KEYS = ("threshold_db", "min_length", "min_interval", "max_silence")
+
+
+def recommend_for_file_excerpts(
+    filename: str,
+    *,
+    task_count: int,
+    excerpts: int = 12,
+    excerpt_seconds: float = 15.0,
+    confidence: float = 0.9,
+    resamples: int = 200,
+    seed: int = 0,
+) -> dict:
+    """Fast recommendation from evenly spaced excerpts of one file.
+
+    Only ``excerpts * excerpt_seconds`` of audio is read, so the latency does
+    not depend on the file length. The uncertainty of sampling is estimated by
+    bootstrapping over excerpts; ``rec["intervals"]`` maps the threshold and
+    length parameters to their ``confidence`` interval and ``rec["excerpts"]``
+    is the number of excerpts actually read.
+    """
+    result = analyze_file_windows(
+        filename,
+        windows=excerpts,
+        window_seconds=excerpt_seconds,
+        seed=seed,
+        spacing="even",
+    )
+    segments = result["segments"]
+    whole = result["whole"]
+    histograms = [DbHistogram().update(rms_db) for rms_db in segments]
+    rec = recommend_from_analysis(
+        result["histogram"],
+        [(rms_db, whole) for rms_db in segments],
+        duration_sec=result["duration_sec"],
+        task_count=task_count,
+    )
+    rec["excerpts"] = len(segments)
+    if len(segments) < 2:
+        rec["intervals"] = {key: (rec[key], rec[key]) for key in _INTERVAL_KEYS}
+        return rec
+    rng = np.random.default_rng(seed)
+    draws = {key: [] for key in _INTERVAL_KEYS}
+    for _ in range(resamples):
+        picks = rng.integers(0, len(segments), len(segments))
+        histogram = DbHistogram()
+        for i in picks:
+            histogram.merge(histograms[i])
+        sample = recommend_from_analysis(
+            histogram,
+            [(segments[i], whole) for i in picks],
+            duration_sec=result["duration_sec"],
+            task_count=task_count,
+        )
+        for key in _INTERVAL_KEYS:
+            draws[key].append(sample[key])
+    tail = (1.0 - confidence) / 2 * 100
+    rec["intervals"] = {
+        key: tuple(float(v) for v in np.percentile(values, [tail, 100 - tail]))
+        for key, values in draws.items()
+    }
+    return rec
+
+
+def recommend_for_audio(audio: np.ndarray, sr: int, task_count: int) -> dict:
+    """Recommendation from one fully decoded (channel-first) file."""
+    samples = audio.mean(axis=0) if audio.ndim > 1 else audio
+    rms_db = _rms_db(samples, sr, _ANALYSIS_HOP_MS)
+    return recommend_from_analysis(
+        DbHistogram().update(rms_db),
+        [(rms_db, True)],
+        duration_sec=len(samples) / max(sr, 1),
+        task_count=task_count,
+    )
+
+
+def recommend_for_corpus(
+    filenames: list[str],
+    *,
+    max_files: int = 32,
+    windows_per_file: int = 8,
+    window_seconds: float = 20.0,
+    parallel_mode: str = "thread",
+    jobs: int = 4,
+    seed: int = 0,
+    progress=None,
+    is_cancelled=None,
+) -> tuple[dict | None, list[tuple[str, str]]]:
+    """Recommend parameters for a whole task list from sampled excerpts.
+
+    At most ``max_files`` files are drawn and at most ``windows_per_file``
+    excerpts are read from each, so the cost is bounded by
+    ``max_files * windows_per_file * window_seconds`` of audio no matter how
+    large the corpus is. Per-file histograms are summed into corpus-wide
+    percentiles. Returns ``(recommendation, errors)``; the recommendation is
+    None when cancelled or when no file could be read.
+    """
+    chosen = list(filenames)
+    if len(chosen) > max_files:
+        chosen = random.Random(seed).sample(chosen, max_files)
+    kwargs = {"windows": windows_per_file, "window_seconds": window_seconds, "seed": seed}
+    results = []
+    errors = []
+    total = len(chosen)
+    executor_cls = ProcessPoolExecutor if parallel_mode == "process" else ThreadPoolExecutor
+    with executor_cls(max_workers=max(1, jobs)) as executor:
+        futures = {executor.submit(analyze_file_windows, filename, **kwargs): filename for filename in chosen}
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                errors.append((futures[future], str(exc)))
+            if progress:
+                progress(done, total)
+            if is_cancelled and is_cancelled():
+                executor.shutdown(wait=True, cancel_futures=True)
+                return None, errors
+    if not results:
+        return None, errors
+    histogram = DbHistogram()
+    for result in results:
+        histogram.merge(result["histogram"])
+    segments = [(rms_db, result["whole"]) for result in results for rms_db in result["segments"]]
+    durations = [result["duration_sec"] for result in results]
+    recommendation = recommend_from_analysis(
+        histogram,
+        segments,
+        duration_sec=float(np.median(durations)),
+        task_count=len(filenames),
+    )
+    return recommendation, errors
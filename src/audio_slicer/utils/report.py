@@ -0,0 +1,217 @@
+import html
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from audio_slicer.modules import i18n
+from audio_slicer.utils.cache import AnalysisCache
+from audio_slicer.utils.preview import (DISTRIBUTION_ITEMS, PeakEnvelope, PreviewAnalysis, get_length_distribution,
+                                        get_length_ranking, preview_texts, render_preview)
+from audio_slicer.utils.processing import decode_audio
+
+
+def _empty_entry(filename: str, error: str | None = None) -> dict:
+    return {
+        "filename": filename,
+        "image": None,
+        "duration_sec": 0.0,
+        "slice_count": 0,
+        "distribution": [0] * len(DISTRIBUTION_ITEMS),
+        "ranking": ([], []),
+        "error": error,
+    }
+
+
+def build_report_entry(
+    filename: str,
+    *,
+    options: dict,
+    image_path: str,
+    theme: str,
+    language: str,
+    cache_dir: str | None = None,
+) -> dict:
+    """Analyze one file with the slicing options and render its preview image.
+
+    Runs in report workers, so decode failures are returned in the entry
+    instead of asking for a fallback decoder.
+    """
+    entry = _empty_entry(filename)
+    fallback_mode = options["fallback_mode"]
+    if fallback_mode == "ask":
+        fallback_mode = "skip"
+    audio, sr, error = decode_audio(filename, fallback_mode=fallback_mode, language=language)
+    if audio is None:
+        entry["error"] = error or "Decode failed."
+        return entry
+    if audio.ndim > 1:
+        audio = audio.T
+    cache = AnalysisCache(cache_dir) if cache_dir else None
+    analysis = PreviewAnalysis(filename, audio, sr, cache=cache)
+    ranges, overlay = analysis.analyze(options)
+    lengths_sec = [(end - start) / 1000.0 for start, end in ranges]
+    image = render_preview(PeakEnvelope(analysis.samples, sr), ranges, overlay=overlay, theme=theme,
+                           language=language)
+    with open(image_path, "wb") as f:
+        f.write(image)
+    entry.update(
+        image=image_path,
+        duration_sec=analysis.duration_ms / 1000.0,
+        slice_count=len(ranges),
+        distribution=get_length_distribution(lengths_sec),
+        ranking=get_length_ranking(lengths_sec),
+    )
+    return entry
+
+
+def _image_name(index: int, filename: str) -> str:
+    base_name = os.path.basename(filename).rsplit(".", maxsplit=1)[0]
+    safe_name = re.sub(r"[^\w.-]+", "_", base_name)
+    return f"{index:04d}_{safe_name}.png"
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+def _distribution_table(values: list[int]) -> str:
+    head = "".join(f"<th>{html.escape(item)}</th>" for item in DISTRIBUTION_ITEMS)
+    body = "".join(f"<td>{value}</td>" for value in values)
+    return f"<table><tr>{head}</tr><tr>{body}</tr></table>"
+
+
+def write_report_index(entries: list[dict], report_dir: str, *, language: str) -> str:
+    texts = preview_texts(language)
+    title = i18n.text("report_title", language)
+    total_distribution = [sum(values) for values in zip(*(entry["distribution"] for entry in entries))]
+    total_slices = sum(entry["slice_count"] for entry in entries)
+    total_duration = sum(entry["duration_sec"] for entry in entries)
+    failed = [entry for entry in entries if entry["error"]]
+
+    parts = [
+        "<!DOCTYPE html>",
+        f'<html lang="{html.escape(language)}"><head><meta charset="utf-8">',
+        f"<title>{html.escape(title)}</title>",
+        "<style>"
+        "body{font-family:'Microsoft YaHei','Segoe UI',sans-serif;margin:24px;color:#202124;background:#f8f9fa}"
+        "section{background:#fff;border:1px solid #dadce0;border-radius:6px;padding:12px 16px;margin:16px 0}"
+        "h2{font-size:15px;word-break:break-all}img{max-width:100%;height:auto}"
+        "table{border-collapse:collapse;margin:8px 0}th,td{border:1px solid #dadce0;padding:2px 8px;text-align:center}"
+        ".error{color:#c5221f}"
+        "</style></head><body>",
+        f"<h1>{html.escape(title)}</h1>",
+        "<p>"
+        f"{html.escape(i18n.text('report_files', language))}: {len(entries)} &middot; "
+        f"{html.escape(i18n.text('report_slices', language))}: {total_slices} &middot; "
+        f"{html.escape(i18n.text('report_duration', language))}: {_format_duration(total_duration)}"
+        "</p>",
+        f"<h3>{html.escape(texts['length_distribution'])}</h3>",
+        _distribution_table(total_distribution or [0] * len(DISTRIBUTION_ITEMS)),
+    ]
+    if failed:
+        parts.append(f"<h3 class=\"error\">{html.escape(i18n.text('report_failed', language))}: {len(failed)}</h3><ul>")
+        for entry in failed:
+            parts.append(f"<li>{html.escape(entry['filename'])}</li>")
+        parts.append("</ul>")
+    for entry in entries:
+        parts.append("<section>")
+        parts.append(f"<h2>{html.escape(entry['filename'])}</h2>")
+        if entry["error"]:
+            parts.append(f"<p class=\"error\">{html.escape(entry['error'])}</p></section>")
+            continue
+        parts.append(
+            "<p>"
+            f"{html.escape(i18n.text('report_slices', language))}: {entry['slice_count']} &middot; "
+            f"{html.escape(i18n.text('report_duration', language))}: {_format_duration(entry['duration_sec'])}"
+            "</p>"
+        )
+        image = os.path.relpath(entry["image"], report_dir).replace(os.sep, "/")
+        parts.append(f'<img loading="lazy" src="{html.escape(image)}" alt="">')
+        parts.append(f"<h3>{html.escape(texts['length_distribution'])}</h3>")
+        parts.append(_distribution_table(entry["distribution"]))
+        items, values = entry["ranking"]
+        parts.append(f"<h3>{html.escape(texts['length_ranking'])}</h3><table>")
+        for item, value in zip(reversed(items), reversed(values)):
+            parts.append(f"<tr><td>{html.escape(item)}</td><td>{value:.3f} s</td></tr>")
+        parts.append("</table></section>")
+    parts.append("</body></html>")
+
+    index_path = os.path.join(report_dir, "index.html")
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+    return index_path
+
+
+def generate_report(
+    filenames: list[str],
+    report_dir: str,
+    *,
+    options: dict,
+    theme: str = "light",
+    language: str = "en",
+    parallel_mode: str = "thread",
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    progress=None,
+    is_cancelled=None,
+) -> tuple[bool, str | None, str | None]:
+    """Analyze and render every file in parallel and write ``index.html``.
+
+    Returns ``(ok, error, index_path)``; ``ok`` is False with no error when
+    cancelled through ``is_cancelled``.
+    """
+    image_dir = os.path.join(report_dir, "images")
+    try:
+        os.makedirs(image_dir, exist_ok=True)
+    except OSError as exc:
+        return False, str(exc), None
+    total = len(filenames)
+    entries: list[dict | None] = [None] * total
+
+    def _kwargs(index: int, filename: str) -> dict:
+        return {
+            "options": options,
+            "image_path": os.path.join(image_dir, _image_name(index, filename)),
+            "theme": theme,
+            "language": language,
+            "cache_dir": cache_dir,
+        }
+
+    if parallel_mode == "single" or total <= 1:
+        for index, filename in enumerate(filenames):
+            if is_cancelled and is_cancelled():
+                return False, None, None
+            try:
+                entries[index] = build_report_entry(filename, **_kwargs(index, filename))
+            except Exception as exc:
+                entries[index] = _empty_entry(filename, str(exc))
+            if progress:
+                progress(index + 1, total)
+    else:
+        executor_cls = ProcessPoolExecutor if parallel_mode == "process" else ThreadPoolExecutor
+        with executor_cls(max_workers=max(1, jobs)) as executor:
+            futures = {
+                executor.submit(build_report_entry, filename, **_kwargs(index, filename)): index
+                for index, filename in enumerate(filenames)
+            }
+            done = 0
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    entries[index] = future.result()
+                except Exception as exc:
+                    entries[index] = _empty_entry(filenames[index], str(exc))
+                done += 1
+                if progress:
+                    progress(done, total)
+                if is_cancelled and is_cancelled():
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    return False, None, None
+
+    try:
+        index_path = write_report_index(entries, report_dir, language=language)
+    except OSError as exc:
+        return False, str(exc), None
+    return True, None, index_path
@@ -0,0 +1,160 @@
+import io
+import json
+import os
+import re
+import tarfile
+import time
+
+import numpy as np
+import soundfile
+
+_BLOCK = tarfile.BLOCKSIZE
+_TRAILER = b"\0" * (2 * _BLOCK)
+_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def shard_key(name: str) -> str:
+    # WebDataset splits the member name at the first dot into key and extension.
+    return re.sub(r"[.\s/\\]+", "_", name)
+
+
+class ShardWriter:
+    """Append slices to size-capped, WebDataset-style tar shards.
+
+    Every slice becomes ``<key>.<ext>`` (the encoded audio) and ``<key>.json``
+    (its metadata) in ``<directory>/<prefix>-NNNNNN.tar``. Next to each shard,
+    ``<shard>.idx.jsonl`` lists the byte offset and size of every member, so a
+    single slice can be read back with one seek (see ``read_member``).
+
+    A shard is claimed through an exclusive ``.lock`` file for as long as the
+    writer is open, so threads and worker processes that slice different
+    sources at the same time each append to their own shard. Shards are kept
+    valid tar files (with an end-of-archive trailer) whenever they are released
+    and are reopened for appending until they reach ``max_bytes``. A lock left
+    behind by a crashed process only keeps that shard from being reused.
+    """
+
+    def __init__(self, directory: str, *, prefix: str = "slices", max_bytes: int = 1024 * 1024 * 1024):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max(int(max_bytes), _BLOCK * 4)
+        self._path = None
+        self._file = None
+        self._index = None
+        self._offset = 0
+
+    def __enter__(self) -> "ShardWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def path(self) -> str | None:
+        return self._path
+
+    def _shard_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{number:06d}.tar")
+
+    def _acquire(self):
+        os.makedirs(self.directory, exist_ok=True)
+        number = 0
+        while True:
+            path = self._shard_path(number)
+            number += 1
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0
+            if size >= self.max_bytes:
+                continue
+            try:
+                fd = os.open(f"{path}.lock", os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, "w") as lock:
+                lock.write(f"{os.getpid()} {time.time():.0f}\n")
+            # Reopen for appending in place of the trailer written on release.
+            mode = "r+b" if os.path.exists(path) else "w+b"
+            self._file = open(path, mode, buffering=_BUFFER_SIZE)
+            self._offset = max(0, os.path.getsize(path) - len(_TRAILER)) if mode == "r+b" else 0
+            self._file.seek(self._offset)
+            self._index = open(f"{path}.idx.jsonl", "a", encoding="utf-8")
+            self._path = path
+            return
+
+    def _release(self):
+        if self._file is None:
+            return
+        self._file.write(_TRAILER)
+        self._file.truncate()
+        self._file.close()
+        self._index.close()
+        os.remove(f"{self._path}.lock")
+        self._file = None
+        self._index = None
+        self._path = None
+
+    def _add_member(self, name: str, data: bytes, mtime: float) -> dict:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = mtime
+        info.mode = 0o644
+        header = info.tobuf(format=tarfile.PAX_FORMAT)
+        self._file.write(header)
+        self._file.write(data)
+        padding = -len(data) % _BLOCK
+        if padding:
+            self._file.write(b"\0" * padding)
+        member = {"name": name, "offset": self._offset + len(header), "size": len(data)}
+        self._offset += len(header) + len(data) + padding
+        return member
+
+    def write(self, key: str, audio: bytes, audio_ext: str, metadata: dict) -> dict:
+        """Append one slice and return its index record."""
+        if self._file is not None and self._offset >= self.max_bytes:
+            self._release()
+        if self._file is None:
+            self._acquire()
+        key = shard_key(key)
+        mtime = time.time()
+        record = {
+            "key": key,
+            "shard": os.path.basename(self._path),
+            "audio": self._add_member(f"{key}.{audio_ext}", audio, mtime),
+        }
+        meta = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+        record["json"] = self._add_member(f"{key}.json", meta, mtime)
+        self._index.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return record
+
+    def close(self):
+        self._release()
+
+
+def load_shard_index(directory: str) -> dict[str, dict]:
+    """Map slice keys to their index records for every shard in ``directory``."""
+    records = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".idx.jsonl"):
+            continue
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record["key"]] = record
+    return records
+
+
+def read_member(directory: str, record: dict, member: str = "audio") -> bytes:
+    """Read the audio (or ``"json"``) member of one indexed slice."""
+    entry = record[member]
+    with open(os.path.join(directory, record["shard"]), "rb") as f:
+        f.seek(entry["offset"])
+        return f.read(entry["size"])
+
+
+def encode_audio(chunk: np.ndarray, sr: int, output_ext: str, subtype: str | None = None) -> bytes:
+    buffer = io.BytesIO()
+    soundfile.write(buffer, chunk, sr, format=output_ext.upper(), subtype=subtype)
+    return buffer.getvalue()
@@ -0,0 +1,190 @@
+import numpy as np
+import soundfile
+
+from audio_slicer.utils.cache import AnalysisCache
+from audio_slicer.utils.preview import get_slice_ranges_ms
+from audio_slicer.utils.processing import decode_audio
+from audio_slicer.utils.slicer2 import DbHistogram, Slicer
+
+_COARSE_PERCENTILES = (10, 20, 30, 40, 50, 60, 70)
+_COARSE_INTERVALS_MS = (100, 200, 300, 500, 800)
+_FINE_THRESHOLD_STEPS_DB = (-3.0, -1.5, 0.0, 1.5, 3.0)
+_FINE_LENGTH_FACTORS = (0.5, 0.75, 1.0, 1.25)
+_FINE_SILENCES_MS = (250, 500, 1000, 2000)
+
+
+def length_score(lengths_sec: np.ndarray, target_min_sec: float, target_max_sec: float) -> float:
+    """Share of the sliced audio that lies in slices of the target length."""
+    total = float(lengths_sec.sum())
+    if total <= 0:
+        return 0.0
+    inside = (lengths_sec >= target_min_sec) & (lengths_sec <= target_max_sec)
+    return float(lengths_sec[inside].sum()) / total
+
+
+def tune_parameters(
+    rms_list: np.ndarray,
+    *,
+    sr: int,
+    total_samples: int,
+    hop_size: int,
+    target_min_sec: float,
+    target_max_sec: float,
+    is_cancelled=None,
+) -> dict | None:
+    """Search slicing parameters whose slice lengths best match a target range.
+
+    Works on an RMS envelope only: a coarse grid over threshold (taken from
+    percentiles of the envelope) and minimum interval is followed by a fine
+    grid around the best point over threshold, minimum length and kept
+    silence. Each step only reruns the tagging, so a file takes about a second.
+    Returns the parameters and their ``score`` (see ``length_score``), or None
+    when cancelled.
+    """
+    # Tagging only needs the length of the waveform, not its samples.
+    waveform = np.broadcast_to(np.float32(0), (total_samples,))
+    histogram = DbHistogram.from_rms(rms_list)
+    min_interval_floor = 4 * hop_size
+    target_min_ms = int(target_min_sec * 1000)
+    cache = {}
+
+    def evaluate(threshold_db: float, min_length: int, min_interval: int, max_silence: int) -> float:
+        min_interval = max(min_interval, min_interval_floor)
+        min_length = max(min_length, min_interval)
+        max_silence = max(max_silence, hop_size)
+        key = (round(threshold_db, 1), min_length, min_interval, max_silence)
+        if key not in cache:
+            slicer = Slicer(
+                sr=sr,
+                threshold=key[0],
+                min_length=min_length,
+                min_interval=min_interval,
+                hop_size=hop_size,
+                max_sil_kept=max_silence,
+            )
+            sil_tags, total_frames, _ = slicer.get_slice_tags(waveform, rms_list=rms_list)
+            # A file that is silent throughout has no ranges, which scores 0.
+            ranges = np.asarray(get_slice_ranges_ms(sil_tags, total_frames, slicer.hop_size, sr, total_samples),
+                                dtype=np.float64).reshape(-1, 2)
+            cache[key] = length_score((ranges[:, 1] - ranges[:, 0]) / 1000.0, target_min_sec, target_max_sec)
+        return cache[key]
+
+    best = None
+    best_score = -1.0
+    thresholds = sorted({round(float(np.clip(histogram.percentile(p) + 1.0, -80.0, -10.0)), 1)
+                         for p in _COARSE_PERCENTILES})
+    for threshold_db in thresholds:
+        for min_interval in _COARSE_INTERVALS_MS:
+            if is_cancelled and is_cancelled():
+                return None
+            score = evaluate(threshold_db, target_min_ms, min_interval, 1000)
+            if score > best_score:
+                best, best_score = (threshold_db, target_min_ms, min_interval, 1000), score
+    threshold_db, _, min_interval, _ = best
+    for step in _FINE_THRESHOLD_STEPS_DB:
+        for factor in _FINE_LENGTH_FACTORS:
+            if is_cancelled and is_cancelled():
+                return None
+            for max_silence in _FINE_SILENCES_MS:
+                candidate = (threshold_db + step, int(target_min_ms * factor), min_interval, max_silence)
+                score = evaluate(*candidate)
+                if score > best_score:
+                    best, best_score = candidate, score
+    threshold_db, min_length, min_interval, max_silence = best
+    min_interval = max(min_interval, min_interval_floor)
+    return {
+        "threshold_db": round(threshold_db, 1),
+        "min_length": max(min_length, min_interval),
+        "min_interval": min_interval,
+        "hop_size": hop_size,
+        "max_silence": max(max_silence, hop_size),
+        "dynamic_enabled": False,
+        "vad_enabled": False,
+        "score": best_score,
+    }
+
+
+def _analysis_slicer(sr: int, options: dict) -> Slicer:
+    # Same hop and window as slicing runs, so the envelope is shared through the cache.
+    hop_size = options["hop_size"]
+    return Slicer(
+        sr=sr,
+        threshold=options["threshold_db"],
+        min_length=max(options["min_length"], 4 * hop_size),
+        min_interval=4 * hop_size,
+        hop_size=hop_size,
+        max_sil_kept=max(options["max_silence"], hop_size),
+        fast_analysis=options.get("fast_analysis", False),
+    )
+
+
+def cached_envelope(filename: str, options: dict, cache_dir: str | None) -> tuple[np.ndarray, int, int] | None:
+    """Return ``(rms_list, sr, total_samples)`` from the analysis cache without decoding."""
+    if not cache_dir:
+        return None
+    try:
+        info = soundfile.info(filename)
+    except Exception:
+        return None
+    if info.frames <= 0:
+        return None
+    rms_list = AnalysisCache(cache_dir).load(filename, _analysis_slicer(info.samplerate, options))
+    if rms_list is None:
+        return None
+    return rms_list, info.samplerate, info.frames
+
+
+def decoded_envelope(
+    filename: str,
+    audio: np.ndarray,
+    sr: int,
+    options: dict,
+    cache_dir: str | None,
+) -> tuple[np.ndarray, int, int]:
+    """Compute (and cache) the envelope of decoded, channel-first audio."""
+    samples = audio.mean(axis=0) if audio.ndim > 1 else audio
+    slicer = _analysis_slicer(sr, options)
+    if cache_dir:
+        rms_list = AnalysisCache(cache_dir).rms_list(filename, slicer, samples)
+    else:
+        rms_list = slicer.get_rms_list(samples)
+    return rms_list, sr, samples.shape[0]
+
+
+def tune_file(
+    filename: str,
+    *,
+    options: dict,
+    target_min_sec: float,
+    target_max_sec: float,
+    language: str = "en",
+    cache_dir: str | None = None,
+) -> tuple[dict | None, str | None]:
+    """Tune the parameters of one file, decoding it only on a cache miss.
+
+    Returns ``(options, error)`` with the tuned values merged into a copy of
+    ``options``.
+    """
+    envelope = cached_envelope(filename, options, cache_dir)
+    if envelope is None:
+        fallback_mode = options["fallback_mode"]
+        if fallback_mode == "ask":
+            fallback_mode = "skip"
+        audio, sr, error = decode_audio(filename, fallback_mode=fallback_mode, language=language)
+        if audio is None:
+            return None, error or "Decode failed."
+        if audio.ndim > 1:
+            audio = audio.T
+        envelope = decoded_envelope(filename, audio, sr, options, cache_dir)
+    rms_list, sr, total_samples = envelope
+    tuned = tune_parameters(
+        rms_list,
+        sr=sr,
+        total_samples=total_samples,
+        hop_size=options["hop_size"],
+        target_min_sec=target_min_sec,
+        target_max_sec=target_max_sec,
+    )
+    merged = dict(options)
+    merged.update(tuned)
+    return merged, None
@@ -0,0 +1,31 @@
+import os
+
+import numpy as np
+
+from audio_slicer.utils.cache import AnalysisCache
+from audio_slicer.utils.slicer2 import Slicer
+
+
+def test_store_prunes_least_recently_used_entries(tmp_path):
+    slicer = Slicer(sr=16000, hop_size=10, min_interval=300)
+    rms_list = np.ones(1000, dtype=np.float32)
+    sources = []
+    for i in range(6):
+        source = tmp_path / f"source{i}.wav"
+        source.write_bytes(b"x" * (i + 1))
+        sources.append(str(source))
+    # Room for about four entries.
+    cache = AnalysisCache(str(tmp_path / "cache"), max_bytes=4 * 4200)
+    for i, source in enumerate(sources[:4]):
+        cache.store(source, slicer, rms_list)
+        os.utime(cache._entry_path(source, slicer), (i, i))
+    assert cache.load(sources[0], slicer) is not None
+    cache.store(sources[4], slicer, rms_list)
+    cache.store(sources[5], slicer, rms_list)
+
+    assert cache.load(sources[1], slicer) is None
+    for source in (sources[0], sources[4], sources[5]):
+        assert cache.load(source, slicer) is not None
+    sizes = [os.path.getsize(os.path.join(root, name))
+             for root, _, names in os.walk(tmp_path / "cache") for name in names]
+    assert sum(sizes) <= cache.max_bytes
@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import soundfile
+
+from audio_slicer.utils.incremental import SliceState
+from audio_slicer.utils.processing import process_audio_file
+
+SR = 16000
+
+
+def _write_source(path, seed=0):
+    # Eight one-second tones separated by one-second gaps of silence.
+    rng = np.random.default_rng(seed)
+    t = np.arange(SR) / SR
+    parts = []
+    for _ in range(8):
+        parts.append(0.3 * np.sin(2 * np.pi * rng.uniform(200, 400) * t))
+        parts.append(np.zeros(SR))
+    soundfile.write(path, np.concatenate(parts).astype(np.float32), SR)
+
+
+def _slice(source, out_dir, **kwargs):
+    return process_audio_file(
+        str(source),
+        output_ext="wav",
+        threshold_db=-40,
+        min_length=500,
+        min_interval=300,
+        hop_size=10,
+        max_silence=100,
+        dynamic_enabled=False,
+        dynamic_offset_db=0,
+        dynamic_window_sec=0,
+        vad_enabled=False,
+        vad_sensitivity_db=0,
+        vad_hangover_ms=0,
+        name_prefix="",
+        name_suffix="",
+        name_timestamp=False,
+        export_csv=False,
+        export_json=False,
+        output_dir=str(out_dir),
+        fallback_mode="skip",
+        language="en",
+        incremental=True,
+        **kwargs,
+    )
+
+
+def test_cancelled_rerun_keeps_unchanged_slices(tmp_path):
+    source = tmp_path / "source.wav"
+    out_dir = tmp_path / "out"
+    _write_source(source)
+    ok, _, _, records = _slice(source, out_dir)
+    assert ok and len(records) > 3
+    first = {record["output_path"]: os.path.getsize(record["output_path"]) for record in records}
+
+    polls = []
+
+    def is_cancelled():
+        # Let analysis and the first two slices through, then cancel.
+        polls.append(None)
+        return len(polls) > 4
+
+    ok, _, _, _ = _slice(source, out_dir, is_cancelled=is_cancelled)
+    assert not ok
+    assert not [name for name in os.listdir(out_dir) if name.endswith(".keep")]
+    for path, size in first.items():
+        assert os.path.getsize(path) == size
+
+    state = SliceState(str(out_dir), "source")
+    assert sorted(entry["path"] for entry in state.previous.values()) == sorted(first)
+    ok, _, _, records = _slice(source, out_dir)
+    assert ok and {record["output_path"] for record in records} == set(first)
@@ -0,0 +1,14 @@
+import numpy as np
+
+from audio_slicer.utils.slicer2 import get_rms
+from audio_slicer.utils.tuning import tune_parameters
+
+
+def test_all_silent_waveform_scores_zero():
+    sr = 16000
+    samples = np.zeros(sr * 20, dtype=np.float32)
+    rms_list = get_rms(samples, frame_length=640, hop_length=160)[0]
+    result = tune_parameters(rms_list, sr=sr, total_samples=samples.shape[0], hop_size=10,
+                             target_min_sec=2, target_max_sec=6)
+    assert result is not None
+    assert result["score"] == 0.0